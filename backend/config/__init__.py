@@ -5,21 +5,47 @@ from .database import (
     DatabaseConfig,
     get_connection,
     get_db_connection,
+    get_pool_stats,
+    db_pool,
     execute_query,
     execute_query_one,
     execute_query_dict,
     execute_insert,
     execute_update
 )
+from .async_database import (
+    init_async_pool,
+    close_async_pool,
+    get_async_pool_stats,
+    get_async_connection,
+    execute_query_async,
+    execute_query_one_async,
+    execute_query_dict_async,
+    execute_insert_async,
+    execute_update_async,
+    gather_queries
+)
 
 __all__ = [
     "settings",
     "DatabaseConfig",
     "get_connection",
     "get_db_connection", 
+    "get_pool_stats",
+    "db_pool",
     "execute_query",
     "execute_query_one",
     "execute_query_dict",
     "execute_insert",
-    "execute_update"
+    "execute_update",
+    "init_async_pool",
+    "close_async_pool",
+    "get_async_pool_stats",
+    "get_async_connection",
+    "execute_query_async",
+    "execute_query_one_async",
+    "execute_query_dict_async",
+    "execute_insert_async",
+    "execute_update_async",
+    "gather_queries"
 ]
\ No newline at end of file
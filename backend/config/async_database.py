@@ -0,0 +1,152 @@
+"""Async database access (aiomysql) for FastAPI routes"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Awaitable
+
+import aiomysql
+
+from .database import DatabaseConfig
+from .db_pool import PoolTimeoutError
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[aiomysql.Pool] = None
+_pool_lock = asyncio.Lock()
+
+
+async def init_async_pool() -> aiomysql.Pool:
+    """Create the shared aiomysql pool (no-op if it already exists)"""
+    global _pool
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await aiomysql.create_pool(
+                host=DatabaseConfig.HOST,
+                port=DatabaseConfig.PORT,
+                user=DatabaseConfig.USER,
+                password=DatabaseConfig.PASSWORD,
+                db=DatabaseConfig.DATABASE,
+                charset=DatabaseConfig.CHARSET,
+                connect_timeout=10,
+                autocommit=True,
+                minsize=1,
+                maxsize=settings.db_pool_size,
+                pool_recycle=settings.db_pool_max_lifetime,
+            )
+            logger.info(f"Async database pool created (maxsize={settings.db_pool_size})")
+    return _pool
+
+
+async def close_async_pool():
+    """Close the shared aiomysql pool"""
+    global _pool
+    async with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            await _pool.wait_closed()
+            _pool = None
+            logger.info("Async database pool closed")
+
+
+def get_async_pool_stats() -> Dict[str, Any]:
+    """Return statistics of the async pool"""
+    if _pool is None:
+        return {"initialized": False}
+    return {
+        "initialized": True,
+        "max_size": _pool.maxsize,
+        "size": _pool.size,
+        "idle": _pool.freesize,
+        "in_use": _pool.size - _pool.freesize,
+    }
+
+
+@asynccontextmanager
+async def get_async_connection():
+    """Async context manager that borrows a connection from the async pool"""
+    pool = _pool or await init_async_pool()
+    try:
+        connection = await asyncio.wait_for(pool.acquire(), timeout=settings.db_pool_timeout)
+    except asyncio.TimeoutError:
+        raise PoolTimeoutError(
+            f"No database connection available within {settings.db_pool_timeout:.1f}s"
+        )
+    try:
+        yield connection
+    except Exception as e:
+        logger.error(f"Database operation failed: {str(e)}")
+        try:
+            await connection.rollback()
+        except Exception:
+            connection.close()
+        raise
+    finally:
+        pool.release(connection)
+
+
+async def execute_query_async(query: str, params: Optional[List] = None) -> List[tuple]:
+    """Execute a query and return results"""
+    async with get_async_connection() as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(query, params or [])
+            return await cursor.fetchall()
+
+
+async def execute_query_one_async(query: str, params: Optional[List] = None) -> Optional[tuple]:
+    """Execute a query and return single result"""
+    async with get_async_connection() as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(query, params or [])
+            return await cursor.fetchone()
+
+
+async def execute_query_dict_async(query: str, params: Optional[List] = None) -> List[Dict[str, Any]]:
+    """Execute a query and return results as list of dictionaries"""
+    async with get_async_connection() as connection:
+        async with connection.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params or [])
+            return await cursor.fetchall()
+
+
+async def execute_insert_async(query: str, params: Optional[List] = None) -> int:
+    """Execute an insert query and return the last insert ID"""
+    async with get_async_connection() as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(query, params or [])
+            return cursor.lastrowid
+
+
+async def execute_update_async(query: str, params: Optional[List] = None) -> int:
+    """Execute an update/delete query and return affected rows"""
+    async with get_async_connection() as connection:
+        async with connection.cursor() as cursor:
+            await cursor.execute(query, params or [])
+            return cursor.rowcount
+
+
+async def gather_queries(*queries: Awaitable, concurrency: Optional[int] = None) -> List[Any]:
+    """Run independent queries concurrently and return their results in order.
+
+    Each awaitable (e.g. ``execute_query_one_async(...)``) borrows its own pooled
+    connection, so the total latency is that of the slowest query. Concurrency is
+    capped at half the pool by default so one request cannot starve the others.
+
+    Example:
+        total, by_type = await gather_queries(
+            execute_query_one_async("SELECT COUNT(*) FROM ais_info"),
+            execute_query_async("SELECT vsslTp, COUNT(*) FROM ais_info GROUP BY vsslTp"),
+        )
+    """
+    limit = concurrency or max(1, settings.db_pool_size // 2)
+    if len(queries) <= limit:
+        return list(await asyncio.gather(*queries))
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(query: Awaitable):
+        async with semaphore:
+            return await query
+
+    return list(await asyncio.gather(*(_run(q) for q in queries)))
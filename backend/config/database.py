@@ -5,6 +5,7 @@ import logging
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 from .settings import settings
+from .db_pool import ConnectionPool, is_connection_error
 
 logger = logging.getLogger(__name__)
 
@@ -34,21 +35,42 @@ def get_connection():
         logger.error(f"Database connection failed: {str(e)}")
         raise
 
+# Shared pool used by the execute_* helpers and services.database.DatabaseService
+db_pool = ConnectionPool(
+    get_connection,
+    max_size=settings.db_pool_size,
+    timeout=settings.db_pool_timeout,
+    max_lifetime=settings.db_pool_max_lifetime,
+    idle_timeout=settings.db_pool_idle_timeout,
+    ping_interval=settings.db_pool_ping_interval,
+)
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Return statistics of the shared connection pool"""
+    return db_pool.get_stats()
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections"""
+    """Context manager that borrows a connection from the shared pool"""
     connection = None
+    discard = False
     try:
-        connection = get_connection()
+        connection = db_pool.acquire()
         yield connection
     except Exception as e:
         logger.error(f"Database operation failed: {str(e)}")
         if connection:
-            connection.rollback()
+            if is_connection_error(e):
+                discard = True
+            else:
+                try:
+                    connection.rollback()
+                except Exception:
+                    discard = True
         raise
     finally:
         if connection:
-            connection.close()
+            db_pool.release(connection, discard=discard)
 
 def execute_query(query: str, params: Optional[List] = None) -> List[tuple]:
     """Execute a query and return results"""
@@ -0,0 +1,220 @@
+"""Thread-safe MySQL connection pool"""
+
+import time
+import threading
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, Any
+
+import pymysql
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection became available in time"""
+
+
+class _PooledConnection:
+    """Connection plus the bookkeeping the pool needs"""
+
+    __slots__ = ("connection", "created_at", "last_used")
+
+    def __init__(self, connection):
+        now = time.monotonic()
+        self.connection = connection
+        self.created_at = now
+        self.last_used = now
+
+
+class ConnectionPool:
+    """Bounded pool of pymysql connections.
+
+    - At most ``max_size`` connections exist at once; borrowers wait up to
+      ``timeout`` seconds and then get ``PoolTimeoutError``.
+    - Connections older than ``max_lifetime`` seconds are closed instead of reused.
+    - Idle connections unused for ``idle_timeout`` seconds are evicted.
+    - Connections idle longer than ``ping_interval`` seconds are pinged on borrow.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], Any],
+        max_size: int = 10,
+        timeout: float = 10.0,
+        max_lifetime: float = 1800.0,
+        idle_timeout: float = 300.0,
+        ping_interval: float = 30.0,
+    ):
+        self._factory = connection_factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0  # idle + in use + being created
+
+        # statistics
+        self._created = 0
+        self._closed = 0
+        self._borrows = 0
+        self._timeouts = 0
+        self._ping_failures = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    # ------------------------------------------------------------------ borrow
+
+    def acquire(self, timeout: float = None):
+        """Borrow a healthy connection from the pool"""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            entry = None
+            create = False
+            with self._cond:
+                while True:
+                    self._evict_idle_locked()
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No database connection available within {timeout:.1f}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+
+            if create:
+                try:
+                    entry = _PooledConnection(self._factory())
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created += 1
+            elif not self._is_healthy(entry):
+                self._discard(entry)
+                continue
+
+            wait = time.monotonic() - started
+            with self._cond:
+                self._in_use[id(entry.connection)] = entry
+                self._borrows += 1
+                self._total_wait += wait
+                if wait > self._max_wait:
+                    self._max_wait = wait
+            return entry.connection
+
+    def release(self, connection, discard: bool = False):
+        """Return a borrowed connection; broken or expired ones are closed"""
+        with self._cond:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            # not ours (or already released) - just close it
+            self._close_quietly(connection)
+            return
+
+        now = time.monotonic()
+        if discard or not connection.open or now - entry.created_at > self.max_lifetime:
+            self._discard(entry)
+            return
+
+        entry.last_used = now
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    # ------------------------------------------------------------------ health
+
+    def _is_healthy(self, entry: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime:
+            return False
+        if now - entry.last_used < self.ping_interval:
+            return True
+        try:
+            entry.connection.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection failed ping, discarding: {str(e)}")
+            with self._cond:
+                self._ping_failures += 1
+            return False
+
+    def _evict_idle_locked(self):
+        """Close connections idle past idle_timeout (caller holds the lock)"""
+        now = time.monotonic()
+        # the deque is ordered by last use, oldest on the left
+        while self._idle and now - self._idle[0].last_used > self.idle_timeout:
+            entry = self._idle.popleft()
+            self._size -= 1
+            self._closed += 1
+            self._close_quietly(entry.connection)
+
+    def _discard(self, entry: _PooledConnection):
+        self._close_quietly(entry.connection)
+        with self._cond:
+            self._size -= 1
+            self._closed += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------ admin
+
+    def close_all(self):
+        """Close every idle connection (in-use ones are closed on release)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._closed += len(idle)
+        for entry in idle:
+            self._close_quietly(entry.connection)
+        # anything still borrowed will exceed its lifetime and be dropped on release
+        with self._cond:
+            for entry in self._in_use.values():
+                entry.created_at = float("-inf")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage"""
+        with self._cond:
+            borrows = self._borrows
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "borrows": borrows,
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "closed": self._closed,
+                "ping_failures": self._ping_failures,
+                "avg_wait_ms": round(self._total_wait / borrows * 1000, 3) if borrows else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Whether an error means the connection itself can no longer be trusted"""
+    return isinstance(error, (pymysql.err.OperationalError, pymysql.err.InterfaceError))
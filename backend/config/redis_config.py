@@ -1,7 +1,7 @@
 """Redis 설정 모듈"""
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 import os
 
 
@@ -33,9 +33,48 @@ class RedisSettings(BaseSettings):
     # 통계 데이터 (일 단위 변경)
     CACHE_TTL_VERY_LONG: int = 86400    # 24시간 (86,400초)
     
+    # ==================== 캐시 스탬피드 방지 ====================
+    # 만료 후 이전 값을 제공하며 백그라운드 갱신하는 시간 (stale-while-revalidate)
+    CACHE_STALE_TTL: int = 300          # 5분
+    
+    # 만료 직전 확률적 조기 갱신 강도 (0이면 사용 안 함, 클수록 일찍 갱신)
+    CACHE_EARLY_REFRESH_BETA: float = 1.0
+    
+    # 캐시 계산 락 유지 시간 / 다른 워커의 계산 결과 대기 시간 (초)
+    CACHE_LOCK_TIMEOUT: int = 30
+    CACHE_LOCK_WAIT: float = 10.0
+    
+    # ==================== 프로세스 내 L1 캐시 ====================
+    # Redis(L2) 앞단의 워커별 메모리 캐시. Redis 미사용 시에는 단독 캐시로 동작
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_ENTRIES: int = 1024
+    CACHE_L1_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB (직렬화 길이 기준)
+    CACHE_L1_TTL: int = 30              # Redis 사용 시 L1 최대 유지 시간(초)
+    
+    # ==================== 응답 캐싱 (response=True) ====================
+    # 직렬화된 응답 바이트 압축 방식: 'gzip', 'zstd'(zstandard 설치 시), 'none'
+    CACHE_RESPONSE_COMPRESSION: str = "gzip"
+    CACHE_RESPONSE_COMPRESS_MIN_BYTES: int = 1024  # 이 크기 이상만 압축
+    
+    # ==================== 캐시 예열 ====================
+    CACHE_WARM_ENABLED: bool = True
+    CACHE_WARM_CONCURRENCY: int = 4     # 동시에 계산할 캐시 키 수
+    CACHE_WARM_INTERVAL: int = 240      # 주기적 예열 간격(초). 남은 유효 시간이 이보다 짧은 키를 갱신
+    CACHE_WARM_DEBOUNCE: float = 2.0    # 무효화 이벤트 후 예열까지 대기(초, 연속 이벤트 병합)
+    CACHE_WARM_PERIODS: List[str] = ["daily", "weekly", "monthly"]  # period 파라미터 예열 값
+    
+    # ==================== 캐시 메트릭 ====================
+    # 요청별 캐시 로그(HIT/MISS/저장)는 DEBUG 레벨에서 이 비율만큼만 기록 (메트릭은 항상 수집)
+    CACHE_LOG_SAMPLE_RATE: float = 0.01
+    
     # ==================== 캐시 네임스페이스 ====================
     CACHE_PREFIX: str = "port_dashboard"
     
+    # ==================== 캐시 무효화 이벤트 ====================
+    # db/cache_invalidation.py 가 새 검사 결과 저장 시 이 채널로 이벤트를 발행
+    CACHE_INVALIDATION_CHANNEL: str = "port_dashboard:cache_invalidation"
+    CACHE_INVALIDATION_ENABLED: bool = True
+    
     # ==================== 설정 로드 ====================
     class Config:
         env_file = ".env"
@@ -14,8 +14,18 @@ class Settings:
     db_name: str = "port_database"
     db_charset: str = "utf8mb4"
     
+    # Connection pool settings
+    db_pool_size: int = 10
+    db_pool_timeout: float = 10.0         # 커넥션 대기 최대 시간 (초)
+    db_pool_max_lifetime: int = 1800      # 커넥션 최대 수명 (초)
+    db_pool_idle_timeout: int = 300       # 유휴 커넥션 정리 기준 (초)
+    db_pool_ping_interval: int = 30       # 이 시간 이상 유휴였던 커넥션은 대여 시 ping
+    
     # AIS Database settings
     ais_db_path: str = "../ais_database.db"
+    ais_stream_batch_size: int = 1000     # 스트리밍 응답(services.ais_stream) 한 청크의 행 수
+    ais_page_size: int = 1000             # AIS 목록 커서 페이지네이션 기본 페이지 크기
+    ais_spatial_refresh_seconds: float = 10.0  # 최신 위치 격자 인덱스(services.ais_positions) 갱신 주기
     
     # API settings
     api_title: str = "Port Dashboard API"
@@ -33,6 +43,15 @@ class Settings:
     log_level: str = "INFO"
     log_dir: str = "logs"
     
+    # Batched DB log writer settings (services.log_writer)
+    log_queue_size: int = 10000           # 큐 최대 행 수 (초과 시 버림)
+    log_batch_size: int = 200             # multi-row INSERT 한 번에 기록할 최대 행 수
+    log_flush_interval_ms: int = 500      # 최대 기록 간격 (밀리초)
+    api_log_enabled: bool = True          # API 호출 로그 (api_call_info) 기록 여부
+    api_log_exclude_paths: list = ["/metrics", "/health", "/docs", "/redoc", "/openapi.json"]
+    page_visit_batch_max: int = 500       # /ui/log/page-visits:batch 한 요청당 최대 방문 수
+    page_visit_max_delay_minutes: int = 60  # 클라이언트 visited_at 허용 범위 (수신 시각 기준 과거 N분)
+    
     # AIPC Client settings
     aipc_root: str = "/home/cotlab/AIPC_Client"
     aipc_project: str = "/home/cotlab/AIPC_Client/project_files"
@@ -46,8 +65,22 @@ class Settings:
         self.db_user = os.getenv("DB_USER", self.db_user)
         self.db_password = os.getenv("DB_PASSWORD", self.db_password)
         self.db_name = os.getenv("DB_NAME", self.db_name)
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", self.db_pool_size))
+        self.db_pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", self.db_pool_timeout))
+        self.db_pool_max_lifetime = int(os.getenv("DB_POOL_MAX_LIFETIME", self.db_pool_max_lifetime))
+        self.db_pool_idle_timeout = int(os.getenv("DB_POOL_IDLE_TIMEOUT", self.db_pool_idle_timeout))
+        self.db_pool_ping_interval = int(os.getenv("DB_POOL_PING_INTERVAL", self.db_pool_ping_interval))
         self.port = int(os.getenv("PORT", self.port))
         self.log_level = os.getenv("LOG_LEVEL", self.log_level)
+        self.log_queue_size = int(os.getenv("LOG_QUEUE_SIZE", self.log_queue_size))
+        self.log_batch_size = int(os.getenv("LOG_BATCH_SIZE", self.log_batch_size))
+        self.log_flush_interval_ms = int(os.getenv("LOG_FLUSH_INTERVAL_MS", self.log_flush_interval_ms))
+        self.api_log_enabled = os.getenv("API_LOG_ENABLED", str(self.api_log_enabled)).lower() == "true"
+        self.page_visit_batch_max = int(os.getenv("PAGE_VISIT_BATCH_MAX", self.page_visit_batch_max))
+        self.page_visit_max_delay_minutes = int(os.getenv("PAGE_VISIT_MAX_DELAY_MINUTES", self.page_visit_max_delay_minutes))
+        self.ais_stream_batch_size = int(os.getenv("AIS_STREAM_BATCH_SIZE", self.ais_stream_batch_size))
+        self.ais_page_size = int(os.getenv("AIS_PAGE_SIZE", self.ais_page_size))
+        self.ais_spatial_refresh_seconds = float(os.getenv("AIS_SPATIAL_REFRESH_SECONDS", self.ais_spatial_refresh_seconds))
 
 # Global settings instance
 settings = Settings()
@@ -6,14 +6,13 @@ from pydantic import BaseModel
 from datetime import datetime
 import sys
 import os
-import time
-import json
 
 # 상위 디렉토리의 db 폴더를 Python 경로에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'db'))
 
 from ais_service import AISService, AISInfo
 from ui_data_service import UIDataService
+from services.log_writer import start_log_writers, stop_log_writers, ApiCallLogMiddleware
 
 # Pydantic 모델들
 class PageVisitRequest(BaseModel):
@@ -53,56 +52,18 @@ async def startup_event():
     
     if not ui_service.connect():
         print("경고: UI 데이터베이스 연결에 실패했습니다. UI 로그가 저장되지 않습니다.")
+    
+    await start_log_writers()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 데이터베이스 연결 해제"""
+    await stop_log_writers()
     ais_service.disconnect()
     ui_service.disconnect()
 
-# 미들웨어: API 호출 로그 자동 저장
-@app.middleware("http")
-async def log_api_calls(request: Request, call_next):
-    start_time = time.time()
-    
-    # 요청 처리
-    response = await call_next(request)
-    
-    # 응답 시간 계산
-    response_time_ms = int((time.time() - start_time) * 1000)
-    
-    # API 호출 로그 저장
-    try:
-        # 사용자 ID 추출 (헤더에서 또는 기본값)
-        user_id = request.headers.get("X-User-ID", "anonymous")
-        
-        # 요청 데이터 추출
-        request_data = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if body:
-                    request_data = json.loads(body.decode())
-            except:
-                pass
-        
-        # UI 데이터베이스에 로그 저장
-        ui_service.log_api_call(
-            user_id=user_id,
-            api_endpoint=str(request.url.path),
-            http_method=request.method,
-            request_data=request_data,
-            response_status=response.status_code,
-            response_time_ms=response_time_ms,
-            session_id=request.headers.get("X-Session-ID"),
-            ip_address=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent"),
-            error_message=None if response.status_code < 400 else f"HTTP {response.status_code}"
-        )
-    except Exception as e:
-        print(f"API 호출 로그 저장 실패: {e}")
-    
-    return response
+# 미들웨어: API 호출 로그 자동 저장 (큐에 넣고 백그라운드에서 배치 기록)
+app.add_middleware(ApiCallLogMiddleware)
 
 # Pydantic 모델들
 class AISInfoResponse(BaseModel):
@@ -6,7 +6,7 @@ from contextlib import asynccontextmanager
 import uvicorn
 
 # Import configuration and utilities
-from config import settings
+from config import settings, init_async_pool, close_async_pool
 from utils import setup_logging, get_logger
 
 # Import routers
@@ -20,11 +20,17 @@ from routers import (
     dashboard_routes,
     ui_routes,
     match_routes,
-    vssl_spec_routes
+    vssl_spec_routes,
+    quality_routes,
+    metrics_routes
 )
 
 # Import Redis cache system
 from services.cache.redis_manager import redis_manager
+from services.cache.invalidation import cache_invalidation_subscriber
+from services.cache.cache_warmer import cache_warmer
+from services.cache.response_cache import CacheRequestMiddleware
+from services.log_writer import start_log_writers, stop_log_writers, ApiCallLogMiddleware
 from config.redis_config import redis_settings
 
 # Setup logging
@@ -36,14 +42,25 @@ async def lifespan(app: FastAPI):
     """
     애플리케이션 생명주기 관리
     
-    Startup: Redis 캐시 서버 연결
-    Shutdown: Redis 연결 해제
+    Startup: 비동기 DB 커넥션 풀 생성, API 호출 로그 기록기 시작, Redis 캐시 서버 연결
+    Shutdown: Redis 연결 해제, 남은 API 호출 로그 기록, DB 커넥션 풀 종료
     """
     # ==================== Startup ====================
     logger.info("=" * 60)
     logger.info("🚀 Port Dashboard API 시작 중...")
     logger.info("=" * 60)
     
+    # 비동기 DB 커넥션 풀 생성
+    try:
+        await init_async_pool()
+        logger.info("✅ 비동기 DB 커넥션 풀 생성 완료")
+    except Exception as e:
+        logger.error(f"❌ DB 커넥션 풀 생성 실패: {e}")
+        logger.warning("⚠️ 첫 요청 시 커넥션 풀 생성을 재시도합니다")
+    
+    # API 호출 / 페이지 방문 로그 배치 기록 (요청 처리 중에는 큐에만 넣음)
+    await start_log_writers()
+    
     # Redis 캐시 서버 연결
     if settings.redis_enabled:
         logger.info("🔴 Redis 캐시 서버 연결 중...")
@@ -63,6 +80,10 @@ async def lifespan(app: FastAPI):
                 redis_info = await redis_manager.get_info()
                 logger.info(f"   - Redis 버전: {redis_info.get('version', 'N/A')}")
                 logger.info(f"   - 사용 메모리: {redis_info.get('used_memory', 'N/A')}")
+                
+                # 새 검사 결과 저장 시 발행되는 캐시 무효화 이벤트 구독
+                if redis_settings.CACHE_INVALIDATION_ENABLED:
+                    await cache_invalidation_subscriber.start()
             else:
                 logger.warning("⚠️ Redis 연결 실패 - 캐싱 비활성화 상태로 계속 실행")
                 
@@ -72,6 +93,12 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("ℹ️ Redis 캐싱이 비활성화되어 있습니다 (settings.redis_enabled=False)")
     
+    # 캐시 예열: 시작 시(백그라운드), 주기적으로, 무효화 이벤트 수신 후
+    if redis_settings.CACHE_WARM_ENABLED:
+        cache_warmer.start_background(reason="startup")
+        cache_warmer.start_schedule()
+        cache_invalidation_subscriber.add_listener(cache_warmer.schedule_namespace)
+    
     logger.info("=" * 60)
     logger.info("✅ 서버 시작 완료!")
     logger.info(f"📍 API 문서: http://{settings.host}:{settings.port}/docs")
@@ -84,12 +111,22 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Port Dashboard API 종료 중...")
     logger.info("=" * 60)
     
+    # 캐시 예열 중지
+    await cache_warmer.stop()
+    
     # Redis 연결 해제
     if settings.redis_enabled:
+        await cache_invalidation_subscriber.stop()
         logger.info("🔴 Redis 연결 해제 중...")
         await redis_manager.disconnect()
         logger.info("✅ Redis 연결 해제 완료")
     
+    # 남은 API 호출 / 페이지 방문 로그 기록 (커넥션 풀 종료 전)
+    await stop_log_writers()
+    
+    # 비동기 DB 커넥션 풀 종료
+    await close_async_pool()
+    
     logger.info("=" * 60)
     logger.info("✅ 서버 종료 완료")
     logger.info("=" * 60)
@@ -112,6 +149,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 캐시된 압축 응답의 Content-Encoding 협상용
+app.add_middleware(CacheRequestMiddleware)
+
+# API 호출 로그 (api_call_info, 비동기 배치 기록)
+app.add_middleware(ApiCallLogMiddleware)
+
 # Include routers with proper prefixes
 app.include_router(common_routes.router, tags=["Common"])
 app.include_router(ui_routes.router, prefix="/ui", tags=["UI"])
@@ -130,6 +173,10 @@ app.include_router(qc_routes.router, prefix="/api/dashboard", tags=["QC"])
 app.include_router(yt_routes.router, prefix="/api/dashboard", tags=["YT"])
 app.include_router(match_routes.router, prefix="/api/dashboard", tags=["Match"])
 app.include_router(vssl_spec_routes.router, prefix="/api/dashboard", tags=["VsslSpec"])
+app.include_router(quality_routes.router, prefix="/api/dashboard", tags=["Quality"])
+
+# Cache metrics (admin JSON + Prometheus scrape)
+app.include_router(metrics_routes.router, tags=["Metrics"])
 
 # Cache management routes (admin)
 from routers import cache_routes
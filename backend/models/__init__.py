@@ -20,6 +20,7 @@ from .schemas import (
     
     # UI 로그 관련 모델들
     PageVisitRequest,
+    PageVisitBatchRequest,
     PageVisitLog,
     UIStatisticsResponse,
     APICallLog,
@@ -67,6 +68,7 @@ __all__ = [
     
     # UI 로그 관련
     "PageVisitRequest",
+    "PageVisitBatchRequest",
     "PageVisitLog",
     "UIStatisticsResponse",
     "APICallLog",
@@ -129,6 +129,11 @@ class PageVisitRequest(BaseModel):
     visit_duration: Optional[int] = None
     session_id: Optional[str] = None
     referrer: Optional[str] = None
+    visited_at: Optional[datetime] = None  # 클라이언트 방문 시각 (배치 전송 시), 없으면 수신 시각
+
+class PageVisitBatchRequest(BaseModel):
+    """페이지 방문 일괄 요청 모델"""
+    visits: List[PageVisitRequest]
 
 class PageVisitLog(BaseModel):
     """페이지 방문 로그 모델"""
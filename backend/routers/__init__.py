@@ -11,6 +11,8 @@ from . import (
     ui_routes,
     match_routes,
     vssl_spec_routes,
+    quality_routes,
+    metrics_routes,
     cache_routes
 )
 
@@ -25,5 +27,7 @@ __all__ = [
     "ui_routes",
     "match_routes",
     "vssl_spec_routes",
+    "quality_routes",
+    "metrics_routes",
     "cache_routes"
 ]
\ No newline at end of file
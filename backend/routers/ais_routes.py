@@ -1,7 +1,8 @@
 """AIS (Automatic Identification System) routes"""
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict, Any
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 
 # Import models from centralized schemas
@@ -17,20 +18,35 @@ from models import (
 from utils import (
     get_current_timestamp,
     calculate_pass_rate,
-    get_sql_date_condition,
-    get_sql_group_by,
     validate_period,
     create_response_data,
     create_error_response,
     safe_float,
-    safe_int
+    safe_int,
+    decode_id_cursor,
+    validate_bbox
 )
 
 # Import database utilities
-from config import execute_query, execute_query_one
+from config import execute_query_async, execute_query_one_async, gather_queries
 
 # Import services
 from services import ais_service
+from services.data_sources import DataSource
+from services.quality_engine import get_quality_engine
+from services.ais_stream import (
+    StreamFormat,
+    stream_ais_rows,
+    list_ais_rows,
+    parse_fields
+)
+from services.ais_positions import (
+    MAP_FIELDS,
+    load_latest_positions,
+    latest_position_index,
+    query_history_bbox,
+    query_history_near
+)
 
 # Import Redis cache system
 from services.cache.cache_decorator import cached
@@ -39,11 +55,51 @@ from config.redis_config import redis_settings
 
 router = APIRouter()
 
+STREAM_QUERY = Query(default=None, description="스트리밍 모드: ndjson | json (배치 단위 전송, 캐시 미사용)")
+FIELDS_QUERY = Query(default=None, description="응답 필드 (쉼표 구분, 예: mmsiNo,lat,lon,sog,cog)")
+CURSOR_QUERY = Query(default=None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 이전 응답의 next_cursor)")
+LIMIT_QUERY = Query(default=None, ge=1, description="최대 행 수 (cursor 사용 시 페이지 크기)")
+LATEST_LIMIT_QUERY = Query(default=100, ge=1, le=10000, description="최대 선박 수 (최신 수신순)")
+
+async def _ais_list_response(where: str, params: tuple, limit: Optional[int], stream: Optional[str],
+                             fields: Optional[str], cursor: Optional[str], error_message: str):
+    """stream / fields / cursor 지정 시 목록 응답 (잘못된 fields, cursor 는 400)"""
+    try:
+        columns = parse_fields(fields)
+        after = decode_id_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        if stream:
+            return await stream_ais_rows(stream, where, params, limit, columns, after)
+        return await list_ais_rows(where, params, limit, columns, after, paged=cursor is not None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{error_message}: {str(e)}")
+
 @router.get("/all", response_model=List[AISInfoResponse])
-async def get_all_ais_data(limit: Optional[int] = None):
-    """모든 AIS 데이터 조회"""
+async def get_all_ais_data(
+    limit: Optional[int] = None,
+    stream: Optional[StreamFormat] = STREAM_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY
+):
+    """모든 AIS 데이터 조회 (응답 캐싱 적용: 30분, stream/fields/cursor 지정 시 캐시 미사용)"""
+    if stream or fields or cursor is not None:
+        return await _ais_list_response("", (), limit, stream, fields, cursor, "AIS 데이터 조회 실패")
+    return await _get_all_ais_data_cached(limit)
+
+@cached(
+    namespace=CacheNamespace.AIS,
+    endpoint=CacheEndpoint.ALL,
+    ttl=redis_settings.CACHE_TTL_MEDIUM,  # 30분 캐싱
+    key_params=['limit'],
+    response=True  # 직렬화/압축된 응답 바이트 캐싱
+)
+async def _get_all_ais_data_cached(limit: Optional[int] = None):
+    """모든 AIS 데이터 조회 (응답 캐싱 적용: 30분)"""
     try:
-        data = ais_service.load_all_data(limit)
+        data = await run_in_threadpool(ais_service.load_all_data, limit)
         
         # Convert to response model
         ais_list = []
@@ -59,10 +115,19 @@ async def get_all_ais_data(limit: Optional[int] = None):
         )
 
 @router.get("/mmsi/{mmsi}", response_model=List[AISInfoResponse])
-async def get_ships_by_mmsi(mmsi: str):
+async def get_ships_by_mmsi(
+    mmsi: str,
+    limit: Optional[int] = LIMIT_QUERY,
+    stream: Optional[StreamFormat] = STREAM_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY
+):
     """MMSI로 선박 검색"""
+    if limit or stream or fields or cursor is not None:
+        return await _ais_list_response("mmsiNo = ?", (mmsi,), limit, stream, fields, cursor, "MMSI 검색 실패")
+    
     try:
-        data = ais_service.load_by_mmsi(mmsi)
+        data = await run_in_threadpool(ais_service.load_by_mmsi, mmsi)
         
         ais_list = []
         for item in data:
@@ -77,10 +142,19 @@ async def get_ships_by_mmsi(mmsi: str):
         )
 
 @router.get("/name/{name}", response_model=List[AISInfoResponse])
-async def get_ships_by_name(name: str):
+async def get_ships_by_name(
+    name: str,
+    limit: Optional[int] = LIMIT_QUERY,
+    stream: Optional[StreamFormat] = STREAM_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY
+):
     """선박명으로 검색"""
+    if limit or stream or fields or cursor is not None:
+        return await _ais_list_response("vsslNm LIKE ?", (f"%{name}%",), limit, stream, fields, cursor, "선박명 검색 실패")
+    
     try:
-        data = ais_service.load_by_ship_name(name)
+        data = await run_in_threadpool(ais_service.load_by_ship_name, name)
         
         ais_list = []
         for item in data:
@@ -95,10 +169,19 @@ async def get_ships_by_name(name: str):
         )
 
 @router.get("/flag/{flag}", response_model=List[AISInfoResponse])
-async def get_ships_by_flag(flag: str):
+async def get_ships_by_flag(
+    flag: str,
+    limit: Optional[int] = LIMIT_QUERY,
+    stream: Optional[StreamFormat] = STREAM_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY
+):
     """국적별 선박 검색"""
+    if limit or stream or fields or cursor is not None:
+        return await _ais_list_response("flag = ?", (flag,), limit, stream, fields, cursor, "국적별 검색 실패")
+    
     try:
-        data = ais_service.load_by_flag(flag)
+        data = await run_in_threadpool(ais_service.load_by_flag, flag)
         
         ais_list = []
         for item in data:
@@ -113,10 +196,19 @@ async def get_ships_by_flag(flag: str):
         )
 
 @router.get("/type/{ship_type}", response_model=List[AISInfoResponse])
-async def get_ships_by_type(ship_type: str):
+async def get_ships_by_type(
+    ship_type: str,
+    limit: Optional[int] = LIMIT_QUERY,
+    stream: Optional[StreamFormat] = STREAM_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY
+):
     """선박 타입별 필터링"""
+    if limit or stream or fields or cursor is not None:
+        return await _ais_list_response("vsslTp = ?", (ship_type,), limit, stream, fields, cursor, "선박 타입별 필터링 실패")
+    
     try:
-        data = ais_service.filter_by_ship_type(ship_type)
+        data = await run_in_threadpool(ais_service.filter_by_ship_type, ship_type)
         
         ais_list = []
         for item in data:
@@ -131,63 +223,134 @@ async def get_ships_by_type(ship_type: str):
         )
 
 @router.get("/latest", response_model=List[AISInfoResponse])
-async def get_latest_data():
-    """최신 데이터 조회"""
+async def get_latest_data(limit: int = LATEST_LIMIT_QUERY):
+    """선박별 최신 위치 조회 (선박당 1건, 최신 수신순)"""
     try:
-        # 최신 100개 데이터 조회
-        data = ais_service.load_all_data(100)
+        return await load_latest_positions(list(AISInfoResponse.model_fields), limit=limit)
         
-        ais_list = []
-        for item in data:
-            ais_list.append(AISInfoResponse(**item))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"최신 데이터 조회 실패: {str(e)}"
+        )
+
+@router.get("/live-map")
+async def get_live_map(
+    since: Optional[str] = Query(default=None, pattern=r"^\d{14}$",
+                                 description="이 시각(dt_pos_utc, YYYYMMDDHHMMSS, 포함) 이후 위치가 바뀐 선박만")
+):
+    """실시간 지도용 선박 위치 (선박별 최신 위치, 지도 필드만)"""
+    try:
+        positions = await load_latest_positions(MAP_FIELDS, since=since)
         
-        return ais_list
+        return {
+            **create_response_data(positions),
+            # 다음 요청의 since 로 사용 (변경 없으면 요청 값 유지)
+            "last_dt_pos_utc": positions[0]["dt_pos_utc"] if positions else since
+        }
         
     except Exception as e:
         raise HTTPException(
             status_code=500, 
-            detail=f"최신 데이터 조회 실패: {str(e)}"
+            detail=f"실시간 지도 데이터 조회 실패: {str(e)}"
+        )
+
+SPATIAL_SCOPE_QUERY = Query(default="latest", description="latest: 선박별 최신 위치 (메모리 격자 인덱스) | history: ais_info 이력")
+SPATIAL_SINCE_QUERY = Query(default=None, pattern=r"^\d{14}$", description="history 범위 시작 시각 (dt_pos_utc, YYYYMMDDHHMMSS)")
+SPATIAL_LIMIT_QUERY = Query(default=1000, ge=1, le=10000, description="최대 행 수")
+
+@router.get("/bbox")
+async def get_ships_in_bbox(
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    scope: Literal["latest", "history"] = SPATIAL_SCOPE_QUERY,
+    since: Optional[str] = SPATIAL_SINCE_QUERY,
+    limit: int = SPATIAL_LIMIT_QUERY
+):
+    """영역(bbox) 안의 선박 조회 (min_lon > max_lon 이면 날짜변경선을 넘는 영역)"""
+    try:
+        validate_bbox(min_lat, min_lon, max_lat, max_lon)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        if scope == "history":
+            positions = await query_history_bbox(min_lat, min_lon, max_lat, max_lon, since=since, limit=limit)
+        else:
+            positions = await latest_position_index.query_bbox(min_lat, min_lon, max_lat, max_lon, limit=limit)
+        
+        return create_response_data(positions)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"영역 내 선박 조회 실패: {str(e)}"
+        )
+
+@router.get("/near")
+async def get_ships_near(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_nm: float = Query(..., gt=0, le=3000, description="반경 (해리)"),
+    scope: Literal["latest", "history"] = SPATIAL_SCOPE_QUERY,
+    since: Optional[str] = SPATIAL_SINCE_QUERY,
+    limit: int = SPATIAL_LIMIT_QUERY
+):
+    """지점(선석 등) 반경 안의 선박 조회 (가까운 순, distance_nm 포함)"""
+    try:
+        if scope == "history":
+            positions = await query_history_near(lat, lon, radius_nm, since=since, limit=limit)
+        else:
+            positions = await latest_position_index.query_near(lat, lon, radius_nm, limit=limit)
+        
+        return create_response_data(positions)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"반경 내 선박 조회 실패: {str(e)}"
         )
 
 @router.get("/statistics", response_model=StatisticsResponse)
 async def get_statistics():
     """통계 데이터 조회"""
     try:
-        # MySQL에서 통계 조회
-        total_ships_result = execute_query_one("SELECT COUNT(*) FROM ais_info")
+        # MySQL에서 통계 조회 (독립 쿼리 동시 실행)
+        total_ships_result, ship_types_result, flags_result, nav_status_result = await gather_queries(
+            execute_query_one_async("SELECT COUNT(*) FROM ais_info"),
+            # 선박 타입별 분포
+            execute_query_async("""
+                SELECT vsslTp, COUNT(*) as count 
+                FROM ais_info 
+                WHERE vsslTp IS NOT NULL 
+                GROUP BY vsslTp 
+                ORDER BY count DESC 
+                LIMIT 10
+            """),
+            # 국적별 분포
+            execute_query_async("""
+                SELECT flag, COUNT(*) as count 
+                FROM ais_info 
+                WHERE flag IS NOT NULL 
+                GROUP BY flag 
+                ORDER BY count DESC 
+                LIMIT 10
+            """),
+            # 항해 상태별 분포
+            execute_query_async("""
+                SELECT vsslNavi, COUNT(*) as count 
+                FROM ais_info 
+                WHERE vsslNavi IS NOT NULL 
+                GROUP BY vsslNavi 
+                ORDER BY count DESC 
+                LIMIT 10
+            """)
+        )
         total_ships = total_ships_result[0] if total_ships_result else 0
-        
-        # 선박 타입별 분포
-        ship_types_result = execute_query("""
-            SELECT vsslTp, COUNT(*) as count 
-            FROM ais_info 
-            WHERE vsslTp IS NOT NULL 
-            GROUP BY vsslTp 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
         ship_types = [{"name": row[0], "count": row[1]} for row in ship_types_result] if ship_types_result else []
-        
-        # 국적별 분포
-        flags_result = execute_query("""
-            SELECT flag, COUNT(*) as count 
-            FROM ais_info 
-            WHERE flag IS NOT NULL 
-            GROUP BY flag 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
         flags = [{"name": row[0], "count": row[1]} for row in flags_result] if flags_result else []
-        
-        # 항해 상태별 분포
-        nav_status_result = execute_query("""
-            SELECT vsslNavi, COUNT(*) as count 
-            FROM ais_info 
-            WHERE vsslNavi IS NOT NULL 
-            GROUP BY vsslNavi 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
         navigation_status = [{"name": row[0], "count": row[1]} for row in nav_status_result] if nav_status_result else []
         
         return StatisticsResponse(
@@ -214,27 +377,28 @@ async def get_ais_summary_legacy():
 @cached(
     namespace=CacheNamespace.AIS,
     endpoint=CacheEndpoint.SUMMARY,
-    ttl=redis_settings.CACHE_TTL_LONG  # 1시간 캐싱
+    ttl=redis_settings.CACHE_TTL_LONG,  # 1시간 캐싱
+    stale_ttl=redis_settings.CACHE_STALE_TTL,  # 만료 후 5분은 이전 값 제공 + 백그라운드 갱신
+    response=True  # 응답 바이트 캐싱 (ETag 조건부 요청 지원)
 )
 async def get_ais_summary():
     """AIS 데이터 요약 조회 (캐싱 적용: 1시간)"""
     try:
-        # AIS 기본 통계
-        stats = await get_statistics()
-        
-        # 최신 데이터 개수
-        latest_data = await get_latest_data()
-        
-        # 품질 정보 (MySQL에서)
-        quality_result = execute_query_one("""
-            SELECT 
-                COUNT(DISTINCT inspection_id) as total_inspections,
-                COUNT(*) as total_checks,
-                SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
-                MAX(created_at) as last_inspection
-            FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%'
-        """)
+        # AIS 기본 통계와 품질 정보를 동시에 조회
+        stats, latest_result, quality_result = await gather_queries(
+            get_statistics(),
+            execute_query_one_async("SELECT COUNT(*) FROM ais_latest_position"),
+            # 품질 정보 (MySQL에서)
+            execute_query_one_async("""
+                SELECT 
+                    COUNT(DISTINCT inspection_id) as total_inspections,
+                    COUNT(*) as total_checks,
+                    SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
+                    MAX(created_at) as last_inspection
+                FROM data_inspection_results 
+                WHERE data_source = 'ais'
+            """)
+        )
         
         if quality_result:
             total_inspections, total_checks, pass_count, last_inspection = quality_result
@@ -247,7 +411,8 @@ async def get_ais_summary():
             "total_ships": stats.totalShips,
             "unique_ship_types": len(stats.shipTypes),
             "unique_flags": len(stats.flags),
-            "latest_records": len(latest_data),
+            # /latest 가 반환하는 선박 수 (선박별 최신 위치)
+            "latest_records": latest_result[0] if latest_result else 0,
             "ship_type_distribution": stats.shipTypes[:5],  # Top 5
             "flag_distribution": stats.flags[:5],  # Top 5
             "quality_info": {
@@ -289,71 +454,8 @@ async def get_ais_inspection_history_legacy(
 async def get_ais_quality_status():
     """AIS 품질 상태 데이터 조회"""
     try:
-        # 전체 품질 통계
-        overall_stats = execute_query_one("""
-                SELECT 
-                    COUNT(DISTINCT inspection_id) as total_inspections,
-                    COUNT(*) as total_checks,
-                    SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
-                    SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail_count,
-                MAX(created_at) as last_inspection
-                FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%'
-        """)
-        
-        if overall_stats:
-            total_inspections, total_checks, pass_count, fail_count, last_inspection = overall_stats
-            pass_rate = calculate_pass_rate(pass_count, total_checks)
-        else:
-            total_inspections = total_checks = pass_count = fail_count = pass_rate = 0
-            last_inspection = None
-            
-            # 완전성 검사 통계
-        completeness_stats = execute_query_one("""
-                SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count
-                FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%' AND check_type = 'completeness'
-            """)
-            
-        completeness_rate = 0.0
-        if completeness_stats and completeness_stats[0] > 0:
-            completeness_rate = calculate_pass_rate(completeness_stats[1], completeness_stats[0])
-            
-            # 유효성 검사 통계
-        validity_stats = execute_query_one("""
-                SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count
-                FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%' AND check_type = 'validity'
-        """)
-        
-        validity_rate = 0.0
-        if validity_stats and validity_stats[0] > 0:
-            validity_rate = calculate_pass_rate(validity_stats[1], validity_stats[0])
-        
-        quality_data = {
-            "total_inspections": total_inspections,
-            "total_checks": total_checks,
-            "pass_count": pass_count,
-            "fail_count": fail_count,
-            "pass_rate": pass_rate,
-            "last_inspection_date": last_inspection.strftime('%Y-%m-%d') if last_inspection else None,
-            "completeness": {
-                "fields_checked": completeness_stats[0] if completeness_stats else 0,
-                "pass_count": completeness_stats[1] if completeness_stats else 0,
-                "fail_count": (completeness_stats[0] - completeness_stats[1]) if completeness_stats and completeness_stats[0] else 0,
-                "pass_rate": completeness_rate
-            },
-            "validity": {
-                "fields_checked": validity_stats[0] if validity_stats else 0,
-                "pass_count": validity_stats[1] if validity_stats else 0,
-                "fail_count": (validity_stats[0] - validity_stats[1]) if validity_stats and validity_stats[0] else 0,
-                "pass_rate": validity_rate
-            }
-        }
+        # 전체 및 검사 유형별 통계 (공용 품질 분석 엔진, 캐싱 적용)
+        quality_data = await get_quality_engine(DataSource.AIS).quality_summary()
         
         return create_response_data([quality_data])
         
@@ -364,11 +466,6 @@ async def get_ais_quality_status():
         )
 
 @router.get("/quality-summary")
-@cached(
-    namespace=CacheNamespace.AIS,
-    endpoint=CacheEndpoint.QUALITY_SUMMARY,
-    ttl=redis_settings.CACHE_TTL_LONG  # 1시간 캐싱
-)
 async def get_ais_quality_summary():
     """AIS 데이터 품질 요약 정보 (캐싱 적용: 1시간)"""
     return await get_ais_quality_status()
@@ -378,7 +475,7 @@ async def get_ais_quality_details():
     """AIS 데이터 품질 상세 분석"""
     try:
         # 최근 검사 결과 상세 정보
-        recent_inspections = execute_query("""
+        recent_inspections = await execute_query_async("""
                 SELECT 
                 inspection_id,
                 check_type,
@@ -387,31 +484,31 @@ async def get_ais_quality_details():
                 message,
                 created_at
                 FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%'
+            WHERE data_source = 'ais'
             ORDER BY created_at DESC 
             LIMIT 50
         """)
         
         # 검사 타입별 통계
-        check_type_stats = execute_query("""
+        check_type_stats = await execute_query_async("""
                 SELECT 
                 check_type,
                 COUNT(*) as total,
                     SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
                     SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail_count
                 FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%'
+            WHERE data_source = 'ais'
             GROUP BY check_type
         """)
         
         # 실패 원인별 분석
-        failure_analysis = execute_query("""
+        failure_analysis = await execute_query_async("""
             SELECT 
                 check_name,
                 message,
                 COUNT(*) as failure_count
             FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%' AND status = 'FAIL'
+            WHERE data_source = 'ais' AND status = 'FAIL'
             GROUP BY check_name, message
             ORDER BY failure_count DESC
             LIMIT 10
@@ -459,7 +556,7 @@ async def get_ais_charts():
     """AIS 차트 데이터"""
     try:
         # 선박 타입별 차트 데이터
-        ship_type_chart = execute_query("""
+        ship_type_chart = await execute_query_async("""
             SELECT vsslTp, COUNT(*) as count 
             FROM ais_info 
             WHERE vsslTp IS NOT NULL 
@@ -469,7 +566,7 @@ async def get_ais_charts():
         """)
         
         # 국적별 차트 데이터
-        flag_chart = execute_query("""
+        flag_chart = await execute_query_async("""
             SELECT flag, COUNT(*) as count 
             FROM ais_info 
             WHERE flag IS NOT NULL 
@@ -479,7 +576,7 @@ async def get_ais_charts():
         """)
         
         # 속도 분포 차트 데이터
-        speed_chart = execute_query("""
+        speed_chart = await execute_query_async("""
             SELECT 
                 CASE 
                     WHEN sog < 5 THEN '0-5 knots'
@@ -523,47 +620,8 @@ async def get_ais_inspection_history(
                 detail="period는 'daily', 'weekly', 'monthly', 'custom' 중 하나여야 합니다."
             )
         
-        # 날짜 조건 및 그룹화 설정
-        date_condition, date_params = get_sql_date_condition(period, start_date, end_date)
-        group_by, date_format = get_sql_group_by(period)
-        
-        # 검사 히스토리 쿼리
-        query = f"""
-            SELECT 
-            {date_format} as period_label,
-            {group_by} as period_key,
-            COUNT(*) as total_checks,
-            SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
-            SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail_count,
-            ROUND(SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 2) as pass_rate,
-            SUM(CASE WHEN check_type = 'completeness' AND status = 'PASS' THEN 1 ELSE 0 END) as completeness_pass,
-            SUM(CASE WHEN check_type = 'completeness' THEN 1 ELSE 0 END) as completeness_total,
-            SUM(CASE WHEN check_type = 'validity' AND status = 'PASS' THEN 1 ELSE 0 END) as validity_pass,
-            SUM(CASE WHEN check_type = 'validity' THEN 1 ELSE 0 END) as validity_total
-            FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%'
-            {date_condition}
-            GROUP BY {group_by}
-            ORDER BY {group_by} ASC
-            LIMIT 50
-        """
-        
-        results = execute_query(query, date_params)
-            
-        history_data = []
-        for row in results:
-            completeness_rate = calculate_pass_rate(row[6], row[7]) if row[7] > 0 else 0.0
-            validity_rate = calculate_pass_rate(row[8], row[9]) if row[9] > 0 else 0.0
-                
-            history_data.append({
-                "date": str(row[0]),
-                "score": float(row[5]),
-                "totalChecks": row[2],
-                "passedChecks": row[3],
-                "failedChecks": row[4],
-                "completenessRate": completeness_rate,
-                "validityRate": validity_rate
-                })
+        # 일별 집계 테이블에서 기간별 히스토리 조회
+        history_data = await get_quality_engine(DataSource.AIS).inspection_history(period, start_date, end_date)
         
         return history_data
         
@@ -577,152 +635,8 @@ async def get_ais_inspection_history(
 async def get_ais_field_analysis():
     """AIS 필드별 상세 분석 데이터"""
     try:
-        import json
-        import re
-        
-        # details JSON에서 필드별 통계를 추출 (가장 최근 검사 결과만)
-        all_results = execute_query("""
-            SELECT 
-                check_type,
-                status,
-                details,
-                affected_rows
-            FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%' 
-            AND details IS NOT NULL AND details != ''
-            AND created_at = (
-                SELECT MAX(created_at) 
-                FROM data_inspection_results 
-                WHERE inspection_id LIKE '%%ais_info_inspection%%'
-            )
-            ORDER BY check_type
-        """)
-        
-        # 필드별로 데이터 집계
-        field_data = {}
-        
-        for row in all_results:
-            check_type = row[0]
-            status = row[1]
-            details_str = row[2]
-            affected_rows = row[3] or 0
-            
-            try:
-                details = json.loads(details_str)
-                message = details.get('message', '')
-                
-                # 메시지에서 필드명 추출: [필드명] 형식
-                match = re.search(r'\[([^\]]+)\]', message)
-                if not match:
-                    continue
-                    
-                field_name = match.group(1)
-                total = details.get('total', 0)
-                check_count = int(details.get('check', 0))
-                etc_count = int(details.get('etc', 0))
-                
-                # 필드별 키 생성
-                key = f"{field_name}_{check_type}"
-                
-                if key not in field_data:
-                    field_data[key] = {
-                        'field_name': field_name,
-                        'check_type': check_type,
-                        'total': total,
-                        'pass_count': 0,
-                        'fail_count': 0,
-                        'error_sum': 0,
-                        'max_affected_rows': 0,  # 최대 affected_rows 추적
-                        'last_message': message  # 원본 메시지 저장
-                    }
-                else:
-                    # 마지막 메시지 업데이트 (최신 것으로)
-                    field_data[key]['last_message'] = message
-                
-                # 상태별 집계
-                if status == 'PASS':
-                    field_data[key]['pass_count'] += 1
-                else:
-                    field_data[key]['fail_count'] += 1
-                    
-                    # 유효성-그리드 검사는 특별 처리
-                    # (선박 데이터이므로 육지=오류, 바다=정상)
-                    # affected_rows에는 바다(정상) 개수가 저장되어 있고,
-                    # details.check에는 육지(오류) 개수가 저장되어 있음
-                    if '유효성-그리드' in field_name or 'grid' in field_name.lower():
-                        # check_count가 육지(오류) 개수
-                        actual_error_count = check_count
-                    else:
-                        # 일반 검사는 affected_rows 사용
-                        actual_error_count = affected_rows
-                    
-                    # 중복 집계 방지: 최대값만 저장
-                    field_data[key]['max_affected_rows'] = max(field_data[key]['max_affected_rows'], actual_error_count)
-                    field_data[key]['error_sum'] = field_data[key]['max_affected_rows']
-                    
-            except (json.JSONDecodeError, ValueError) as e:
-                continue
-        
-        # 리스트로 변환
-        field_stats = []
-        for key, data in field_data.items():
-            total_checks = data['pass_count'] + data['fail_count']
-            pass_rate = (data['pass_count'] * 100.0 / total_checks) if total_checks > 0 else 0
-            
-            # 마지막 메시지 저장 (가장 최근 것)
-            last_message = data.get('last_message', '')
-            
-            # 실제 데이터 행 수 (total)를 올바르게 사용
-            actual_total = data['total']  # 실제 데이터 행 수 (예: 898)
-            error_sum = data['error_sum']  # 오류 개수
-            normal_count = actual_total - error_sum if actual_total >= error_sum else 0  # 정상 개수
-            
-            field_stats.append((
-                data['field_name'],
-                data['check_type'],
-                actual_total,  # 실제 데이터 행 수 (898)
-                data['pass_count'],  # PASS 검사 횟수
-                data['fail_count'],  # FAIL 검사 횟수
-                pass_rate,
-                error_sum,  # 오류 데이터 행 수
-                last_message  # 원본 메시지
-            ))
-        
-        # 심각도별 통계
-        severity_stats = execute_query("""
-            SELECT 
-                severity,
-                COUNT(*) as count,
-                check_type
-            FROM data_inspection_results 
-            WHERE inspection_id LIKE '%%ais_info_inspection%%' AND severity IS NOT NULL
-            GROUP BY severity, check_type
-            ORDER BY count DESC
-        """)
-        
-        analysis_data = {
-            "field_statistics": [
-                {
-                    "field_name": row[0],
-                    "check_type": row[1],
-                    "total_checks": row[2],  # 실제 검사한 레코드 수 (898)
-                    "pass_count": row[3],  # PASS 횟수
-                    "fail_count": row[4],  # FAIL 횟수
-                    "pass_rate": float(row[5]),
-                    "affected_rows": row[6],  # 오류/빈값 합계
-                    "original_message": row[7] if len(row) > 7 else ""  # 원본 메시지
-                } for row in field_stats
-            ],
-            "severity_distribution": [
-                {
-                    "severity": row[0],
-                    "count": row[1],
-                    "check_type": row[2]
-                } for row in severity_stats
-            ]
-        }
-        
-        return create_response_data([analysis_data])
+        # 최신 검사의 필드별 통계 및 심각도 분포 (직렬화된 응답 캐싱)
+        return await get_quality_engine(DataSource.AIS).field_analysis_response()
         
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,68 @@
+"""Cache management routes (admin)
+
+/api/admin/cache 아래에서 캐시를 태그/네임스페이스 단위로 무효화합니다.
+    DELETE /api/admin/cache/namespace/{namespace}   네임스페이스(또는 ?endpoint=...) 무효화
+    DELETE /api/admin/cache/tags?tag=...             태그 무효화 (예: source:tc, date:2024-01-31)
+    GET    /api/admin/cache/tags?tag=...             태그별 등록된 키 수
+
+무효화는 태그 Set 에 등록된 키만 삭제하며 (services.cache.cache_tags),
+다른 워커의 L1 캐시도 비우도록 무효화 이벤트를 함께 발행합니다.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+
+# Import services
+from services.cache.redis_manager import redis_manager
+from services.cache.cache_tags import count_tagged
+from services.cache.invalidation import invalidate_namespace, invalidate_tags, publish_invalidation
+
+router = APIRouter()
+
+
+@router.delete("/namespace/{namespace}")
+async def invalidate_cache_namespace(
+    namespace: str,
+    endpoint: Optional[List[str]] = Query(None, description="특정 엔드포인트만 무효화 (여러 개 가능)")
+):
+    """네임스페이스(또는 엔드포인트) 캐시 무효화"""
+    try:
+        deleted = await invalidate_namespace(namespace, endpoint)
+        published = await publish_invalidation(namespace=namespace, endpoints=endpoint, source="admin")
+        return {
+            "namespace": namespace,
+            "endpoints": endpoint,
+            "deleted_keys": deleted,
+            "published": published
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"캐시 무효화 실패: {str(e)}")
+
+
+@router.delete("/tags")
+async def invalidate_cache_tags(tag: List[str] = Query(..., description="무효화할 태그 (여러 개 가능)")):
+    """태그 캐시 무효화"""
+    try:
+        deleted = await invalidate_tags(tag)
+        published = await publish_invalidation(tags=tag, source="admin")
+        return {
+            "tags": tag,
+            "deleted_keys": deleted,
+            "published": published
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"캐시 태그 무효화 실패: {str(e)}")
+
+
+@router.get("/tags")
+async def get_cache_tags(tag: List[str] = Query(..., description="조회할 태그 (여러 개 가능)")):
+    """태그별 등록된 캐시 키 수"""
+    try:
+        redis_client = redis_manager.get_client()
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=f"Redis 미연결: {str(e)}")
+
+    try:
+        return {"tags": await count_tagged(redis_client, tag)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"캐시 태그 조회 실패: {str(e)}")
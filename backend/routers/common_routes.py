@@ -21,7 +21,7 @@ from utils import (
 )
 
 # Import database utilities
-from config import execute_query, execute_query_one, execute_insert
+from config import execute_query_async, execute_query_one_async, execute_insert_async, get_pool_stats
 
 router = APIRouter()
 
@@ -40,12 +40,13 @@ async def health_check():
     """헬스 체크 엔드포인트"""
     try:
         # 데이터베이스 연결 테스트
-        result = execute_query_one("SELECT 1 as test")
+        result = await execute_query_one_async("SELECT 1 as test")
         
         if result:
             return {
                 "status": "healthy",
                 "database": "connected",
+                "db_pool": get_pool_stats(),
                 "timestamp": get_current_timestamp()
             }
         else:
@@ -85,7 +86,7 @@ async def run_quality_check(request: QualityCheckRequest):
             datetime.now()
         ]
         
-        execute_insert(insert_query, params)
+        await execute_insert_async(insert_query, params)
         
         # 실제 품질 검사 로직 (여기서는 간단한 예시)
         # TODO: 실제 품질 검사 로직 구현
@@ -111,7 +112,7 @@ async def run_quality_check(request: QualityCheckRequest):
         """
         
         processing_time = 1500  # 예시 처리 시간
-        execute_query(update_query, ["completed", datetime.now(), processing_time, inspection_id])
+        await execute_query_async(update_query, ["completed", datetime.now(), processing_time, inspection_id])
         
         return QualityCheckResult(
             success=True,
@@ -130,7 +131,7 @@ async def run_quality_check(request: QualityCheckRequest):
                     SET inspection_status = %s, end_time = %s
                     WHERE inspection_id = %s
                 """
-                execute_query(update_query, ["failed", datetime.now(), inspection_id])
+                await execute_query_async(update_query, ["failed", datetime.now(), inspection_id])
             except:
                 pass
         
@@ -170,7 +171,7 @@ async def get_quality_check_history(
         query += " ORDER BY created_at DESC LIMIT %s"
         params.append(limit)
         
-        results = execute_query(query, params)
+        results = await execute_query_async(query, params)
         
         history_list = []
         for row in results:
@@ -22,83 +22,47 @@ from utils import (
 )
 
 # Import database utilities
-from config import execute_query, execute_query_one
+from config import execute_query_async, execute_query_one_async
+
+# Import services
+from services.data_sources import PAGE_DATA_SOURCES
+from services.quality_stats import fetch_quality_stats
 
 router = APIRouter()
 
+def _page_condition(page: str, column: str = "data_source"):
+    """page 파라미터에 해당하는 데이터 소스 조건 (알 수 없는 page 는 전체)"""
+    data_source = PAGE_DATA_SOURCES.get(page)
+    if data_source is None:
+        return "1 = 1", []
+    return f"{column} = %s", [data_source]
+
+def _to_inspection_data(stats: Dict[str, Any]) -> InspectionData:
+    """검사 유형별 집계를 InspectionData 로 변환"""
+    return InspectionData(
+        pass_rate=stats["pass_rate"],
+        total_checks=stats["total_checks"],
+        pass_count=stats["pass_count"],
+        fail_count=stats["fail_count"],
+        fields_checked=stats["distinct_fields"],
+        last_updated=str(stats["last_inspection"]) if stats["last_inspection"] else None
+    )
+
 @router.get("/latest-inspection-results", response_model=LatestInspectionResults)
 async def get_latest_inspection_results(page: str = "AIS"):
     """최신 검사 결과 조회 (페이지별)"""
     try:
-        # 페이지별 inspection_id 패턴 설정
-        if page == "AIS":
-            pattern = "%ais_info_inspection%"
-        elif page == "TOS":
-            pattern = "%berth%"
-        elif page == "TC":
-            pattern = "%tc%"
-        elif page == "QC":
-            pattern = "%qc%"
-        else:
-            pattern = "%"
-        
-        # 완전성 검사 결과
-        completeness_stats = execute_query_one("""
-            SELECT 
-                COUNT(*) as total_checks,
-                SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
-                SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail_count,
-                COUNT(DISTINCT check_name) as fields_checked,
-                MAX(created_at) as last_updated
-            FROM data_inspection_results 
-            WHERE inspection_id LIKE %s AND check_type = 'completeness'
-        """, [pattern])
+        # 페이지별 데이터 소스 조건
+        condition, params = _page_condition(page, "r.data_source")
         
-        # 유효성 검사 결과
-        validity_stats = execute_query_one("""
-            SELECT 
-                COUNT(*) as total_checks,
-                SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
-                SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail_count,
-                COUNT(DISTINCT check_name) as fields_checked,
-                MAX(created_at) as last_updated
-            FROM data_inspection_results 
-            WHERE inspection_id LIKE %s AND check_type = 'validity'
-        """, [pattern])
-        
-        # 완전성 데이터 처리
-        if completeness_stats:
-            comp_total, comp_pass, comp_fail, comp_fields, comp_updated = completeness_stats
-            comp_rate = calculate_pass_rate(comp_pass, comp_total)
-        else:
-            comp_total = comp_pass = comp_fail = comp_fields = comp_rate = 0
-            comp_updated = None
-        
-        # 유효성 데이터 처리
-        if validity_stats:
-            val_total, val_pass, val_fail, val_fields, val_updated = validity_stats
-            val_rate = calculate_pass_rate(val_pass, val_total)
-        else:
-            val_total = val_pass = val_fail = val_fields = val_rate = 0
-            val_updated = None
+        # 완전성/유효성 검사 결과 (단일 쿼리)
+        stats = await fetch_quality_stats(condition, params)
+        completeness = stats.check_type("completeness")
+        validity = stats.check_type("validity")
         
         return LatestInspectionResults(
-            completeness=InspectionData(
-                pass_rate=comp_rate,
-                total_checks=comp_total,
-                pass_count=comp_pass,
-                fail_count=comp_fail,
-                fields_checked=comp_fields,
-                last_updated=str(comp_updated) if comp_updated else None
-            ),
-            validity=InspectionData(
-                pass_rate=val_rate,
-                total_checks=val_total,
-                pass_count=val_pass,
-                fail_count=val_fail,
-                fields_checked=val_fields,
-                last_updated=str(val_updated) if val_updated else None
-            )
+            completeness=_to_inspection_data(completeness),
+            validity=_to_inspection_data(validity)
         )
         
     except Exception as e:
@@ -111,7 +75,7 @@ async def get_latest_inspection_results(page: str = "AIS"):
 async def get_recent_inspections(limit: int = 10):
     """최근 검사 결과 조회"""
     try:
-        recent_data = execute_query("""
+        recent_data = await execute_query_async("""
             SELECT 
                 inspection_id,
                 table_name,
@@ -150,7 +114,7 @@ async def get_quality_metrics(days: int = 7):
     """품질 메트릭 요약 조회"""
     try:
         # 지정된 기간의 품질 메트릭
-        metrics_data = execute_query_one("""
+        metrics_data = await execute_query_one_async("""
             SELECT 
                 COUNT(DISTINCT inspection_id) as total_inspections,
                 COUNT(*) as total_checks,
@@ -168,13 +132,13 @@ async def get_quality_metrics(days: int = 7):
             total_inspections = total_checks = pass_count = fail_count = active_days = overall_rate = 0
         
         # 데이터 타입별 메트릭
-        type_metrics = execute_query("""
+        type_metrics = await execute_query_async("""
             SELECT 
-                CASE 
-                    WHEN inspection_id LIKE '%%ais%%' THEN 'AIS'
-                    WHEN inspection_id LIKE '%%berth%%' THEN 'TOS'
-                    WHEN inspection_id LIKE '%%tc%%' THEN 'TC'
-                    WHEN inspection_id LIKE '%%qc%%' THEN 'QC'
+                CASE data_source
+                    WHEN 'ais' THEN 'AIS'
+                    WHEN 'tos' THEN 'TOS'
+                    WHEN 'tc' THEN 'TC'
+                    WHEN 'qc' THEN 'QC'
                     ELSE 'Other'
                 END as data_type,
                 COUNT(*) as total_checks,
@@ -219,7 +183,7 @@ async def get_data_source_stats(days: int = 7):
     """데이터 소스별 통계 조회"""
     try:
         # 데이터 소스별 통계
-        source_stats = execute_query("""
+        source_stats = await execute_query_async("""
             SELECT 
                 data_source,
                 COUNT(DISTINCT inspection_id) as inspections,
@@ -252,7 +216,7 @@ async def get_performance_trends(days: int = 7):
     """성능 트렌드 데이터 조회"""
     try:
         # 일별 성능 트렌드
-        daily_trends = execute_query("""
+        daily_trends = await execute_query_async("""
             SELECT 
                 DATE(created_at) as date,
                 COUNT(DISTINCT inspection_id) as inspections,
@@ -289,7 +253,7 @@ async def get_api_quality_data():
     """API 품질 데이터 조회"""
     try:
         # main_old.py와 동일한 방식으로 동적 API 타입 추출
-        api_stats = execute_query("""
+        api_stats = await execute_query_async("""
                 SELECT 
                     CASE 
                     WHEN inspection_id LIKE '%%_inspection_%%' THEN 
@@ -332,7 +296,7 @@ async def get_data_quality_status():
     """데이터 품질 상태 및 알림 정보"""
     try:
         # 전체 품질 통계
-        overall_stats = execute_query_one("""
+        overall_stats = await execute_query_one_async("""
                 SELECT 
                 COUNT(DISTINCT inspection_id) as total_inspections,
                     COUNT(*) as total_checks,
@@ -392,20 +356,11 @@ async def get_data_quality_status():
 async def get_failed_items(page: str = "AIS"):
     """실패한 항목 데이터 조회 (페이지별)"""
     try:
-        # 페이지별 패턴 설정
-        if page == "AIS":
-            pattern = "%ais_info_inspection%"
-        elif page == "TOS":
-            pattern = "%berth%"
-        elif page == "TC":
-            pattern = "%tc%"
-        elif page == "QC":
-            pattern = "%qc%"
-        else:
-            pattern = "%"
+        # 페이지별 데이터 소스 조건
+        condition, params = _page_condition(page)
         
         # 실패한 항목들
-        failed_items = execute_query("""
+        failed_items = await execute_query_async(f"""
             SELECT 
                 check_name,
                 message,
@@ -413,13 +368,13 @@ async def get_failed_items(page: str = "AIS"):
                 affected_rows,
                 created_at
             FROM data_inspection_results 
-            WHERE inspection_id LIKE %s AND status = 'FAIL'
+            WHERE {condition} AND status = 'FAIL'
             ORDER BY created_at DESC
             LIMIT 20
-        """, [pattern])
+        """, params)
         
         # 성공한 항목들
-        success_items = execute_query("""
+        success_items = await execute_query_async(f"""
             SELECT 
                 check_name,
                 message,
@@ -427,10 +382,10 @@ async def get_failed_items(page: str = "AIS"):
                 affected_rows,
                 created_at
             FROM data_inspection_results 
-            WHERE inspection_id LIKE %s AND status = 'PASS'
+            WHERE {condition} AND status = 'PASS'
             ORDER BY created_at DESC
             LIMIT 10
-        """, [pattern])
+        """, params)
         
         failed_list = []
         for row in failed_items:
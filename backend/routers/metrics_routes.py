@@ -0,0 +1,56 @@
+"""Metrics routes
+
+캐시 데코레이터(@cached, @cache_response)와 배치 로그 기록기(services.log_writer)의 지표를 조회합니다.
+    /api/admin/cache/metrics   관리용 JSON (엔드포인트별 히트/미스/지연 시간 + L1 + 최근 예열 보고서)
+    /api/admin/logs/stats      배치 로그 기록기별 큐 길이, 기록/버림/실패 건수
+    /metrics                   Prometheus 스크레이프 (text exposition format)
+
+지표는 워커(프로세스)별로 집계되므로 Prometheus 는 각 워커를 따로 수집해야 합니다.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+
+# Import services
+from services.cache.cache_metrics import cache_stats
+from services.cache.local_cache import local_cache
+from services.cache.cache_warmer import cache_warmer
+from services.log_writer import log_writers
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/api/admin/cache/metrics")
+async def get_cache_metrics(namespace: Optional[str] = Query(None, description="네임스페이스 필터 (예: ais, tc)")):
+    """캐시 지표 조회 (JSON)"""
+    try:
+        return {
+            "cache": cache_stats.get_stats(namespace),
+            "local_cache": local_cache.get_stats(),
+            "last_warm_report": cache_warmer.last_report
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"캐시 지표 조회 실패: {str(e)}")
+
+
+@router.post("/api/admin/cache/metrics/reset")
+async def reset_cache_metrics():
+    """캐시 지표 초기화"""
+    cache_stats.reset()
+    return {"message": "캐시 지표가 초기화되었습니다"}
+
+
+@router.get("/api/admin/logs/stats")
+async def get_log_writer_stats():
+    """배치 로그 기록기 통계"""
+    return {"writers": [writer.get_stats() for writer in log_writers]}
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    body = cache_stats.render_prometheus() + "".join(writer.render_prometheus() for writer in log_writers)
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
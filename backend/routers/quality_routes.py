@@ -0,0 +1,157 @@
+"""Generic data quality routes
+
+등록된 모든 데이터 소스(services.data_sources)에 대해 같은 품질 대시보드 API를 제공합니다.
+    /api/dashboard/quality/sources
+    /api/dashboard/quality/{source}/summary
+    /api/dashboard/quality/{source}/latest-results
+    /api/dashboard/quality/{source}/recent-results
+    /api/dashboard/quality/{source}/inspection-history
+    /api/dashboard/quality/{source}/field-analysis
+
+기존 소스별 경로(/tc-quality-summary 등)는 add_source_quality_routes() 로 같은 엔진에 연결합니다.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+# Import utilities
+from utils import (
+    validate_period,
+    create_response_data
+)
+
+# Import services
+from services.data_sources import list_data_sources, get_data_source
+from services.quality_engine import QualityEngine, get_quality_engine
+
+router = APIRouter()
+
+
+def _get_engine(source: str) -> QualityEngine:
+    engine = get_quality_engine(source)
+    if engine is None:
+        raise HTTPException(status_code=404, detail=f"등록되지 않은 데이터 소스: {source}")
+    return engine
+
+
+def _check_period(period: str):
+    if not validate_period(period):
+        raise HTTPException(
+            status_code=400,
+            detail="period는 'daily', 'weekly', 'monthly', 'custom' 중 하나여야 합니다."
+        )
+
+
+@router.get("/quality/sources")
+async def get_quality_sources():
+    """품질 대시보드를 제공하는 데이터 소스 목록"""
+    return create_response_data([source.to_dict() for source in list_data_sources()])
+
+
+@router.get("/quality/{source}/summary")
+async def get_source_quality_summary(source: str):
+    """데이터 소스 품질 요약"""
+    engine = _get_engine(source)
+    try:
+        return await engine.quality_summary_response()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{engine.source.label} 품질 요약 조회 실패: {str(e)}")
+
+
+@router.get("/quality/{source}/latest-results")
+async def get_source_latest_results(source: str):
+    """최신 검사 1건의 검사 유형별 결과"""
+    engine = _get_engine(source)
+    try:
+        return await engine.latest_results_response()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{engine.source.label} 최신 검사 결과 조회 실패: {str(e)}")
+
+
+@router.get("/quality/{source}/recent-results")
+async def get_source_recent_results(
+    source: str,
+    limit: int = Query(default=20, ge=1, le=200, description="조회할 결과 수")
+):
+    """최근 검사 결과 목록"""
+    engine = _get_engine(source)
+    try:
+        return create_response_data(await engine.recent_results(limit=limit))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{engine.source.label} 최근 검사 결과 조회 실패: {str(e)}")
+
+
+@router.get("/quality/{source}/inspection-history")
+async def get_source_inspection_history(
+    source: str,
+    period: str = Query(default="daily", description="기간 타입: daily, weekly, monthly, custom"),
+    start_date: Optional[str] = Query(default=None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(default=None, description="종료 날짜 (YYYY-MM-DD)")
+):
+    """기간별 검사 히스토리"""
+    engine = _get_engine(source)
+    _check_period(period)
+    try:
+        return await engine.inspection_history_response(period, start_date, end_date)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{engine.source.label} 검사 히스토리 조회 실패: {str(e)}")
+
+
+@router.get("/quality/{source}/field-analysis")
+async def get_source_field_analysis(
+    source: str,
+    recent_inspections: int = Query(default=1, ge=1, le=50, description="집계할 최근 검사 수")
+):
+    """필드별 상세 분석"""
+    engine = _get_engine(source)
+    try:
+        return await engine.field_analysis_response(recent_inspections=recent_inspections)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{engine.source.label} 필드별 분석 실패: {str(e)}")
+
+
+def add_source_quality_routes(target: APIRouter, source_key: str):
+    """
+    소스별 라우터에 기존 경로 규칙의 품질 API 등록
+
+        /{prefix}-quality-summary, /{prefix}-field-analysis, /{prefix}-inspection-history
+
+    Args:
+        target: 경로를 추가할 라우터
+        source_key: 등록된 데이터 소스 키 (services.data_sources.DataSource)
+
+    래퍼에서 공용 라우트 함수를 직접 호출하면 Query(...) 기본값이 해석되지 않으므로
+    쿼리 파라미터는 모두 래퍼에 선언하고 그대로 넘겨야 합니다. (test_quality_routes.py 로 확인)
+    """
+    source = get_data_source(source_key)
+    if source is None:
+        raise ValueError(f"Unknown data source: {source_key}")
+    prefix = source.route_prefix
+
+    async def get_quality_summary():
+        return await get_source_quality_summary(source_key)
+
+    async def get_field_analysis(
+        recent_inspections: int = Query(default=1, ge=1, le=50, description="집계할 최근 검사 수")
+    ):
+        return await get_source_field_analysis(source_key, recent_inspections=recent_inspections)
+
+    async def get_inspection_history(
+        period: str = Query(default="daily", description="기간 타입: daily, weekly, monthly, custom"),
+        start_date: Optional[str] = Query(default=None, description="시작 날짜 (YYYY-MM-DD)"),
+        end_date: Optional[str] = Query(default=None, description="종료 날짜 (YYYY-MM-DD)")
+    ):
+        return await get_source_inspection_history(source_key, period, start_date, end_date)
+
+    target.add_api_route(
+        f"/{prefix}-quality-summary", get_quality_summary, methods=["GET"],
+        name=f"get_{source_key}_quality_summary", summary=f"{source.label} 품질 요약 데이터"
+    )
+    target.add_api_route(
+        f"/{prefix}-field-analysis", get_field_analysis, methods=["GET"],
+        name=f"get_{source_key}_field_analysis", summary=f"{source.label} 필드별 상세 분석 데이터"
+    )
+    target.add_api_route(
+        f"/{prefix}-inspection-history", get_inspection_history, methods=["GET"],
+        name=f"get_{source_key}_inspection_history", summary=f"{source.label} 검사 히스토리 (기간별 필터링 지원)"
+    )
@@ -3,10 +3,13 @@
 from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import json
+from pydantic import ValidationError
 
 # Import models from centralized schemas
 from models import (
     PageVisitRequest,
+    PageVisitBatchRequest,
     UIStatisticsResponse,
     TimeBasedStats,
     DailyStats,
@@ -21,128 +24,111 @@ from utils import (
     format_period_label,
     validate_period,
     create_response_data,
-    create_error_response
+    create_error_response,
+    keyset_condition,
+    next_cursor
 )
 
 # Import database utilities
-from config import execute_query, execute_query_one, execute_insert
+from config import settings, execute_query_async
+
+# Import services
+from services.log_writer import log_page_visit as enqueue_page_visit_log
+from services.ui_rollup import fetch_ui_statistics, fetch_visitor_trends, fetch_time_based_statistics
 
 router = APIRouter()
 
+async def _read_json_body(req: Request) -> Any:
+    """Request body JSON 파싱 (sendBeacon 의 text/plain 전송도 허용하기 위해 직접 파싱)"""
+    body = await req.body()
+    try:
+        return json.loads(body.decode('utf-8'))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON: {str(e)}")
+
+
+def _enqueue_page_visit(visit: PageVisitRequest, req: Request, received_at: datetime) -> bool:
+    """방문 로그를 배치 기록 큐에 추가 (DB INSERT 는 services.log_writer 가 모아서 처리)"""
+    return enqueue_page_visit_log(
+        user_id=visit.user_id,
+        page_name=visit.page_name,
+        page_url=visit.page_url,
+        login_status=visit.login_status,
+        visit_duration=visit.visit_duration,
+        session_id=visit.session_id,
+        ip_address=req.client.host if req.client else None,
+        user_agent=req.headers.get("user-agent", ""),
+        referrer=visit.referrer,
+        visited_at=visit.visited_at,
+        received_at=received_at
+    )
+
+
 @router.post("/log/page-visit")
 async def log_page_visit(req: Request):
     """페이지 방문 로그 저장"""
+    data = await _read_json_body(req)
     try:
-        # Request body 명시적으로 파싱
-        body = await req.body()
-        import json
-        try:
-            data = json.loads(body.decode('utf-8'))
-        except json.JSONDecodeError as e:
-            raise HTTPException(status_code=422, detail=f"Invalid JSON: {str(e)}")
-        
-        # PageVisitRequest 모델로 변환
         request = PageVisitRequest(**data)
-        
-        # IP 주소 및 User-Agent 추출
-        ip_address = req.client.host
-        user_agent = req.headers.get("user-agent", "")
-        
-        # 시간 정보 추출
-        now = datetime.now()
-        visit_hour = now.hour
-        visit_weekday = now.weekday()
-        
-        query = """
-            INSERT INTO ui_log_page_visits 
-            (user_id, page_name, page_url, login_status, visit_duration, 
-             session_id, ip_address, user_agent, referrer, visit_hour, visit_weekday, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        params = [
-            request.user_id,
-            request.page_name,
-            request.page_url,
-            request.login_status,
-            request.visit_duration,
-            request.session_id,
-            ip_address,
-            user_agent,
-            request.referrer,
-            visit_hour,
-            visit_weekday,
-            now
-        ]
-        
-        execute_insert(query, params)
+    except (TypeError, ValidationError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid page visit: {str(e)}")
+    
+    try:
+        if not _enqueue_page_visit(request, req, datetime.now()):
+            raise HTTPException(status_code=503, detail="페이지 방문 로그 큐가 가득 찼습니다")
         
         return create_response_data([], "페이지 방문 로그가 성공적으로 저장되었습니다.")
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, 
             detail=f"페이지 방문 로그 저장 실패: {str(e)}"
         )
 
-@router.get("/statistics", response_model=UIStatisticsResponse)
-async def get_ui_statistics():
-    """UI 통계 데이터 조회"""
+@router.post("/log/page-visits:batch")
+async def log_page_visits_batch(req: Request):
+    """페이지 방문 로그 일괄 저장 ({"visits": [...]} 또는 방문 배열)"""
+    data = await _read_json_body(req)
     try:
-        # 전체 페이지 방문 수
-        total_page_visits_result = execute_query_one("SELECT COUNT(*) FROM ui_log_page_visits")
-        total_page_visits = total_page_visits_result[0] if total_page_visits_result else 0
-        
-        # 전체 API 호출 수
-        total_api_calls_result = execute_query_one("SELECT COUNT(*) FROM api_call_info")
-        total_api_calls = total_api_calls_result[0] if total_api_calls_result else 0
-        
-        # 고유 사용자 수
-        unique_users_result = execute_query_one("SELECT COUNT(DISTINCT user_id) FROM ui_log_page_visits")
-        unique_users = unique_users_result[0] if unique_users_result else 0
-        
-        # 로그인 상태별 통계
-        login_status_stats = execute_query("""
-            SELECT login_status, COUNT(*) 
-            FROM ui_log_page_visits 
-            GROUP BY login_status
-        """)
-        
-        # 가장 많이 방문한 페이지
-        most_visited_pages = execute_query("""
-            SELECT page_name, COUNT(*) as visit_count
-            FROM ui_log_page_visits 
-            GROUP BY page_name 
-            ORDER BY visit_count DESC 
-            LIMIT 5
-        """)
+        batch = PageVisitBatchRequest(visits=data) if isinstance(data, list) else PageVisitBatchRequest(**data)
+    except (TypeError, ValidationError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid page visits: {str(e)}")
+    
+    if len(batch.visits) > settings.page_visit_batch_max:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 최대 {settings.page_visit_batch_max}건까지 저장할 수 있습니다"
+        )
+    
+    try:
+        received_at = datetime.now()
+        accepted = sum(_enqueue_page_visit(visit, req, received_at) for visit in batch.visits)
+        dropped = len(batch.visits) - accepted
         
-        # 가장 많이 호출된 API
-        most_called_apis = execute_query("""
-            SELECT api_endpoint, COUNT(*) as call_count
-            FROM api_call_info 
-            GROUP BY api_endpoint 
-            ORDER BY call_count DESC 
-            LIMIT 5
-        """)
+        if batch.visits and not accepted:
+            raise HTTPException(status_code=503, detail="페이지 방문 로그 큐가 가득 찼습니다")
         
-        # 평균 응답 시간
-        avg_response_time_result = execute_query_one("""
-            SELECT AVG(response_time_ms) 
-            FROM api_call_info 
-            WHERE response_time_ms IS NOT NULL
-        """)
-        avg_response_time_ms = float(avg_response_time_result[0]) if avg_response_time_result and avg_response_time_result[0] else 0.0
+        return {
+            **create_response_data([], f"페이지 방문 로그 {accepted}건이 저장되었습니다."),
+            "accepted": accepted,
+            "dropped": dropped
+        }
         
-        return UIStatisticsResponse(
-            total_page_visits=total_page_visits,
-            total_api_calls=total_api_calls,
-            unique_users=unique_users,
-            login_status_stats=login_status_stats,
-            most_visited_pages=most_visited_pages,
-            most_called_apis=most_called_apis,
-            avg_response_time_ms=avg_response_time_ms
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"페이지 방문 로그 일괄 저장 실패: {str(e)}"
         )
+
+@router.get("/statistics", response_model=UIStatisticsResponse)
+async def get_ui_statistics():
+    """UI 통계 데이터 조회 (시간별 집계 테이블 기준)"""
+    try:
+        return UIStatisticsResponse(**await fetch_ui_statistics())
         
     except Exception as e:
         raise HTTPException(
@@ -155,7 +141,7 @@ async def get_user_activity(user_id: str):
     """특정 사용자의 활동 요약"""
     try:
         # 사용자 페이지 방문 통계
-        page_visits = execute_query("""
+        page_visits = await execute_query_async("""
             SELECT 
                 COUNT(*) as total_visits,
                 COUNT(DISTINCT page_name) as unique_pages,
@@ -166,7 +152,7 @@ async def get_user_activity(user_id: str):
         """, [user_id])
         
         # 사용자가 가장 많이 방문한 페이지
-        favorite_pages = execute_query("""
+        favorite_pages = await execute_query_async("""
             SELECT page_name, COUNT(*) as visit_count
             FROM ui_log_page_visits 
             WHERE user_id = %s
@@ -192,22 +178,32 @@ async def get_user_activity(user_id: str):
             detail=f"사용자 활동 조회 실패: {str(e)}"
         )
 
+def _keyset_condition_or_400(cursor: Optional[str]):
+    """커서 조건 (잘못된 커서는 400)"""
+    try:
+        return keyset_condition(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/logs/page-visits")
 async def get_page_visits(
     user_id: Optional[str] = None,
     login_status: Optional[str] = None,
-    limit: int = 100
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor")
 ):
-    """페이지 방문 로그 조회"""
+    """페이지 방문 로그 조회 (최신순, (created_at, id) 키셋 페이지네이션)"""
+    cursor_condition, cursor_params = _keyset_condition_or_400(cursor)
     try:
         query = """
             SELECT user_id, page_name, page_url, login_status, 
-                   visit_duration, created_at, ip_address
+                   visit_duration, created_at, ip_address, id
             FROM ui_log_page_visits
             WHERE 1=1
         """
         params = []
         
+        # 필터마다 (필터, created_at, id) 인덱스 사용 (db/add_log_indexes.py)
         if user_id:
             query += " AND user_id = %s"
             params.append(user_id)
@@ -216,14 +212,16 @@ async def get_page_visits(
             query += " AND login_status = %s"
             params.append(login_status)
         
-        query += " ORDER BY created_at DESC LIMIT %s"
-        params.append(limit)
+        query += f" {cursor_condition} ORDER BY created_at DESC, id DESC LIMIT %s"
+        params.extend(cursor_params)
+        params.append(limit + 1)
         
-        results = execute_query(query, params)
+        results = await execute_query_async(query, params)
         
         logs = []
-        for row in results:
+        for row in results[:limit]:
             logs.append({
+                "id": row[7],
                 "user_id": row[0],
                 "page_name": row[1],
                 "page_url": row[2],
@@ -233,7 +231,10 @@ async def get_page_visits(
                 "ip_address": row[6]
             })
         
-        return create_response_data(logs)
+        return {
+            **create_response_data(logs),
+            "next_cursor": next_cursor(results, limit, created_index=5, id_index=7)
+        }
         
     except Exception as e:
         raise HTTPException(
@@ -243,32 +244,48 @@ async def get_page_visits(
 
 @router.get("/logs/api-calls")
 async def get_api_calls(
-    user_id: Optional[str] = None,
-    api_endpoint: Optional[str] = None,
-    limit: int = 100
+    user_id: Optional[str] = Query(default=None, description="호출한 사용자 ID"),
+    api_endpoint: Optional[str] = Query(default=None, description="엔드포인트 경로 (정확히 일치, 예: /api/dashboard/tc-summary)"),
+    status_code: Optional[int] = Query(default=None, description="응답 상태 코드"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor")
 ):
-    """API 호출 로그 조회"""
+    """API 호출 로그 조회 (최신순, (created_at, id) 키셋 페이지네이션)"""
+    cursor_condition, cursor_params = _keyset_condition_or_400(cursor)
     try:
         query = """
             SELECT api_endpoint, request_params, response_status_code, 
-                   response_time_ms, created_at
+                   response_time_ms, created_at, id, user_id
             FROM api_call_info
             WHERE 1=1
         """
         params = []
         
+        # 필터마다 (필터, created_at, id) 인덱스 사용 (db/add_log_indexes.py)
+        # api_endpoint 는 정확히 일치해야 인덱스 순서대로 읽음 (LIKE 검색은 일치 행 전체 정렬)
+        if user_id:
+            query += " AND user_id = %s"
+            params.append(user_id)
+        
         if api_endpoint:
-            query += " AND api_endpoint LIKE %s"
-            params.append(f"%{api_endpoint}%")
+            query += " AND api_endpoint = %s"
+            params.append(api_endpoint)
+        
+        if status_code is not None:
+            query += " AND response_status_code = %s"
+            params.append(status_code)
         
-        query += " ORDER BY created_at DESC LIMIT %s"
-        params.append(limit)
+        query += f" {cursor_condition} ORDER BY created_at DESC, id DESC LIMIT %s"
+        params.extend(cursor_params)
+        params.append(limit + 1)
         
-        results = execute_query(query, params)
+        results = await execute_query_async(query, params)
         
         logs = []
-        for row in results:
+        for row in results[:limit]:
             logs.append({
+                "id": row[5],
+                "user_id": row[6],
                 "api_endpoint": row[0],
                 "request_params": row[1],
                 "response_status_code": row[2],
@@ -276,7 +293,10 @@ async def get_api_calls(
                 "created_at": str(row[4])
             })
         
-        return create_response_data(logs)
+        return {
+            **create_response_data(logs),
+            "next_cursor": next_cursor(results, limit, created_index=4, id_index=5)
+        }
         
     except Exception as e:
         raise HTTPException(
@@ -286,47 +306,9 @@ async def get_api_calls(
 
 @router.get("/statistics/visitor-trends")
 async def get_visitor_trends():
-    """방문자 트렌드 분석 데이터 조회"""
+    """방문자 트렌드 분석 데이터 조회 (시간별 집계 테이블 기준)"""
     try:
-        # 최근 30일간 일별 방문자 수
-        daily_trends = execute_query("""
-            SELECT 
-                DATE(created_at) as date,
-                COUNT(*) as visits,
-                COUNT(DISTINCT user_id) as unique_visitors
-            FROM ui_log_page_visits 
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-            GROUP BY DATE(created_at)
-            ORDER BY date ASC
-        """)
-        
-        # 시간대별 방문 패턴
-        hourly_pattern = execute_query("""
-            SELECT 
-                visit_hour,
-                COUNT(*) as visits
-            FROM ui_log_page_visits 
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-            GROUP BY visit_hour
-            ORDER BY visit_hour ASC
-        """)
-        
-        # 요일별 방문 패턴
-        weekday_pattern = execute_query("""
-            SELECT 
-                visit_weekday,
-                COUNT(*) as visits
-            FROM ui_log_page_visits 
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-            GROUP BY visit_weekday
-            ORDER BY visit_weekday ASC
-        """)
-        
-        trends_data = {
-            "daily_trends": [{"date": str(row[0]), "visits": row[1], "unique_visitors": row[2]} for row in daily_trends],
-            "hourly_pattern": [{"hour": row[0], "visits": row[1]} for row in hourly_pattern],
-            "weekday_pattern": [{"weekday": row[0], "visits": row[1]} for row in weekday_pattern]
-        }
+        trends_data = await fetch_visitor_trends()
         
         return create_response_data([trends_data])
         
@@ -342,7 +324,7 @@ async def get_time_based_statistics(
     start_date: Optional[str] = Query(default=None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(default=None, description="종료 날짜 (YYYY-MM-DD)")
 ):
-    """시간별 통계 데이터 조회 (기간별 다른 데이터 + 사용자 정의 날짜 범위)"""
+    """시간별 통계 데이터 조회 (기간별 다른 데이터 + 사용자 정의 날짜 범위, 시간별 집계 테이블 기준)"""
     try:
         if not validate_period(period):
             raise HTTPException(
@@ -350,99 +332,7 @@ async def get_time_based_statistics(
                 detail="period는 'daily', 'weekly', 'monthly', 'custom' 중 하나여야 합니다."
             )
         
-        # 날짜 조건 설정
-        if period == 'custom' and start_date and end_date:
-            date_condition = "AND DATE(pv.created_at) BETWEEN %s AND %s"
-            api_date_condition = "AND DATE(created_at) BETWEEN %s AND %s"
-            params = [start_date, end_date, start_date, end_date]
-        elif period == 'daily':
-            date_condition = "AND pv.created_at >= DATE_SUB(NOW(), INTERVAL 14 DAY)"
-            api_date_condition = "AND created_at >= DATE_SUB(NOW(), INTERVAL 14 DAY)"
-            params = []
-        elif period == 'weekly':
-            date_condition = "AND pv.created_at >= DATE_SUB(NOW(), INTERVAL 12 WEEK)"
-            api_date_condition = "AND created_at >= DATE_SUB(NOW(), INTERVAL 12 WEEK)"
-            params = []
-        elif period == 'monthly':
-            date_condition = "AND pv.created_at >= DATE_SUB(NOW(), INTERVAL 12 MONTH)"
-            api_date_condition = "AND created_at >= DATE_SUB(NOW(), INTERVAL 12 MONTH)"
-            params = []
-        
-        if period == 'daily' or period == 'custom':
-            # 일별 데이터
-            query = f"""
-                SELECT 
-                    DATE(pv.created_at) as period_date,
-                    COUNT(pv.id) as page_visits,
-                    COUNT(DISTINCT pv.user_id) as unique_users,
-                    COALESCE(api_calls, 0) as api_calls
-                FROM ui_log_page_visits pv
-                LEFT JOIN (
-                    SELECT DATE(created_at) as api_date, COUNT(*) as api_calls
-                    FROM api_call_info 
-                    WHERE 1=1 {api_date_condition}
-                    GROUP BY DATE(created_at)
-                ) api ON DATE(pv.created_at) = api.api_date
-                WHERE 1=1 {date_condition}
-                GROUP BY DATE(pv.created_at)
-                ORDER BY DATE(pv.created_at) ASC
-            """
-            
-        elif period == 'weekly':
-            # 주별 데이터 (월 기준 주차)
-            query = f"""
-                SELECT 
-                    CONCAT(YEAR(pv.created_at), '년 ', LPAD(MONTH(pv.created_at), 2, '0'), '월 ', 
-                           (WEEK(pv.created_at, 1) - WEEK(DATE_SUB(pv.created_at, INTERVAL DAY(pv.created_at)-1 DAY), 1) + 1), '주차') as period_label,
-                    COUNT(pv.id) as page_visits,
-                    COUNT(DISTINCT pv.user_id) as unique_users,
-                    COALESCE(SUM(api_calls), 0) as api_calls
-                FROM ui_log_page_visits pv
-                LEFT JOIN (
-                    SELECT 
-                        YEARWEEK(created_at, 1) as api_week,
-                        COUNT(*) as api_calls
-                    FROM api_call_info 
-                    WHERE 1=1 {api_date_condition}
-                    GROUP BY YEARWEEK(created_at, 1)
-                ) api ON YEARWEEK(pv.created_at, 1) = api.api_week
-                WHERE 1=1 {date_condition}
-                GROUP BY YEARWEEK(pv.created_at, 1), YEAR(pv.created_at), MONTH(pv.created_at)
-                ORDER BY YEARWEEK(pv.created_at, 1) ASC
-            """
-            
-        elif period == 'monthly':
-            # 월별 데이터
-            query = f"""
-                SELECT 
-                    DATE_FORMAT(pv.created_at, '%%Y년 %%m월') as period_label,
-                    COUNT(pv.id) as page_visits,
-                    COUNT(DISTINCT pv.user_id) as unique_users,
-                    COALESCE(SUM(api_calls), 0) as api_calls
-                FROM ui_log_page_visits pv
-                LEFT JOIN (
-                    SELECT 
-                        DATE_FORMAT(created_at, '%%Y-%%m') as api_month,
-                        COUNT(*) as api_calls
-                    FROM api_call_info 
-                    WHERE 1=1 {api_date_condition}
-                    GROUP BY DATE_FORMAT(created_at, '%%Y-%%m')
-                ) api ON DATE_FORMAT(pv.created_at, '%%Y-%%m') = api.api_month
-                WHERE 1=1 {date_condition}
-                GROUP BY DATE_FORMAT(pv.created_at, '%%Y-%%m')
-                ORDER BY DATE_FORMAT(pv.created_at, '%%Y-%%m') ASC
-            """
-        
-        results = execute_query(query, params)
-        
-        data = []
-        for row in results:
-            data.append({
-                "period": str(row[0]),
-                "page_visits": int(row[1]),
-                "unique_users": int(row[2]),
-                "api_calls": int(row[3])
-            })
+        data = await fetch_time_based_statistics(period, start_date, end_date)
         
         return create_response_data([{
             "period": period,
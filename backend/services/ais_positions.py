@@ -0,0 +1,170 @@
+"""AIS position queries
+
+선박별 최신 위치(ais_latest_position)와 격자 셀 기반 공간 검색입니다.
+
+    - load_latest_positions: 선박별 최신 위치 (/ais/latest, /ais/live-map)
+    - latest_position_index: 최신 위치의 격자 셀 → 선박 메모리 인덱스 (/ais/bbox, /ais/near 기본)
+    - query_history_bbox / query_history_near: ais_info 이력을 grid_cell 인덱스로 검색 (scope=history)
+
+공간 검색은 항상 후보 셀(utils.geo.bbox_cell_ranges)로 먼저 거른 뒤
+정확한 좌표 비교/거리 계산을 하므로 전체 행을 훑지 않습니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from config import execute_query_async
+from config.settings import settings
+from services.ais_stream import project_rows, field_converters
+from utils.geo import GridIndex, bbox_cell_ranges, radius_bbox, EARTH_RADIUS_NM
+
+logger = logging.getLogger(__name__)
+
+# 지도 표시에 필요한 필드만
+MAP_FIELDS = ["mmsiNo", "vsslNm", "vsslTp", "lon", "lat", "sog", "cog", "headSide", "vsslNavi", "dt_pos_utc"]
+
+# 후보 구간이 이보다 많으면(아주 넓은 영역) 셀 조건 없이 좌표 조건만 사용
+MAX_CELL_RANGES = 500
+
+
+async def load_latest_positions(fields: List[str], since: Optional[str] = None,
+                                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    선박별 최신 위치 조회 (ais_latest_position, 최신 수신순)
+
+    동기화 서비스가 ais_info 저장 시 MMSI 별로 갱신하는 테이블이므로 이력 크기와 무관하게 선박 수만큼만 읽습니다.
+    since 는 포함 조건이라 같은 시각에 늦게 들어온 위치도 다음 조회에서 빠지지 않습니다.
+    """
+    query = f"SELECT {', '.join(fields)} FROM ais_latest_position"
+    params = []
+    if since:
+        query += " WHERE dt_pos_utc >= %s"
+        params.append(str(since))  # VARCHAR 컬럼이므로 문자열로 비교해야 인덱스 사용
+    query += " ORDER BY dt_pos_utc DESC"
+    if limit:
+        query += " LIMIT %s"
+        params.append(limit)
+
+    rows = await execute_query_async(query, params)
+    return project_rows(fields, rows or [], field_converters(fields))
+
+
+class LatestPositionIndex:
+    """
+    선박별 최신 위치 격자 인덱스
+
+    조회 시 마지막 갱신 후 settings.ais_spatial_refresh_seconds 가 지났으면
+    그 사이 바뀐 위치(dt_pos_utc >= 마지막 값)만 읽어 반영합니다.
+    """
+
+    def __init__(self, fields: List[str] = MAP_FIELDS):
+        self.fields = fields
+        self.grid = GridIndex()
+        self.last_dt_pos_utc = None
+        self.refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self.refreshed_at < settings.ais_spatial_refresh_seconds
+
+    async def refresh(self, force: bool = False) -> None:
+        if not force and self._is_fresh():
+            return
+        async with self._lock:
+            if not force and self._is_fresh():
+                return
+            positions = await load_latest_positions(self.fields, since=self.last_dt_pos_utc)
+            for position in positions:
+                self.grid.upsert(position["mmsiNo"], position)
+            if positions and positions[0]["dt_pos_utc"] is not None:
+                self.last_dt_pos_utc = positions[0]["dt_pos_utc"]
+            self.refreshed_at = time.monotonic()
+            if positions:
+                logger.debug(f"📍 최신 위치 인덱스 갱신: {len(positions)}척 (총 {len(self.grid)}척)")
+
+    async def query_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                         limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        await self.refresh()
+        return self.grid.query_bbox(min_lat, min_lon, max_lat, max_lon, limit)
+
+    async def query_near(self, lat: float, lon: float, radius_nm: float,
+                         limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        await self.refresh()
+        return [
+            {**position, "distance_nm": round(distance, 3)}
+            for distance, position in self.grid.query_near(lat, lon, radius_nm, limit)
+        ]
+
+
+latest_position_index = LatestPositionIndex()
+
+
+def _bbox_conditions(min_lat: float, min_lon: float, max_lat: float, max_lon: float):
+    """ais_info bbox 조건 (grid_cell 후보 구간 + 정확한 좌표 범위)"""
+    conditions, params = [], []
+
+    ranges = bbox_cell_ranges(min_lat, min_lon, max_lat, max_lon)
+    if len(ranges) <= MAX_CELL_RANGES:
+        conditions.append("(" + " OR ".join(["grid_cell BETWEEN %s AND %s"] * len(ranges)) + ")")
+        for first, last in ranges:
+            params.extend([first, last])
+
+    conditions.append("lat BETWEEN %s AND %s")
+    params.extend([min_lat, max_lat])
+    if min_lon <= max_lon:
+        conditions.append("lon BETWEEN %s AND %s")
+    else:
+        conditions.append("(lon >= %s OR lon <= %s)")  # 날짜변경선을 넘는 영역
+    params.extend([min_lon, max_lon])
+    return conditions, params
+
+
+async def query_history_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                             since: Optional[str] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+    """ais_info 이력 중 bbox 안의 위치 (최신순)"""
+    conditions, params = _bbox_conditions(min_lat, min_lon, max_lat, max_lon)
+    if since:
+        conditions.append("dt_pos_utc >= %s")
+        params.append(str(since))
+    params.append(limit)
+
+    rows = await execute_query_async(f"""
+        SELECT {', '.join(MAP_FIELDS)}
+        FROM ais_info
+        WHERE {' AND '.join(conditions)}
+        ORDER BY dt_pos_utc DESC
+        LIMIT %s
+    """, params)
+    return project_rows(MAP_FIELDS, rows or [], field_converters(MAP_FIELDS))
+
+
+async def query_history_near(lat: float, lon: float, radius_nm: float,
+                             since: Optional[str] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+    """ais_info 이력 중 반경 안의 위치 (가까운 순, 후보 셀 안에서만 거리 계산)"""
+    conditions, params = _bbox_conditions(*radius_bbox(lat, lon, radius_nm))
+    if since:
+        conditions.append("dt_pos_utc >= %s")
+        params.append(str(since))
+
+    # Haversine (utils.geo.haversine_nm 과 같은 식)
+    distance_sql = f"""
+        {EARTH_RADIUS_NM} * 2 * ASIN(SQRT(
+            POW(SIN(RADIANS(lat - %s) / 2), 2) +
+            COS(RADIANS(%s)) * COS(RADIANS(lat)) * POW(SIN(RADIANS(lon - %s) / 2), 2)
+        ))
+    """
+    rows = await execute_query_async(f"""
+        SELECT {', '.join(MAP_FIELDS)}, {distance_sql} as distance_nm
+        FROM ais_info
+        WHERE {' AND '.join(conditions)}
+        HAVING distance_nm <= %s
+        ORDER BY distance_nm
+        LIMIT %s
+    """, [lat, lat, lon] + params + [radius_nm, limit])
+
+    positions = project_rows(MAP_FIELDS, rows or [], field_converters(MAP_FIELDS))
+    for position, row in zip(positions, rows or []):
+        position["distance_nm"] = round(float(row[-1]), 3)
+    return positions
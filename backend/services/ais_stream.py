@@ -0,0 +1,183 @@
+"""AIS streaming / projected list responses
+
+/ais/all 등 AIS 목록 엔드포인트의 스트리밍 모드(?stream=ndjson|json)입니다.
+ais_info 를 배치 단위(settings.ais_stream_batch_size)로 읽어 바로 직렬화해 보내므로,
+요청당 메모리는 결과 크기와 무관하게 한 배치 분량이고 첫 바이트는 첫 배치 직후에 나갑니다.
+
+    ndjson   application/x-ndjson, 한 줄에 선박 한 건
+    json     application/json, 일반 응답과 같은 JSON 배열을 청크로 나눠 전송
+
+같은 엔드포인트의 ?fields= (필요한 컬럼만 SELECT/응답) 와 ?cursor= (rowid 키셋 페이지네이션) 도
+여기서 처리합니다. 지도 화면처럼 mmsiNo,lat,lon,sog,cog 만 필요하면 응답 크기가 크게 줄어듭니다.
+
+각 행은 AISInfoResponse 와 같은 필드/순서/타입으로 변환하지만 행마다 모델 객체를 만들지 않습니다.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union, get_args, get_origin
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+
+from config.settings import settings
+from models import AISInfoResponse
+from services.database import ais_service
+from utils import create_response_data, encode_id_cursor
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+StreamFormat = Literal["ndjson", "json"]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+
+# 프록시(nginx) 버퍼링을 끄고, 스트리밍 결과는 캐시하지 않음
+STREAM_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-store"}
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any]:
+    """Optional[int/float/str] 필드 값 변환 함수 (pydantic lax 변환과 같은 결과)"""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation in (int, float, str):
+        return annotation
+    return lambda value: value
+
+
+def _field_converters(model) -> List[Tuple[str, Callable[[Any], Any]]]:
+    return [(name, _converter(field.annotation)) for name, field in model.model_fields.items()]
+
+
+AIS_FIELD_CONVERTERS = _field_converters(AISInfoResponse)
+AIS_FIELD_CONVERTER_MAP = dict(AIS_FIELD_CONVERTERS)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    ?fields=mmsiNo,lat,lon 파싱 (응답 모델 필드만 허용, 요청 순서 유지)
+
+    Raises:
+        ValueError: 알 수 없는 필드
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in AIS_FIELD_CONVERTER_MAP]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    return names or None
+
+
+def field_converters(fields: Optional[List[str]]) -> List[Tuple[str, Callable[[Any], Any]]]:
+    """응답할 필드의 변환 함수 (None 이면 전체 필드)"""
+    if fields is None:
+        return AIS_FIELD_CONVERTERS
+    return [(name, AIS_FIELD_CONVERTER_MAP[name]) for name in fields]
+
+
+def project_rows(columns: Sequence[str], rows: Sequence[tuple],
+                 converters: Sequence[Tuple[str, Callable[[Any], Any]]] = AIS_FIELD_CONVERTERS) -> List[Dict[str, Any]]:
+    """행 튜플을 응답 모델 필드 순서의 dict 로 변환 (없는 컬럼은 None)"""
+    positions = {column: index for index, column in enumerate(columns)}
+    plan = [(name, positions.get(name), convert) for name, convert in converters]
+    records = []
+    for row in rows:
+        record = {}
+        for name, position, convert in plan:
+            value = row[position] if position is not None else None
+            record[name] = convert(value) if value is not None else None
+        records.append(record)
+    return records
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_batch(records: List[Dict[str, Any]], stream_format: StreamFormat, first: bool) -> bytes:
+    """배치 하나를 응답 청크로 직렬화"""
+    if stream_format == "ndjson":
+        return b"".join(_dumps(record) + b"\n" for record in records)
+    body = _dumps(records)[1:-1]  # 배열 괄호를 떼고 이어 붙임
+    return body if first else b"," + body
+
+
+async def stream_ais_rows(stream_format: StreamFormat, where: str = "", params: tuple = (),
+                          limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                          after: Optional[int] = None) -> StreamingResponse:
+    """
+    ais_info 조회 결과를 스트리밍 응답으로 반환
+
+    첫 배치는 응답을 시작하기 전에 읽으므로 쿼리 오류는 일반 오류 응답(500)이 됩니다.
+
+    Args:
+        stream_format: ndjson 또는 json
+        where / params: AISService.iter_rows 조건 ('?' 자리표시자)
+        limit: 최대 행 수
+        fields: 응답 필드 (parse_fields 결과, None 이면 전체)
+        after: 이 rowid 다음 행부터 (커서)
+    """
+    converters = field_converters(fields)
+    iterator = ais_service.iter_rows(where, params, limit, fields=fields, after=after)
+    batch = await run_in_threadpool(next, iterator, None)
+
+    async def body():
+        nonlocal batch
+        first = True
+        try:
+            if stream_format == "json":
+                yield b"["
+            while batch is not None:
+                columns, rows = batch
+                yield encode_batch(project_rows(columns, rows, converters), stream_format, first)
+                first = False
+                batch = await run_in_threadpool(next, iterator, None)
+            if stream_format == "json":
+                yield b"]"
+        except Exception as e:
+            # 헤더를 이미 보냈으므로 상태 코드를 바꿀 수 없음 (응답이 잘린 채 끝남)
+            logger.error(f"❌ AIS 스트리밍 실패: {e}")
+            raise
+        finally:
+            # 연결 종료 시 바로 SQLite 연결 정리 (취소된 범위에서는 await 할 수 없으므로 동기 호출)
+            try:
+                iterator.close()
+            except ValueError:
+                # 스레드풀에서 아직 배치를 읽는 중이면 생성기가 GC 될 때 정리됨
+                pass
+
+    media_type = NDJSON_MEDIA_TYPE if stream_format == "ndjson" else JSON_MEDIA_TYPE
+    return StreamingResponse(body(), media_type=media_type, headers=STREAM_HEADERS)
+
+
+async def list_ais_rows(where: str = "", params: tuple = (), limit: Optional[int] = None,
+                        fields: Optional[List[str]] = None, after: Optional[int] = None,
+                        paged: bool = False) -> Response:
+    """
+    fields 프로젝션 / 커서 페이지네이션 목록 응답
+
+    paged=False 이면 일반 응답과 같은 행 배열을, paged=True 이면
+    create_response_data 형식에 next_cursor 를 더한 객체를 반환합니다.
+    페이지 크기는 limit (없으면 settings.ais_page_size) 이고, limit + 1 행을 읽어 다음 페이지 유무를 판단합니다.
+    """
+    converters = field_converters(fields)
+    if not paged:
+        columns, rows = await run_in_threadpool(ais_service.load_rows, fields, where, params, after, limit)
+        return Response(_dumps(project_rows(columns, rows, converters)), media_type=JSON_MEDIA_TYPE)
+
+    page_size = limit or settings.ais_page_size
+    columns, rows = await run_in_threadpool(ais_service.load_rows, fields, where, params, after, page_size + 1)
+    cursor = encode_id_cursor(rows[page_size - 1][0]) if len(rows) > page_size else None
+    body = {
+        **create_response_data(project_rows(columns, rows[:page_size], converters)),
+        "next_cursor": cursor
+    }
+    return Response(_dumps(body), media_type=JSON_MEDIA_TYPE)
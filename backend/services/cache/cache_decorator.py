@@ -1,24 +1,290 @@
 """캐싱 데코레이터 모듈"""
 
 from functools import wraps
-from typing import Callable, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Tuple
+import asyncio
+import copy
 import json
 import logging
+import math
+import random
+import time
+import uuid
 from inspect import signature
 
 from services.cache.redis_manager import redis_manager
-from services.cache.cache_keys import CacheKeyGenerator
+from services.cache.cache_keys import CacheKeyGenerator, CacheNamespace
+from services.cache.local_cache import local_cache, MISSING
+from services.cache.cache_tags import resolve_tags, register_tags
+from services.cache.response_cache import CachedResponse, is_cached_response_dict
+from services.cache.cache_metrics import (
+    CacheStats, cache_stats,
+    RESULT_HIT_L1, RESULT_HIT, RESULT_STALE, RESULT_MISS, RESULT_ERROR, RESULT_BYPASS
+)
 from config.redis_config import redis_settings
 
 logger = logging.getLogger(__name__)
 
 
+# ==================== 캐시 엔트리 형식 ====================
+# 값과 함께 논리적 만료 시각과 계산 소요 시간을 저장합니다.
+#   expires_at: 이 시각 이후는 stale (stale_ttl 동안은 Redis 에 남아 있음)
+#   delta: 원본 함수 실행 시간(초) - 확률적 조기 갱신에 사용
+ENVELOPE_MARKER = "__cache_entry__"
+
+# 분산 락 해제: 자신이 잡은 락일 때만 삭제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 다른 워커가 값을 계산 중일 때 캐시를 다시 확인하는 간격(초)
+LOCK_POLL_INTERVAL = 0.05
+
+# 프로세스 내 동일 키 요청 병합 (single-flight)
+_inflight: Dict[str, asyncio.Future] = {}
+
+# 진행 중인 백그라운드 갱신 (키 → 태스크, 태스크 참조 유지용)
+_refreshing: Dict[str, asyncio.Task] = {}
+
+# @cached 가 적용된 함수 목록 (캐시 예열 대상, services.cache.cache_warmer 참고)
+cached_functions: List[Callable] = []
+
+
+def _log_sampled(message: str, *args):
+    """요청별 캐시 로그 (DEBUG 레벨에서 CACHE_LOG_SAMPLE_RATE 비율만 기록, 집계는 cache_stats 참고)"""
+    if logger.isEnabledFor(logging.DEBUG) and random.random() < redis_settings.CACHE_LOG_SAMPLE_RATE:
+        logger.debug(message, *args)
+
+
+def _is_error_result(result: Any) -> bool:
+    """create_error_response() 형식의 실패 결과 여부 (캐시에 저장하지 않음)"""
+    return isinstance(result, dict) and result.get("success") is False
+
+
+def _serialize(data: Any) -> str:
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        default=str  # datetime 등 특수 타입 처리
+    )
+
+
+def _pack_entry(result: Any, ttl: int, delta: float) -> str:
+    return _serialize({
+        ENVELOPE_MARKER: 1,
+        "value": result.to_dict() if isinstance(result, CachedResponse) else result,
+        "expires_at": time.time() + ttl,
+        "delta": round(delta, 4)
+    })
+
+
+def _store_local(cache_key: str, result: Any, l1_ttl: float, tags: List[str]):
+    """L1 저장 (Redis 에서 읽은 값과 같은 형태가 되도록 JSON 변환 결과를 보관)"""
+    if l1_ttl <= 0:
+        return
+    if isinstance(result, CachedResponse):
+        local_cache.set(cache_key, result, l1_ttl, size=result.size, tags=tags)
+        return
+    serialized = _serialize(result)
+    local_cache.set(cache_key, json.loads(serialized), l1_ttl, size=len(serialized), tags=tags)
+
+
+def _unpack_entry(cached_data) -> Tuple[Any, Optional[float], float]:
+    """(값, 논리적 만료 시각, 계산 시간). 이전 형식(값만 저장)은 만료 시각 None"""
+    data = json.loads(cached_data)
+    if isinstance(data, dict) and data.get(ENVELOPE_MARKER) == 1:
+        value = data["value"]
+        if is_cached_response_dict(value):
+            value = CachedResponse.from_dict(value)
+        return value, data.get("expires_at"), data.get("delta") or 0.0
+    return data, None, 0.0
+
+
+def _lock_key(cache_key: str, prefix: str) -> str:
+    """계산 락 키 (네임스페이스 무효화 패턴에 걸리지 않도록 별도 네임스페이스 사용)"""
+    return f"{prefix}:{CacheNamespace.LOCK}:{cache_key[len(prefix) + 1:]}"
+
+
+def _should_refresh_early(expires_at: float, delta: float, beta: float, now: float) -> bool:
+    """
+    확률적 조기 만료 (XFetch)
+
+    만료가 가까울수록, 계산이 오래 걸리는 값일수록 높은 확률로 미리 갱신하여
+    여러 요청이 같은 순간에 만료를 맞지 않도록 분산합니다.
+    """
+    if beta <= 0 or delta <= 0:
+        return False
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+async def _single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """같은 키에 대한 동시 호출을 하나의 실행으로 병합 (후속 호출자는 결과 사본을 받음)"""
+    future = _inflight.get(key)
+    if future is not None:
+        return copy.deepcopy(await asyncio.shield(future))
+
+    future = asyncio.ensure_future(factory())
+    _inflight[key] = future
+    future.add_done_callback(lambda _: _inflight.pop(key, None) if _inflight.get(key) is future else None)
+    return await asyncio.shield(future)
+
+
+async def _acquire_lock(redis_client, lock_key: str, lock_timeout: int) -> Optional[str]:
+    """분산 락 획득 (SET NX PX). 실패 시 None, Redis 오류 시 빈 문자열(락 없이 진행)"""
+    token = uuid.uuid4().hex
+    try:
+        if await redis_client.set(lock_key, token, nx=True, px=lock_timeout * 1000):
+            return token
+        return None
+    except Exception as e:
+        logger.error(f"캐시 락 획득 오류: {e}")
+        return ""
+
+
+async def _release_lock(redis_client, lock_key: str, token: str):
+    if not token:
+        return
+    try:
+        await redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    except Exception as e:
+        logger.error(f"캐시 락 해제 오류: {e}")
+
+
+async def _compute_local(cache_key: str, func: Callable, args, kwargs, ttl: int, tags: List[str]) -> Any:
+    """Redis 없이 원본 함수 실행 후 L1 에만 저장 (단일 노드 구성)"""
+    namespace, endpoint = CacheStats.labels_from_key(cache_key)
+    started = time.perf_counter()
+    try:
+        result = await func(*args, **kwargs)
+    except Exception:
+        cache_stats.record(namespace, endpoint, RESULT_ERROR)
+        raise
+    cache_stats.observe_compute(namespace, endpoint, time.perf_counter() - started)
+    if _is_error_result(result):
+        cache_stats.record(namespace, endpoint, RESULT_ERROR)
+        logger.warning(f"⚠️ 실패 응답은 캐시하지 않음: {cache_key} - {result.get('message')}")
+        return result
+    _store_local(cache_key, result, ttl, tags)
+    _log_sampled("💾 L1 캐시 저장: %s (TTL: %ss)", cache_key, ttl)
+    return result
+
+
+async def _compute_and_store(redis_client, cache_key: str, func: Callable, args, kwargs,
+                             ttl: int, stale_ttl: Optional[int], l1_ttl: float, tags: List[str]) -> Any:
+    """원본 함수 실행 후 캐시 저장 + 태그 등록 (Redis 보관 기간 = ttl + stale_ttl, L1 은 l1_ttl)"""
+    namespace, endpoint = CacheStats.labels_from_key(cache_key)
+    started = time.perf_counter()
+    try:
+        result = await func(*args, **kwargs)
+    except Exception as e:
+        cache_stats.record(namespace, endpoint, RESULT_ERROR)
+        logger.error(f"함수 실행 오류 ({func.__name__}): {e}")
+        raise
+    delta = time.perf_counter() - started
+    cache_stats.observe_compute(namespace, endpoint, delta)
+
+    if _is_error_result(result):
+        # 오류를 200 으로 반환하는 라우트(create_error_response)의 결과가 TTL 동안 남지 않도록 저장하지 않음
+        cache_stats.record(namespace, endpoint, RESULT_ERROR)
+        logger.warning(f"⚠️ 실패 응답은 캐시하지 않음: {cache_key} - {result.get('message')}")
+        return result
+
+    try:
+        entry = _pack_entry(result, ttl, delta)
+        cache_stats.observe_payload(namespace, endpoint, len(entry))
+        started = time.perf_counter()
+        await redis_client.setex(
+            name=cache_key,
+            time=ttl + (stale_ttl or 0),
+            value=entry
+        )
+        await register_tags(redis_client, cache_key, tags, ttl + (stale_ttl or 0))
+        cache_stats.observe_redis(namespace, endpoint, time.perf_counter() - started)
+        _log_sampled("💾 캐시 저장: %s (TTL: %ss, stale: %ss, 계산 %.3fs)", cache_key, ttl, stale_ttl or 0, delta)
+    except Exception as e:
+        cache_stats.record(namespace, endpoint, RESULT_ERROR)
+        logger.error(f"캐시 저장 오류: {e}")
+        # 저장 실패해도 결과는 반환 (Graceful Degradation)
+
+    _store_local(cache_key, result, l1_ttl, tags)
+    return result
+
+
+async def _load_with_lock(redis_client, cache_key: str, lock_key: str, func: Callable, args, kwargs,
+                          ttl: int, stale_ttl: Optional[int], l1_ttl: float, tags: List[str],
+                          lock_timeout: int, lock_wait: float) -> Any:
+    """
+    분산 락을 잡은 워커만 원본 함수를 실행하고,
+    나머지 워커는 캐시에 값이 저장될 때까지 기다렸다가 읽습니다.
+    """
+    token = await _acquire_lock(redis_client, lock_key, lock_timeout)
+    if token is not None:
+        try:
+            return await _compute_and_store(redis_client, cache_key, func, args, kwargs, ttl, stale_ttl, l1_ttl, tags)
+        finally:
+            await _release_lock(redis_client, lock_key, token)
+
+    _log_sampled("⏳ 다른 워커가 계산 중, 대기: %s", cache_key)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + lock_wait
+    while loop.time() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        try:
+            cached_data = await redis_client.get(cache_key)
+            if cached_data:
+                value, expires_at, _ = _unpack_entry(cached_data)
+                now = time.time()
+                if expires_at is None or now < expires_at:
+                    _store_local(cache_key, value, min(l1_ttl, expires_at - now) if expires_at else l1_ttl, tags)
+                    return value
+        except Exception as e:
+            logger.error(f"캐시 조회 오류: {e}")
+            break
+
+    # 대기 시간 초과 - 직접 계산
+    logger.warning(f"⚠️ 캐시 락 대기 시간 초과, 직접 계산: {cache_key}")
+    return await _compute_and_store(redis_client, cache_key, func, args, kwargs, ttl, stale_ttl, l1_ttl, tags)
+
+
+def _schedule_refresh(redis_client, cache_key: str, lock_key: str, func: Callable, args, kwargs,
+                      ttl: int, stale_ttl: Optional[int], l1_ttl: float, tags: List[str], lock_timeout: int):
+    """백그라운드 갱신 예약 (프로세스당 키 하나에 한 태스크, 락을 못 잡으면 다른 워커에 맡김)"""
+    if cache_key in _refreshing:
+        return
+
+    async def refresh():
+        token = await _acquire_lock(redis_client, lock_key, lock_timeout)
+        if token is None:
+            return
+        try:
+            await _compute_and_store(redis_client, cache_key, func, args, kwargs, ttl, stale_ttl, l1_ttl, tags)
+        except Exception as e:
+            logger.error(f"백그라운드 캐시 갱신 실패 ({cache_key}): {e}")
+        finally:
+            await _release_lock(redis_client, lock_key, token)
+
+    task = asyncio.create_task(refresh())
+    _refreshing[cache_key] = task
+    task.add_done_callback(lambda _: _refreshing.pop(cache_key, None))
+    _log_sampled("🔄 백그라운드 캐시 갱신 시작: %s", cache_key)
+
+
 def cached(
     namespace: str,
     endpoint: str,
     ttl: Optional[int] = None,
     key_params: Optional[List[str]] = None,
-    prefix: Optional[str] = None
+    prefix: Optional[str] = None,
+    stale_ttl: Optional[int] = None,
+    early_refresh_beta: Optional[float] = None,
+    lock_timeout: Optional[int] = None,
+    local_ttl: Optional[int] = None,
+    response: bool = False,
+    warm: Optional[List[Dict[str, Any]]] = None,
+    tags: Optional[List[str]] = None
 ):
     """
     캐싱 데코레이터
@@ -26,12 +292,38 @@ def cached(
     함수 실행 전 Redis에서 캐시를 조회하고, 있으면 즉시 반환합니다.
     없으면 함수를 실행하고 결과를 Redis에 저장한 후 반환합니다.
     
+    캐시 만료 시 요청이 한꺼번에 DB로 몰리지 않도록
+        - 같은 프로세스의 동시 요청은 한 번만 실행하고 결과를 공유하며 (single-flight)
+        - 여러 워커 사이에서는 Redis 락을 잡은 워커만 실행하고 나머지는 저장된 값을 기다립니다.
+    stale_ttl 을 지정하면 만료 후 stale_ttl 동안은 이전 값을 바로 반환하고
+    백그라운드에서 한 번만 갱신합니다 (stale-while-revalidate).
+    만료 직전에는 확률적으로 미리 갱신합니다 (early_refresh_beta, 0이면 사용 안 함).
+    
+    Redis 앞단에 워커별 L1 메모리 캐시(services.cache.local_cache)를 두며,
+    Redis 미연결 시에는 L1 만으로 캐싱합니다. L1 히트는 공유 객체를 반환하므로 결과를 수정하지 마세요.
+    
+    response=True 이면 결과 대신 직렬화(+압축)된 응답 바이트를 캐시하고
+    Response 객체를 반환합니다 (services.cache.response_cache). 라우트 함수에만 사용하세요.
+    응답에는 ETag/Last-Modified 가 붙고, 클라이언트가 같은 버전을 가지고 있으면 304 를 반환합니다.
+    
+    저장된 키는 태그 Set 에 등록되어 태그 단위로 무효화됩니다 (services.cache.cache_tags).
+    ns:{namespace}, ep:{namespace}:{endpoint} 태그는 항상 등록됩니다.
+    
+    create_error_response() 처럼 success 가 False 인 dict 결과는 저장하지 않고 그대로 반환합니다.
+    
     Args:
         namespace: 캐시 네임스페이스 (예: 'ais', 'tos', 'tc')
         endpoint: API 엔드포인트 식별자 (예: 'summary', 'quality')
         ttl: 캐시 유지 시간(초). None이면 CACHE_TTL_MEDIUM 사용
         key_params: 캐시 키에 포함할 함수 파라미터 이름 리스트
         prefix: 캐시 프리픽스. None이면 설정값 사용
+        stale_ttl: 만료 후 이전 값을 계속 제공할 시간(초). None이면 사용 안 함
+        early_refresh_beta: 조기 갱신 강도. None이면 CACHE_EARLY_REFRESH_BETA 사용
+        lock_timeout: 계산 락 유지 시간(초). None이면 CACHE_LOCK_TIMEOUT 사용
+        local_ttl: L1 유지 시간(초). None이면 CACHE_L1_TTL, 0이면 L1 사용 안 함
+        response: 직렬화된 응답 바이트 캐싱 여부
+        warm: 캐시 예열 시 호출할 인자 목록. None이면 기본값(+ period 별)으로 예열, []이면 예열 안 함
+        tags: 추가 태그 (함수 인자 템플릿 사용 가능, 예: ['source:tc', 'date:{end_date}'])
     
     Examples:
         >>> @cached(namespace='ais', endpoint='summary', ttl=3600)
@@ -48,6 +340,11 @@ def cached(
         >>> async def get_ais_history(period, start_date, end_date):
         >>>     # DB 쿼리...
         >>>     return data
+        
+        >>> @cached(namespace='ais', endpoint='summary', ttl=3600, stale_ttl=300)
+        >>> async def get_ais_summary():
+        >>>     # 만료 후 5분 동안은 이전 값을 반환하며 백그라운드 갱신
+        >>>     return data
     """
     
     # 기본값 설정
@@ -57,99 +354,194 @@ def cached(
     if prefix is None:
         prefix = redis_settings.CACHE_PREFIX
     
+    if early_refresh_beta is None:
+        early_refresh_beta = redis_settings.CACHE_EARLY_REFRESH_BETA
+    
+    if lock_timeout is None:
+        lock_timeout = redis_settings.CACHE_LOCK_TIMEOUT
+    
+    lock_wait = redis_settings.CACHE_LOCK_WAIT
+    
+    # L1 유지 시간: Redis 사용 시 다른 워커의 갱신을 빨리 반영하도록 짧게, Redis 미사용 시 ttl 전체
+    l1_enabled = redis_settings.CACHE_L1_ENABLED and local_ttl != 0
+    l1_ttl = min(ttl, local_ttl or redis_settings.CACHE_L1_TTL) if l1_enabled else 0
+    
     def decorator(func: Callable):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # 디버그: 데코레이터 진입 확인
-            logger.info(f"🔍 [캐시 데코레이터] 진입: {func.__name__} (namespace={namespace}, endpoint={endpoint})")
-            
-            # ==================== Redis 클라이언트 확인 ====================
-            try:
-                redis_client = redis_manager.get_client()
-            except RuntimeError as e:
-                # Redis 미연결 시 원본 함수 실행 (Graceful Degradation)
-                logger.warning(
-                    f"⚠️ Redis 미연결, 캐시 없이 실행: {func.__name__} - {e}"
-                )
-                return await func(*args, **kwargs)
-            
-            # ==================== 캐시 키 생성 ====================
+        # 응답 캐싱: 함수 결과를 바로 직렬화하여 캐시 값으로 사용 (실패 결과는 저장하지 않으므로 그대로)
+        if response:
+            @wraps(func)
+            async def compute(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                return result if _is_error_result(result) else CachedResponse.build(result)
+        else:
+            compute = func
+        
+        def build_cache_key(args, kwargs) -> Tuple[str, List[str]]:
+            """함수 인자로 캐시 키와 태그 생성"""
             cache_params = {}
+            arguments = {}
             
-            if key_params:
+            if key_params or tags:
                 # 함수 시그니처에서 파라미터 추출
                 sig = signature(func)
                 try:
                     bound_args = sig.bind(*args, **kwargs)
                     bound_args.apply_defaults()
-                    
-                    for param_name in key_params:
-                        if param_name in bound_args.arguments:
-                            value = bound_args.arguments[param_name]
-                            # None이 아닌 값만 포함
-                            if value is not None:
-                                cache_params[param_name] = value
-                                
+                    arguments = bound_args.arguments
                 except Exception as e:
                     logger.error(f"파라미터 바인딩 오류: {e}")
             
+            for param_name in key_params or []:
+                value = arguments.get(param_name)
+                # None이 아닌 값만 포함
+                if value is not None:
+                    cache_params[param_name] = value
+            
             cache_key = CacheKeyGenerator.generate(
                 namespace=namespace,
                 endpoint=endpoint,
                 params=cache_params if cache_params else None,
                 prefix=prefix
             )
+            return cache_key, resolve_tags(namespace, endpoint, tags or (), arguments)
+
+        async def lookup(*args, **kwargs):
+            # ==================== 캐시 키 생성 ====================
+            cache_key, key_tags = build_cache_key(args, kwargs)
+            lock_key = _lock_key(cache_key, prefix)
+            
+            # ==================== L1 조회 ====================
+            if l1_enabled:
+                value = local_cache.get(cache_key, MISSING)
+                if value is not MISSING:
+                    cache_stats.record(namespace, endpoint, RESULT_HIT_L1)
+                    return value
+            
+            # ==================== Redis 클라이언트 확인 ====================
+            try:
+                redis_client = redis_manager.get_client()
+            except RuntimeError as e:
+                if l1_enabled:
+                    # Redis 미연결 시 L1 단독 캐시 (단일 노드 구성)
+                    cache_stats.record(namespace, endpoint, RESULT_MISS)
+                    return await _single_flight(
+                        cache_key, lambda: _compute_local(cache_key, compute, args, kwargs, ttl, key_tags)
+                    )
+                # Redis 미연결 시 원본 함수 실행 (Graceful Degradation)
+                cache_stats.record(namespace, endpoint, RESULT_BYPASS)
+                _log_sampled("⚠️ Redis 미연결, 캐시 없이 실행: %s - %s", func.__name__, e)
+                return await compute(*args, **kwargs)
             
             # ==================== 캐시 조회 ====================
             try:
+                started = time.perf_counter()
                 cached_data = await redis_client.get(cache_key)
+                cache_stats.observe_redis(namespace, endpoint, time.perf_counter() - started)
                 
                 if cached_data:
-                    logger.info(f"✅ 캐시 HIT: {cache_key}")
-                    
-                    # JSON 파싱하여 반환
                     try:
-                        return json.loads(cached_data)
+                        value, expires_at, delta = _unpack_entry(cached_data)
                     except json.JSONDecodeError as e:
                         logger.error(f"캐시 데이터 파싱 오류: {e}")
                         # 파싱 실패 시 캐시 삭제하고 원본 함수 실행
                         await redis_client.delete(cache_key)
+                    else:
+                        now = time.time()
+                        
+                        if expires_at is None or now < expires_at:
+                            cache_stats.record(namespace, endpoint, RESULT_HIT)
+                            _log_sampled("✅ 캐시 HIT: %s", cache_key)
+                            if l1_enabled:
+                                local_cache.set(
+                                    cache_key, value,
+                                    min(l1_ttl, expires_at - now) if expires_at else l1_ttl,
+                                    size=len(cached_data), tags=key_tags
+                                )
+                            # 만료 직전이면 확률적으로 미리 갱신 (현재 값은 그대로 반환)
+                            if expires_at is not None and _should_refresh_early(
+                                expires_at, delta, early_refresh_beta, now
+                            ):
+                                _schedule_refresh(redis_client, cache_key, lock_key, compute, args, kwargs,
+                                                  ttl, stale_ttl, l1_ttl, key_tags, lock_timeout)
+                            return value
+                        
+                        if stale_ttl:
+                            # stale-while-revalidate: 이전 값 반환 + 백그라운드 갱신
+                            cache_stats.record(namespace, endpoint, RESULT_STALE)
+                            _log_sampled("♻️ 캐시 STALE: %s", cache_key)
+                            _schedule_refresh(redis_client, cache_key, lock_key, compute, args, kwargs,
+                                              ttl, stale_ttl, l1_ttl, key_tags, lock_timeout)
+                            return value
                 
-                logger.info(f"❌ 캐시 MISS: {cache_key}")
+                cache_stats.record(namespace, endpoint, RESULT_MISS)
+                _log_sampled("❌ 캐시 MISS: %s", cache_key)
                 
             except Exception as e:
+                cache_stats.record(namespace, endpoint, RESULT_ERROR)
                 logger.error(f"캐시 조회 오류: {e}")
                 # 에러 발생 시 원본 함수 실행
             
-            # ==================== 원본 함수 실행 ====================
-            try:
-                result = await func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"함수 실행 오류 ({func.__name__}): {e}")
-                raise
+            # ==================== 원본 함수 실행 (요청 병합) ====================
+            return await _single_flight(
+                cache_key,
+                lambda: _load_with_lock(
+                    redis_client, cache_key, lock_key, compute, args, kwargs,
+                    ttl, stale_ttl, l1_ttl, key_tags, lock_timeout, lock_wait
+                )
+            )
+        
+        async def warm_cache(*args, min_remaining: float = 0, **kwargs) -> bool:
+            """
+            캐시 예열: 값이 없거나 남은 유효 시간이 min_remaining 초 미만이면 계산하여 저장
+            
+            Returns:
+                새로 계산했으면 True, 유효한 값이 있어 건너뛰었으면 False
+            
+            Raises:
+                RuntimeError: 원본 함수가 실패 응답(success: False)을 반환해 저장하지 않은 경우
+            """
+            cache_key, key_tags = build_cache_key(args, kwargs)
+            lock_key = _lock_key(cache_key, prefix)
             
-            # ==================== 캐시 저장 ====================
             try:
-                # JSON 직렬화
-                serialized_data = json.dumps(
-                    result,
-                    ensure_ascii=False,
-                    default=str  # datetime 등 특수 타입 처리
-                )
-                
-                # Redis에 저장
-                await redis_client.setex(
-                    name=cache_key,
-                    time=ttl,
-                    value=serialized_data
+                redis_client = redis_manager.get_client()
+            except RuntimeError:
+                if not l1_enabled:
+                    return False
+                if min_remaining <= 0 and local_cache.get(cache_key, MISSING) is not MISSING:
+                    return False
+                result = await _single_flight(
+                    cache_key, lambda: _compute_local(cache_key, compute, args, kwargs, ttl, key_tags)
                 )
-                
-                logger.info(f"💾 캐시 저장: {cache_key} (TTL: {ttl}s)")
-                
+                if _is_error_result(result):
+                    raise RuntimeError(f"실패 응답: {result.get('message')}")
+                return True
+            
+            try:
+                cached_data = await redis_client.get(cache_key)
+                if cached_data:
+                    _, expires_at, _ = _unpack_entry(cached_data)
+                    if expires_at is None or expires_at - time.time() > min_remaining:
+                        return False
             except Exception as e:
-                logger.error(f"캐시 저장 오류: {e}")
-                # 저장 실패해도 결과는 반환 (Graceful Degradation)
+                logger.error(f"캐시 조회 오류: {e}")
             
+            result = await _single_flight(
+                cache_key,
+                lambda: _load_with_lock(
+                    redis_client, cache_key, lock_key, compute, args, kwargs,
+                    ttl, stale_ttl, l1_ttl, key_tags, lock_timeout, lock_wait
+                )
+            )
+            if _is_error_result(result):
+                raise RuntimeError(f"실패 응답: {result.get('message')}")
+            return True
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await lookup(*args, **kwargs)
+            if response:
+                return CachedResponse.build(result).to_response()
             return result
         
         # 데코레이터 메타데이터 저장 (디버깅/모니터링용)
@@ -158,8 +550,17 @@ def cached(
             'endpoint': endpoint,
             'ttl': ttl,
             'key_params': key_params,
-            'prefix': prefix
+            'prefix': prefix,
+            'stale_ttl': stale_ttl,
+            'early_refresh_beta': early_refresh_beta,
+            'lock_timeout': lock_timeout,
+            'local_ttl': l1_ttl,
+            'response': response,
+            'warm': warm,
+            'tags': tags
         }
+        wrapper.warm = warm_cache
+        cached_functions.append(wrapper)
         
         return wrapper
     
@@ -205,83 +606,46 @@ def cache_response(ttl: int = None):
                 redis_client = redis_manager.get_client()
                 
                 # 캐시 조회
+                started = time.perf_counter()
                 cached_data = await redis_client.get(cache_key)
+                cache_stats.observe_redis(namespace, endpoint, time.perf_counter() - started)
                 if cached_data:
-                    logger.info(f"✅ 캐시 HIT: {cache_key}")
+                    cache_stats.record(namespace, endpoint, RESULT_HIT)
+                    _log_sampled("✅ 캐시 HIT: %s", cache_key)
                     return json.loads(cached_data)
                 
-                logger.info(f"❌ 캐시 MISS: {cache_key}")
+                cache_stats.record(namespace, endpoint, RESULT_MISS)
+                _log_sampled("❌ 캐시 MISS: %s", cache_key)
                 
                 # 원본 함수 실행
+                started = time.perf_counter()
                 result = await func(*args, **kwargs)
+                cache_stats.observe_compute(namespace, endpoint, time.perf_counter() - started)
+                if _is_error_result(result):
+                    return result
                 
                 # 캐시 저장
+                value = json.dumps(result, ensure_ascii=False, default=str)
+                cache_stats.observe_payload(namespace, endpoint, len(value))
                 await redis_client.setex(
                     name=cache_key,
                     time=ttl,
-                    value=json.dumps(result, ensure_ascii=False, default=str)
+                    value=value
                 )
-                logger.info(f"💾 캐시 저장: {cache_key}")
+                await register_tags(redis_client, cache_key, resolve_tags(namespace, endpoint, (), {}), ttl)
+                _log_sampled("💾 캐시 저장: %s", cache_key)
                 
                 return result
                 
             except RuntimeError:
                 # Redis 미연결 시 원본 함수만 실행
+                cache_stats.record(namespace, endpoint, RESULT_BYPASS)
                 return await func(*args, **kwargs)
             except Exception as e:
+                cache_stats.record(namespace, endpoint, RESULT_ERROR)
                 logger.error(f"캐시 처리 오류: {e}")
                 return await func(*args, **kwargs)
         
         return wrapper
     
     return decorator
-
-
-# ==================== 캐시 통계 추적 (선택적) ====================
-class CacheStats:
-    """캐시 히트/미스 통계 추적"""
-    
-    def __init__(self):
-        self.hits = 0
-        self.misses = 0
-        self.errors = 0
-    
-    def record_hit(self):
-        """캐시 히트 기록"""
-        self.hits += 1
-    
-    def record_miss(self):
-        """캐시 미스 기록"""
-        self.misses += 1
-    
-    def record_error(self):
-        """캐시 에러 기록"""
-        self.errors += 1
-    
-    def get_hit_rate(self) -> float:
-        """캐시 히트율 계산"""
-        total = self.hits + self.misses
-        if total == 0:
-            return 0.0
-        return (self.hits / total) * 100
-    
-    def get_stats(self) -> dict:
-        """통계 반환"""
-        return {
-            "hits": self.hits,
-            "misses": self.misses,
-            "errors": self.errors,
-            "hit_rate": f"{self.get_hit_rate():.2f}%",
-            "total_requests": self.hits + self.misses
-        }
-    
-    def reset(self):
-        """통계 초기화"""
-        self.hits = 0
-        self.misses = 0
-        self.errors = 0
-
-
-# 전역 캐시 통계 인스턴스
-cache_stats = CacheStats()
-
@@ -64,7 +64,7 @@ class CacheKeyGenerator:
         prefix: str = "port_dashboard"
     ) -> str:
         """
-        패턴 매칭용 키 생성 (캐시 무효화에 사용)
+        패턴 매칭용 키 생성 (디버깅/조회용, 무효화는 services.cache.cache_tags 태그 사용)
         
         Args:
             namespace: 네임스페이스
@@ -154,6 +154,8 @@ class CacheNamespace:
     VSSL_SPEC = "vssl_spec"  # 선박 제원
     STATS = "stats"          # 통계
     COMMON = "common"        # 공통
+    LOCK = "lock"            # 캐시 계산 락 (무효화 대상 아님)
+    TAG = "tag"              # 캐시 태그 Set (services.cache.cache_tags)
 
 
 # ==================== 엔드포인트 상수 ====================
@@ -168,6 +170,11 @@ class CacheEndpoint:
     HISTORY = "history"
     INSPECTION_HISTORY = "inspection_history"
     FIELD_ANALYSIS = "field_analysis"
+    FIELD_ANALYSIS_RESPONSE = "field_analysis_response"          # 직렬화된 응답
+    QUALITY_SUMMARY_RESPONSE = "quality_summary_response"        # 직렬화된 응답
+    QUALITY_STATUS_RESPONSE = "quality_status_response"          # 직렬화된 응답
+    INSPECTION_HISTORY_RESPONSE = "inspection_history_response"  # 직렬화된 응답
+    ALL = "all"
     WORK_HISTORY = "work_history"
 
 
@@ -0,0 +1,228 @@
+"""캐시 메트릭 모듈
+
+@cached / @cache_response 의 네임스페이스·엔드포인트별 지표를 수집합니다.
+
+    - 요청 결과 카운터: hit_l1, hit, stale, miss, error, bypass(캐시 미사용)
+    - 히스토그램: Redis 소요 시간, 원본 함수 계산 시간, 저장 페이로드 크기
+
+워커 스레드에서 호출되어도 안전하도록 갱신은 하나의 락으로 보호합니다.
+(경합이 거의 없는 짧은 임계 구역이라 비용은 무시할 수준)
+관리용 JSON(get_stats)과 Prometheus 텍스트 형식(render_prometheus)으로 조회합니다.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.cache.cache_keys import CacheKeyGenerator
+
+# 히스토그램 버킷 상한 (초 / 바이트)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# 요청 결과 구분
+RESULT_HIT_L1 = "hit_l1"
+RESULT_HIT = "hit"
+RESULT_STALE = "stale"
+RESULT_MISS = "miss"
+RESULT_ERROR = "error"
+RESULT_BYPASS = "bypass"
+
+_HIT_RESULTS = (RESULT_HIT_L1, RESULT_HIT, RESULT_STALE)
+
+Labels = Tuple[str, str]
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram 과 같은 의미)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, 누적 개수) 목록"""
+        result, total = [], 0
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            total += count
+            result.append((str(bound), total))
+        return result
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0
+        }
+
+
+class _EndpointMetrics:
+    __slots__ = ("results", "redis_seconds", "compute_seconds", "payload_bytes")
+
+    def __init__(self):
+        self.results: Dict[str, int] = {}
+        self.redis_seconds = Histogram(LATENCY_BUCKETS)
+        self.compute_seconds = Histogram(LATENCY_BUCKETS)
+        self.payload_bytes = Histogram(BYTES_BUCKETS)
+
+
+class CacheStats:
+    """캐시 히트/미스/지연 시간 통계 (네임스페이스·엔드포인트별)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[Labels, _EndpointMetrics] = {}
+
+    def _get(self, labels: Labels) -> _EndpointMetrics:
+        metrics = self._metrics.get(labels)
+        if metrics is None:
+            metrics = self._metrics.setdefault(labels, _EndpointMetrics())
+        return metrics
+
+    @staticmethod
+    def labels_from_key(cache_key: str) -> Labels:
+        """캐시 키에서 (namespace, endpoint) 추출"""
+        parsed = CacheKeyGenerator.parse_key(cache_key)
+        return parsed['namespace'], parsed['endpoint']
+
+    # ==================== 기록 ====================
+
+    def record(self, namespace: str, endpoint: str, result: str):
+        """요청 결과 기록 (hit_l1, hit, stale, miss, error, bypass)"""
+        with self._lock:
+            results = self._get((namespace, endpoint)).results
+            results[result] = results.get(result, 0) + 1
+
+    def observe_redis(self, namespace: str, endpoint: str, seconds: float):
+        with self._lock:
+            self._get((namespace, endpoint)).redis_seconds.observe(seconds)
+
+    def observe_compute(self, namespace: str, endpoint: str, seconds: float):
+        with self._lock:
+            self._get((namespace, endpoint)).compute_seconds.observe(seconds)
+
+    def observe_payload(self, namespace: str, endpoint: str, size: int):
+        with self._lock:
+            self._get((namespace, endpoint)).payload_bytes.observe(size)
+
+    def record_hit(self, namespace: str = "unknown", endpoint: str = "unknown"):
+        """캐시 히트 기록"""
+        self.record(namespace, endpoint, RESULT_HIT)
+
+    def record_miss(self, namespace: str = "unknown", endpoint: str = "unknown"):
+        """캐시 미스 기록"""
+        self.record(namespace, endpoint, RESULT_MISS)
+
+    def record_error(self, namespace: str = "unknown", endpoint: str = "unknown"):
+        """캐시 에러 기록"""
+        self.record(namespace, endpoint, RESULT_ERROR)
+
+    # ==================== 조회 ====================
+
+    def _total(self, results: Sequence[str]) -> int:
+        return sum(m.results.get(r, 0) for m in self._metrics.values() for r in results)
+
+    @property
+    def hits(self) -> int:
+        return self._total(_HIT_RESULTS)
+
+    @property
+    def misses(self) -> int:
+        return self._total((RESULT_MISS,))
+
+    @property
+    def errors(self) -> int:
+        return self._total((RESULT_ERROR,))
+
+    def get_hit_rate(self) -> float:
+        """캐시 히트율 계산"""
+        hits, misses = self.hits, self.misses
+        total = hits + misses
+        if total == 0:
+            return 0.0
+        return (hits / total) * 100
+
+    def get_stats(self, namespace: Optional[str] = None) -> dict:
+        """통계 반환 (합계 + 엔드포인트별, namespace 를 지정하면 합계도 해당 네임스페이스만)"""
+        total_hits = total_misses = total_errors = 0
+        with self._lock:
+            endpoints = []
+            for (ns, endpoint), metrics in sorted(self._metrics.items()):
+                if namespace and ns != namespace:
+                    continue
+                hits = sum(metrics.results.get(r, 0) for r in _HIT_RESULTS)
+                misses = metrics.results.get(RESULT_MISS, 0)
+                total_hits += hits
+                total_misses += misses
+                total_errors += metrics.results.get(RESULT_ERROR, 0)
+                endpoints.append({
+                    "namespace": ns,
+                    "endpoint": endpoint,
+                    "results": dict(metrics.results),
+                    "hit_rate": f"{(hits / (hits + misses) * 100) if hits + misses else 0.0:.2f}%",
+                    "redis_seconds": metrics.redis_seconds.to_dict(),
+                    "compute_seconds": metrics.compute_seconds.to_dict(),
+                    "payload_bytes": metrics.payload_bytes.to_dict()
+                })
+
+        total_requests = total_hits + total_misses
+        return {
+            "hits": total_hits,
+            "misses": total_misses,
+            "errors": total_errors,
+            "hit_rate": f"{(total_hits / total_requests * 100) if total_requests else 0.0:.2f}%",
+            "total_requests": total_requests,
+            "endpoints": endpoints
+        }
+
+    def render_prometheus(self, prefix: str = "port_dashboard_cache") -> str:
+        """Prometheus 텍스트 노출 형식"""
+        with self._lock:
+            items = sorted(self._metrics.items())
+            lines = [
+                f"# HELP {prefix}_requests_total Cache lookups by result",
+                f"# TYPE {prefix}_requests_total counter",
+            ]
+            for (ns, endpoint), metrics in items:
+                for result, count in sorted(metrics.results.items()):
+                    lines.append(
+                        f'{prefix}_requests_total{{namespace="{ns}",endpoint="{endpoint}",result="{result}"}} {count}'
+                    )
+
+            for name, attr, help_text in (
+                ("redis_seconds", "redis_seconds", "Time spent in Redis calls"),
+                ("compute_seconds", "compute_seconds", "Time spent computing values on cache miss"),
+                ("payload_bytes", "payload_bytes", "Size of stored cache payloads"),
+            ):
+                metric = f"{prefix}_{name}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for (ns, endpoint), metrics in items:
+                    histogram = getattr(metrics, attr)
+                    if not histogram.count:
+                        continue
+                    labels = f'namespace="{ns}",endpoint="{endpoint}"'
+                    for le, count in histogram.cumulative():
+                        lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f"{metric}_sum{{{labels}}} {histogram.sum:.6f}")
+                    lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self._metrics.clear()
+
+
+# 전역 캐시 통계 인스턴스
+cache_stats = CacheStats()
@@ -0,0 +1,149 @@
+"""캐시 태그 모듈
+
+캐시 키를 하나 이상의 태그에 등록하고 태그 단위로 무효화합니다.
+태그별로 Redis Set({prefix}:tag:{tag})에 캐시 키를 모아 두므로,
+무효화 비용은 전체 키 공간(SCAN)이 아니라 해당 태그에 속한 키 수에 비례합니다.
+
+태그 규칙:
+    ns:{namespace}               네임스페이스 전체 (모든 캐시 키에 자동 등록)
+    ep:{namespace}:{endpoint}    엔드포인트 전체 (모든 캐시 키에 자동 등록)
+    source:{data_source}         데이터 소스 (품질 분석 엔진)
+    date:{YYYY-MM-DD}            검사 일자 등 날짜 단위
+
+@cached(tags=[...]) 에는 함수 인자를 치환하는 템플릿을 쓸 수 있습니다 (예: 'date:{end_date}').
+값이 None 인 인자를 참조하는 템플릿은 건너뜁니다.
+
+태그 Set 은 캐시 키를 만료 시각(초)을 점수로 하는 Sorted Set 이며, 등록/무효화 때마다
+이미 만료된 키를 ZREMRANGEBYSCORE 로 지우므로 트래픽이 계속되어도 살아 있는 키 수만큼만 유지됩니다.
+태그 Set 자체의 TTL 은 새 키가 기존 키보다 늦게 만료될 때만 늘려, 마지막 키와 함께 만료됩니다.
+이전 형식(Set)의 태그 키는 처음 접근할 때 Sorted Set 으로 변환합니다.
+"""
+
+from string import Formatter
+from typing import Any, Dict, Iterable, List
+
+from services.cache.cache_keys import CacheNamespace
+from config.redis_config import redis_settings
+
+# 태그 Set 에서 꺼낸 키를 한 번에 지울 수
+DELETE_BATCH = 500
+
+# 공통: 서버 시각(초), 이전 형식(Set) 태그 키 변환, 만료된 키 정리
+_SCRIPT_HELPERS = """
+local now = tonumber(redis.call('time')[1])
+local function prepare(key)
+    if redis.call('type', key).ok == 'set' then
+        local ttl = redis.call('ttl', key)
+        local members = redis.call('smembers', key)
+        redis.call('del', key)
+        local expire_at = now + math.max(ttl, 1)
+        for _, member in ipairs(members) do
+            redis.call('zadd', key, expire_at, member)
+        end
+        if ttl > 0 then
+            redis.call('expire', key, ttl)
+        end
+    end
+    redis.call('zremrangebyscore', key, '-inf', now)
+end
+"""
+
+# 태그 등록: 모든 태그 Set 에 캐시 키를 만료 시각과 함께 추가 (왕복 1회)
+# 태그 Set TTL 은 이 키가 기존 키보다 늦게 만료될 때만 연장
+_REGISTER_SCRIPT = _SCRIPT_HELPERS + """
+local ttl = tonumber(ARGV[2])
+for _, key in ipairs(KEYS) do
+    prepare(key)
+    redis.call('zadd', key, now + ttl, ARGV[1])
+    if redis.call('ttl', key) < ttl then
+        redis.call('expire', key, ttl)
+    end
+end
+return #KEYS
+"""
+
+# 태그 Set 에서 살아 있는 키를 읽고 바로 삭제 (그 사이 등록되는 키는 새 Set 에 들어가도록 원자적으로 처리)
+_POP_SCRIPT = _SCRIPT_HELPERS + """
+prepare(KEYS[1])
+local members = redis.call('zrange', KEYS[1], 0, -1)
+redis.call('del', KEYS[1])
+return members
+"""
+
+# 태그 Set 의 살아 있는 키 수
+_COUNT_SCRIPT = _SCRIPT_HELPERS + """
+prepare(KEYS[1])
+return redis.call('zcard', KEYS[1])
+"""
+
+
+def namespace_tag(namespace: str) -> str:
+    return f"ns:{namespace}"
+
+
+def endpoint_tag(namespace: str, endpoint: str) -> str:
+    return f"ep:{namespace}:{endpoint}"
+
+
+def source_tag(data_source: str) -> str:
+    return f"source:{data_source}"
+
+
+def date_tag(date: Any) -> str:
+    """날짜 태그 (date/datetime 이면 YYYY-MM-DD, 문자열은 앞 10자리)"""
+    if hasattr(date, "strftime"):
+        return f"date:{date.strftime('%Y-%m-%d')}"
+    return f"date:{str(date)[:10]}"
+
+
+def tag_key(tag: str, prefix: str = None) -> str:
+    """
+    태그 Set 키 (네임스페이스 키 형식과 겹치지 않도록 별도 네임스페이스 사용)
+
+    Examples:
+        >>> tag_key('ns:tc')
+        'port_dashboard:tag:ns:tc'
+    """
+    return f"{prefix or redis_settings.CACHE_PREFIX}:{CacheNamespace.TAG}:{tag}"
+
+
+def resolve_tags(namespace: str, endpoint: str, templates: Iterable[str],
+                 arguments: Dict[str, Any]) -> List[str]:
+    """캐시 키의 태그 목록 (기본 태그 + 인자로 치환한 템플릿 태그)"""
+    tags = [namespace_tag(namespace), endpoint_tag(namespace, endpoint)]
+    for template in templates:
+        fields = [name for _, name, _, _ in Formatter().parse(template) if name]
+        if any(arguments.get(name) is None for name in fields):
+            continue
+        tag = template.format(**arguments)
+        if tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+async def register_tags(redis_client, cache_key: str, tags: List[str], ttl: int, prefix: str = None):
+    """캐시 키를 태그 Set 에 등록 (ttl: 캐시 키의 Redis 보관 기간)"""
+    if not tags:
+        return
+    keys = [tag_key(tag, prefix) for tag in tags]
+    await redis_client.eval(_REGISTER_SCRIPT, len(keys), *keys, cache_key, int(ttl))
+
+
+async def delete_tagged(redis_client, tags: Iterable[str], prefix: str = None) -> int:
+    """
+    태그에 등록된 캐시 키와 태그 Set 삭제
+
+    Returns:
+        삭제된 캐시 키 수
+    """
+    deleted = 0
+    for tag in tags:
+        members = list(await redis_client.eval(_POP_SCRIPT, 1, tag_key(tag, prefix)))
+        for i in range(0, len(members), DELETE_BATCH):
+            deleted += await redis_client.delete(*members[i:i + DELETE_BATCH])
+    return deleted
+
+
+async def count_tagged(redis_client, tags: Iterable[str], prefix: str = None) -> Dict[str, int]:
+    """태그별 등록된 캐시 키 수 (만료된 키 제외)"""
+    return {tag: await redis_client.eval(_COUNT_SCRIPT, 1, tag_key(tag, prefix)) for tag in tags}
@@ -0,0 +1,252 @@
+"""캐시 예열 모듈
+
+@cached 가 적용된 모든 함수(cache_decorator.cached_functions)를 미리 계산해 두어
+배포 직후나 TTL 만료 직후 첫 요청이 느린 쿼리를 그대로 맞지 않도록 합니다.
+
+예열 시점:
+    - 서버 시작 시 (값이 없는 키만 계산)
+    - 주기적으로 CACHE_WARM_INTERVAL 마다 (남은 유효 시간이 간격보다 짧은 키 갱신)
+    - 캐시 무효화 이벤트 수신 후 (MQTT 검사 결과 저장, APISyncService 동기화 완료 → 해당 네임스페이스)
+
+예열 인자는 @cached(warm=[...]) 로 지정하며, 지정하지 않으면
+함수 기본값으로 한 번 (period 파라미터가 있으면 CACHE_WARM_PERIODS 별로) 호출합니다.
+필수 인자(경로 파라미터 등)가 있는 함수는 예열하지 않습니다.
+실패 응답(success: False)을 반환한 키는 저장되지 않으며 보고서에 error 로 남습니다.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi.params import Param
+from pydantic_core import PydanticUndefined
+
+from services.cache.redis_manager import redis_manager
+from services.cache.cache_decorator import cached_functions
+from services.cache.cache_keys import CacheNamespace
+from services.data_sources import DASHBOARD_DATA_SOURCES
+from services.quality_engine import get_quality_engine
+from config.redis_config import redis_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_warm_calls(func: Callable) -> List[Dict[str, Any]]:
+    """@cached 함수의 예열 인자 목록"""
+    config = func._cache_config
+    if config.get('warm') is not None:
+        return config['warm']
+
+    base = {}
+    parameters = signature(func).parameters
+    for name, param in parameters.items():
+        if param.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            continue
+        default = param.default
+        if default is Parameter.empty:
+            return []
+        # FastAPI Query(...) 기본값은 실제 값으로 풀어서 전달
+        if isinstance(default, Param):
+            if default.default in (PydanticUndefined, Ellipsis):
+                return []
+            base[name] = default.default
+
+    if 'period' in parameters:
+        return [{**base, 'period': period} for period in redis_settings.CACHE_WARM_PERIODS]
+    return [base]
+
+
+class CacheWarmer:
+    """동시 실행 수를 제한하여 캐시 키를 예열하고 키별 소요 시간을 보고"""
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self.concurrency = concurrency or redis_settings.CACHE_WARM_CONCURRENCY
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._schedule_task: Optional[asyncio.Task] = None
+        self._pending_namespaces: Set[str] = set()
+        self._pending_task: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+
+    def collect(self, namespaces: Optional[Iterable[str]] = None) -> List[Tuple[Callable, Dict[str, Any]]]:
+        """예열할 (함수, 인자) 목록"""
+        # 대시보드 페이지의 품질 분석 엔진은 미리 생성해 두어야 예열 대상에 포함됨
+        for key in DASHBOARD_DATA_SOURCES:
+            get_quality_engine(key)
+
+        namespaces = set(namespaces) if namespaces else None
+        calls = []
+        for func in list(cached_functions):
+            if namespaces and func._cache_config['namespace'] not in namespaces:
+                continue
+            for kwargs in get_warm_calls(func):
+                calls.append((func, kwargs))
+        return calls
+
+    async def warm(self, namespaces: Optional[Iterable[str]] = None, min_remaining: float = 0,
+                   reason: str = "manual") -> Optional[Dict[str, Any]]:
+        """
+        캐시 예열 실행
+
+        Args:
+            namespaces: 예열할 네임스페이스 (None 이면 전체)
+            min_remaining: 남은 유효 시간이 이보다 짧은 키만 다시 계산 (0 이면 값이 없는 키만)
+            reason: 로그/보고서용 실행 사유 (startup, schedule, invalidation, manual)
+
+        Returns:
+            예열 보고서 (다른 워커가 같은 예열을 실행 중이면 None)
+        """
+        namespaces = sorted(set(namespaces)) if namespaces else None
+        scope = ",".join(namespaces) if namespaces else "all"
+
+        # 여러 워커 중 한 곳에서만 실행
+        lock_key, token = await self._acquire_run_lock(scope)
+        if lock_key and token is None:
+            logger.info(f"ℹ️ 다른 워커에서 캐시 예열 중, 건너뜀: {scope} ({reason})")
+            return None
+
+        try:
+            calls = self.collect(namespaces)
+            semaphore = asyncio.Semaphore(self.concurrency)
+            started = time.perf_counter()
+
+            logger.info(f"🔥 캐시 예열 시작: {scope} ({reason}, {len(calls)}개 키, 동시 {self.concurrency})")
+            results = await asyncio.gather(*(
+                self._warm_one(semaphore, func, kwargs, min_remaining) for func, kwargs in calls
+            ))
+
+            report = {
+                "reason": reason,
+                "scope": scope,
+                "started_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "total_keys": len(results),
+                "refreshed": sum(1 for r in results if r["status"] == "refreshed"),
+                "fresh": sum(1 for r in results if r["status"] == "fresh"),
+                "errors": sum(1 for r in results if r["status"] == "error"),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "keys": sorted(results, key=lambda r: r["elapsed_ms"], reverse=True)
+            }
+            self.last_report = report
+            logger.info(
+                f"✅ 캐시 예열 완료: {scope} ({reason}) - 계산 {report['refreshed']}개, "
+                f"유지 {report['fresh']}개, 실패 {report['errors']}개, {report['elapsed_ms']}ms"
+            )
+            return report
+        finally:
+            await self._release_run_lock(lock_key, token)
+
+    async def _warm_one(self, semaphore: asyncio.Semaphore, func: Callable, kwargs: Dict[str, Any],
+                        min_remaining: float) -> Dict[str, Any]:
+        config = func._cache_config
+        result = {
+            "namespace": config['namespace'],
+            "endpoint": config['endpoint'],
+            "params": kwargs,
+        }
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                refreshed = await func.warm(min_remaining=min_remaining, **kwargs)
+                result["status"] = "refreshed" if refreshed else "fresh"
+            except Exception as e:
+                result["status"] = "error"
+                result["error"] = str(e)
+                logger.warning(f"⚠️ 캐시 예열 실패: {config['namespace']}:{config['endpoint']} {kwargs} - {e}")
+            result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        if result["status"] == "refreshed":
+            logger.info(
+                f"   🔥 {config['namespace']}:{config['endpoint']} {kwargs or ''} - {result['elapsed_ms']}ms"
+            )
+        return result
+
+    async def _acquire_run_lock(self, scope: str) -> Tuple[Optional[str], Optional[str]]:
+        """예열 실행 락 (Redis 미연결 시 락 없이 실행: (None, None))"""
+        try:
+            redis_client = redis_manager.get_client()
+        except RuntimeError:
+            return None, None
+
+        lock_key = f"{redis_settings.CACHE_PREFIX}:{CacheNamespace.LOCK}:warmer:{scope}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await redis_client.set(
+                lock_key, token, nx=True, px=redis_settings.CACHE_WARM_INTERVAL * 1000
+            )
+        except Exception as e:
+            logger.error(f"캐시 예열 락 획득 오류: {e}")
+            return None, None
+        return lock_key, (token if acquired else None)
+
+    async def _release_run_lock(self, lock_key: Optional[str], token: Optional[str]):
+        if not lock_key or not token:
+            return
+        try:
+            redis_client = redis_manager.get_client()
+            if await redis_client.get(lock_key) in (token, token.encode()):
+                await redis_client.delete(lock_key)
+        except Exception as e:
+            logger.error(f"캐시 예열 락 해제 오류: {e}")
+
+    # ==================== 백그라운드 실행 ====================
+
+    def start_background(self, reason: str = "startup") -> asyncio.Task:
+        """서버 시작을 막지 않도록 백그라운드에서 전체 예열"""
+        task = asyncio.create_task(self._run_safely(self.warm(reason=reason)))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    def start_schedule(self, interval: Optional[int] = None):
+        """주기적 예열 시작 (남은 유효 시간이 간격보다 짧은 키를 미리 갱신)"""
+        if self._schedule_task is not None:
+            return
+        interval = interval or redis_settings.CACHE_WARM_INTERVAL
+
+        async def loop():
+            while True:
+                await asyncio.sleep(interval)
+                await self._run_safely(self.warm(min_remaining=interval, reason="schedule"))
+
+        self._schedule_task = asyncio.create_task(loop())
+        logger.info(f"⏰ 주기적 캐시 예열 시작 (간격 {interval}초)")
+
+    def schedule_namespace(self, namespace: str):
+        """무효화된 네임스페이스 예열 예약 (CACHE_WARM_DEBOUNCE 동안 들어온 이벤트는 한 번에 처리)"""
+        self._pending_namespaces.add(namespace)
+        if self._pending_task is not None and not self._pending_task.done():
+            return
+
+        async def run_pending():
+            # 예열 중에 들어온 이벤트도 이어서 처리
+            while self._pending_namespaces:
+                await asyncio.sleep(redis_settings.CACHE_WARM_DEBOUNCE)
+                namespaces, self._pending_namespaces = self._pending_namespaces, set()
+                await self._run_safely(self.warm(namespaces, reason="invalidation"))
+
+        self._pending_task = asyncio.create_task(run_pending())
+
+    async def stop(self):
+        """예열 태스크 모두 중지"""
+        tasks = [t for t in (self._schedule_task, self._pending_task) if t is not None]
+        tasks.extend(self._background)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._schedule_task = self._pending_task = None
+        self._background.clear()
+
+    @staticmethod
+    async def _run_safely(coro):
+        try:
+            await coro
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 캐시 예열 오류: {e}")
+
+
+# 전역 예열기 인스턴스
+cache_warmer = CacheWarmer()
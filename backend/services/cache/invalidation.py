@@ -0,0 +1,233 @@
+"""캐시 무효화 모듈
+
+새 검사 결과/동기화 데이터가 저장되면 해당 네임스페이스(또는 태그)의 캐시 키를 삭제합니다.
+
+    - Redis pub/sub: db/cache_invalidation.py (MQTT 수신기, API 동기화 서비스)가
+      CACHE_INVALIDATION_CHANNEL 로 발행한 이벤트를 구독하여 처리
+    - 로컬: 같은 프로세스에서 invalidate_namespace() / invalidate_tags() 를 직접 호출
+    - L1: 워커별 메모리 캐시(services.cache.local_cache)의 같은 키도 함께 삭제
+      (각 워커가 채널을 구독하므로 모든 워커의 L1 이 함께 비워집니다)
+
+Redis 키는 태그 Set(services.cache.cache_tags)으로 찾으므로 키 공간 전체를 SCAN 하지 않습니다.
+네임스페이스 무효화는 ns:{namespace} 태그, 엔드포인트 무효화는 ep:{namespace}:{endpoint} 태그입니다.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from services.cache.redis_manager import redis_manager
+from services.cache.cache_keys import CacheKeyGenerator
+from services.cache.cache_tags import namespace_tag, endpoint_tag, delete_tagged
+from services.cache.local_cache import local_cache
+from config.redis_config import redis_settings
+
+logger = logging.getLogger(__name__)
+
+# 태그에서 네임스페이스를 알 수 있는 접두어 (무효화 후 캐시 예열 대상)
+_NAMESPACE_TAG_PREFIXES = ("ns:", "source:", "ep:")
+
+
+def get_invalidation_tags(namespace: str, endpoints: Optional[List[str]] = None) -> List[str]:
+    """
+    네임스페이스(또는 엔드포인트) 무효화 태그 목록
+
+    Examples:
+        >>> get_invalidation_tags('tc')
+        ['ns:tc']
+        >>> get_invalidation_tags('tc', ['quality_summary'])
+        ['ep:tc:quality_summary']
+    """
+    if not endpoints:
+        return [namespace_tag(namespace)]
+    return [endpoint_tag(namespace, endpoint) for endpoint in endpoints]
+
+
+def tag_namespace(tag: str) -> Optional[str]:
+    """태그가 가리키는 네임스페이스 (ns:tc, source:tc, ep:tc:summary → tc)"""
+    for tag_prefix in _NAMESPACE_TAG_PREFIXES:
+        if tag.startswith(tag_prefix):
+            return tag[len(tag_prefix):].split(":", 1)[0] or None
+    return None
+
+
+def invalidate_local(namespace: str, endpoints: Optional[List[str]] = None) -> int:
+    """L1 메모리 캐시에서 네임스페이스(또는 특정 엔드포인트) 키 삭제"""
+    prefix = redis_settings.CACHE_PREFIX
+    if not endpoints:
+        return local_cache.delete_prefix(f"{prefix}:{namespace}:")
+
+    deleted = 0
+    for endpoint in endpoints:
+        key = CacheKeyGenerator.generate(namespace, endpoint, prefix=prefix)
+        deleted += local_cache.delete(key)
+        deleted += local_cache.delete_prefix(f"{key}:")
+    return deleted
+
+
+async def invalidate_tags(tags: List[str]) -> int:
+    """
+    태그에 등록된 캐시 삭제 (L1 + Redis 태그 Set)
+
+    Returns:
+        삭제한 Redis 키 수 (Redis 미연결 시 L1 만 삭제하고 0)
+    """
+    local_deleted = local_cache.delete_tags(tags)
+
+    try:
+        redis_client = redis_manager.get_client()
+    except RuntimeError:
+        logger.info(f"🧹 L1 캐시 무효화: {tags} ({local_deleted}개 키 삭제)")
+        return 0
+
+    deleted = await delete_tagged(redis_client, tags)
+    logger.info(f"🧹 캐시 무효화: {tags} ({deleted}개 키 삭제)")
+    return deleted
+
+
+async def invalidate_namespace(namespace: str, endpoints: Optional[List[str]] = None) -> int:
+    """
+    네임스페이스(또는 특정 엔드포인트)의 캐시 삭제 (L1 + Redis)
+
+    Returns:
+        삭제한 Redis 키 수 (Redis 미연결 시 L1 만 삭제하고 0)
+    """
+    # 태그 없이 저장된 L1 항목까지 키 접두사로 삭제
+    invalidate_local(namespace, endpoints)
+    return await invalidate_tags(get_invalidation_tags(namespace, endpoints))
+
+
+def event_namespaces(event: Dict[str, Any]) -> List[str]:
+    """이벤트가 무효화하는 네임스페이스 목록 (캐시 예열 대상)"""
+    namespaces = {event.get("namespace")}
+    namespaces.update(tag_namespace(tag) for tag in event.get("tags") or [])
+    return sorted(ns for ns in namespaces if ns)
+
+
+async def handle_invalidation_event(event: Dict[str, Any]) -> int:
+    """무효화 이벤트 처리 (db/cache_invalidation.py 이벤트 형식)"""
+    namespace = event.get("namespace")
+    tags = list(event.get("tags") or [])
+    if not namespace and not tags:
+        logger.warning(f"⚠️ 네임스페이스/태그 없는 무효화 이벤트 무시: {event}")
+        return 0
+
+    logger.info(
+        f"📨 캐시 무효화 이벤트 수신: {namespace or ''} {tags or ''} "
+        f"(source={event.get('source')}, reference={event.get('reference')})"
+    )
+    deleted = 0
+    if namespace:
+        deleted += await invalidate_namespace(namespace, event.get("endpoints"))
+    if tags:
+        deleted += await invalidate_tags(tags)
+    return deleted
+
+
+async def publish_invalidation(namespace: Optional[str] = None, endpoints: Optional[List[str]] = None,
+                               tags: Optional[List[str]] = None, source: str = "backend",
+                               reference: Optional[str] = None) -> bool:
+    """
+    무효화 이벤트 발행 (다른 워커의 L1 도 비우도록, 관리 API 등에서 사용)
+
+    Returns:
+        발행 여부 (Redis 미연결 시 False)
+    """
+    try:
+        redis_client = redis_manager.get_client()
+    except RuntimeError:
+        return False
+
+    event = {
+        "namespace": namespace,
+        "endpoints": endpoints,
+        "tags": tags,
+        "source": source,
+        "reference": reference,
+        "timestamp": datetime.now().isoformat(),
+    }
+    try:
+        await redis_client.publish(
+            redis_settings.CACHE_INVALIDATION_CHANNEL, json.dumps(event, ensure_ascii=False)
+        )
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ 캐시 무효화 이벤트 발행 실패: {e}")
+        return False
+
+
+class CacheInvalidationSubscriber:
+    """Redis pub/sub 무효화 이벤트 구독기 (애플리케이션 lifespan 에서 시작/중지)"""
+
+    # 구독 연결이 끊겼을 때 재연결 대기 시간(초)
+    RETRY_DELAY = 5
+
+    def __init__(self, channel: Optional[str] = None):
+        self.channel = channel or redis_settings.CACHE_INVALIDATION_CHANNEL
+        self._task: Optional[asyncio.Task] = None
+        # 무효화 처리 후 호출할 콜백 (네임스페이스 인자, 예: 캐시 예열 예약)
+        self._listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, listener: Callable[[str], None]):
+        """무효화 처리 후 호출할 콜백 등록"""
+        self._listeners.append(listener)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """구독 태스크 시작"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._listen())
+        logger.info(f"📡 캐시 무효화 채널 구독 시작: {self.channel}")
+
+    async def stop(self):
+        """구독 태스크 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("📡 캐시 무효화 채널 구독 중지")
+
+    async def _listen(self):
+        while True:
+            pubsub = None
+            try:
+                pubsub = redis_manager.get_client().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        event = json.loads(message["data"])
+                        await handle_invalidation_event(event)
+                        for namespace in event_namespaces(event):
+                            for listener in self._listeners:
+                                listener(namespace)
+                    except Exception as e:
+                        logger.error(f"캐시 무효화 이벤트 처리 오류: {e}")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ 캐시 무효화 구독 오류, {self.RETRY_DELAY}초 후 재시도: {e}")
+                await asyncio.sleep(self.RETRY_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+
+# 전역 구독기 인스턴스
+cache_invalidation_subscriber = CacheInvalidationSubscriber()
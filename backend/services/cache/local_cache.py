@@ -0,0 +1,129 @@
+"""프로세스 내 L1 캐시 모듈
+
+Redis(L2) 앞단에서 자주 읽히는 캐시 키를 워커 메모리에 보관합니다.
+L1 히트는 Redis 왕복과 JSON 파싱 없이 파싱된 객체를 그대로 반환하므로,
+반환값은 여러 요청이 공유합니다. 호출자는 결과를 수정하지 말고 복사해서 사용해야 합니다.
+
+    - 항목 수(CACHE_L1_MAX_ENTRIES)와 크기 합계(CACHE_L1_MAX_BYTES, 직렬화 길이 기준)로 제한되는 LRU
+    - 항목별 TTL (Redis 사용 시 CACHE_L1_TTL 이하로 짧게 유지하여 다른 워커의 갱신을 빠르게 반영)
+    - 무효화 이벤트(services.cache.invalidation) 수신 시 해당 네임스페이스/태그 키 삭제
+      (태그는 항목에 함께 보관하므로 Redis 태그 Set 이 이미 삭제된 뒤에도 워커별로 정확히 삭제)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Tuple
+
+from config.redis_config import redis_settings
+
+# 조회 실패 표시 (None 도 캐시할 수 있는 값이므로 별도 객체 사용)
+MISSING = object()
+
+
+class LocalCache:
+    """크기/TTL 제한 LRU 캐시 (워커 단위)"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key → (value, 만료 시각(monotonic), 크기, 태그)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int, frozenset]]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """값 조회 (없거나 만료되면 default)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, expires_at, _, _ = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, size: int = 0, tags: Iterable[str] = ()):
+        """
+        값 저장
+
+        Args:
+            key: 캐시 키 (CacheKeyGenerator 형식)
+            value: 파싱된 값
+            ttl: 유지 시간(초), 0 이하이면 저장하지 않음
+            size: 크기 추정치 (직렬화 길이)
+            tags: 캐시 태그 (services.cache.cache_tags, delete_tags 로 삭제)
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, time.monotonic() + ttl, size, frozenset(tags))
+        self._total_bytes += size
+
+        # 가장 오래 사용하지 않은 항목부터 제거
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        if key in self._entries:
+            self._remove(key)
+            return True
+        return False
+
+    def delete_prefix(self, key_prefix: str) -> int:
+        """키 접두사로 삭제 (예: 'port_dashboard:tc:')"""
+        keys = [key for key in self._entries if key.startswith(key_prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def delete_tags(self, tags: Iterable[str]) -> int:
+        """태그 중 하나라도 가진 항목 삭제"""
+        tags = set(tags)
+        keys = [key for key, entry in self._entries.items() if not tags.isdisjoint(entry[3])]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self):
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _remove(self, key: str):
+        _, _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": f"{(self.hits / total * 100) if total else 0.0:.2f}%"
+        }
+
+
+# 워커별 전역 인스턴스
+local_cache = LocalCache(
+    max_entries=redis_settings.CACHE_L1_MAX_ENTRIES,
+    max_bytes=redis_settings.CACHE_L1_MAX_BYTES
+)
+
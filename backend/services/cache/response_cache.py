@@ -0,0 +1,245 @@
+"""직렬화된 응답 캐싱 모듈
+
+@cached(..., response=True) 로 지정한 엔드포인트는 Python 객체 대신
+최종 응답 바이트(JSON 직렬화 + 일정 크기 이상이면 압축)를 캐시합니다.
+캐시 히트 시 JSON 파싱/재직렬화 없이 바이트를 그대로 Response 로 반환합니다.
+
+    - 직렬화: orjson 이 설치되어 있으면 사용, 없으면 표준 json
+    - 압축: CACHE_RESPONSE_COMPRESSION ('gzip' | 'zstd' | 'none'),
+            CACHE_RESPONSE_COMPRESS_MIN_BYTES 이상일 때만 (zstd 는 zstandard 설치 시)
+    - 클라이언트가 해당 Content-Encoding 을 지원하지 않으면 반환 시 압축 해제
+
+Redis 에는 캐시 엔트리(JSON) 안에 본문을 base64 로 넣어 저장하므로
+Redis 클라이언트 설정(decode_responses)과 관계없이 동작합니다.
+
+조건부 요청 (대시보드 폴링):
+    - 응답을 만들 때 본문(압축 전) 해시로 강한 ETag 를, 생성 시각으로 Last-Modified 를 정해 함께 저장
+    - If-None-Match / If-Modified-Since 가 일치하면 본문 없이 304 Not Modified 반환
+      (캐시 히트이면 원본 함수 실행도, 직렬화도, 해시 계산도 하지 않음)
+    - 압축해서 보내는 경우 ETag 에 '-gzip' 같은 접미어를 붙여 표현(representation)별로 구분
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import time
+from contextvars import ContextVar
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+from config.redis_config import redis_settings
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 gzip 사용
+    zstandard = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+# 캐시 엔트리 안에서 응답 페이로드를 구분하는 표시
+RESPONSE_MARKER = "__cached_response__"
+
+# 현재 요청의 캐시 관련 헤더 (CacheRequestMiddleware 가 설정)
+accept_encoding_var: ContextVar[str] = ContextVar("accept_encoding", default="")
+if_none_match_var: ContextVar[str] = ContextVar("if_none_match", default="")
+if_modified_since_var: ContextVar[str] = ContextVar("if_modified_since", default="")
+
+_REQUEST_HEADER_VARS = {
+    b"accept-encoding": accept_encoding_var,
+    b"if-none-match": if_none_match_var,
+    b"if-modified-since": if_modified_since_var,
+}
+
+
+def _encode_json(data: Any) -> bytes:
+    """FastAPI 기본 응답과 같은 형태로 JSON 직렬화"""
+    data = jsonable_encoder(data)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _compression() -> Optional[str]:
+    algorithm = redis_settings.CACHE_RESPONSE_COMPRESSION
+    if algorithm == "zstd" and zstandard is None:
+        return "gzip"
+    if algorithm in ("gzip", "zstd"):
+        return algorithm
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return gzip.compress(body, compresslevel=5)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompress(body)
+    return gzip.decompress(body)
+
+
+def _hash_body(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 와 인코딩 접미어는 무시)"""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"').split("-", 1)[0] == etag:
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    try:
+        return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+class CachedResponse:
+    """캐시된 응답 본문 (직렬화/압축 완료 상태)"""
+
+    __slots__ = ("body", "encoding", "media_type", "status_code", "etag", "last_modified")
+
+    def __init__(self, body: bytes, encoding: Optional[str] = None,
+                 media_type: str = JSON_MEDIA_TYPE, status_code: int = 200,
+                 etag: Optional[str] = None, last_modified: Optional[float] = None):
+        self.body = body
+        self.encoding = encoding
+        self.media_type = media_type
+        self.status_code = status_code
+        # 본문 해시 (따옴표 없이 저장), 생성 시각 (epoch 초)
+        self.etag = etag or _hash_body(body)
+        self.last_modified = last_modified or time.time()
+
+    @classmethod
+    def build(cls, data: Any) -> "CachedResponse":
+        """함수 결과를 직렬화하고 크기가 크면 압축 (ETag 는 압축 전 본문 기준)"""
+        if isinstance(data, CachedResponse):
+            return data
+        body = _encode_json(data)
+        etag = _hash_body(body)
+        encoding = _compression()
+        if encoding and len(body) >= redis_settings.CACHE_RESPONSE_COMPRESS_MIN_BYTES:
+            return cls(_compress(body, encoding), encoding, etag=etag)
+        return cls(body, etag=etag)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """캐시 엔트리 저장용"""
+        return {
+            RESPONSE_MARKER: 1,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "encoding": self.encoding,
+            "media_type": self.media_type,
+            "status_code": self.status_code,
+            "etag": self.etag,
+            "last_modified": self.last_modified
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedResponse":
+        return cls(
+            base64.b64decode(data["body"]),
+            data.get("encoding"),
+            data.get("media_type", JSON_MEDIA_TYPE),
+            data.get("status_code", 200),
+            data.get("etag"),
+            data.get("last_modified")
+        )
+
+    def is_not_modified(self, if_none_match: str, if_modified_since: str) -> bool:
+        """조건부 요청 평가 (If-None-Match 가 있으면 If-Modified-Since 는 무시, RFC 7232)"""
+        if if_none_match:
+            return _etag_matches(if_none_match, self.etag)
+        if if_modified_since:
+            return _not_modified_since(if_modified_since, self.last_modified)
+        return False
+
+    def to_response(self, accept_encoding: Optional[str] = None, if_none_match: Optional[str] = None,
+                    if_modified_since: Optional[str] = None) -> Response:
+        """
+        HTTP 응답 생성
+
+        클라이언트가 저장된 압축 방식을 지원하면 압축된 바이트를 그대로 보내고,
+        지원하지 않으면 압축을 풀어서 보냅니다.
+        클라이언트가 가진 버전과 같으면 본문 없이 304 를 보냅니다.
+        """
+        if accept_encoding is None:
+            accept_encoding = accept_encoding_var.get()
+        if if_none_match is None:
+            if_none_match = if_none_match_var.get()
+        if if_modified_since is None:
+            if_modified_since = if_modified_since_var.get()
+
+        content_encoding = None
+        if self.encoding:
+            accepted = {part.split(";")[0].strip().lower() for part in accept_encoding.split(",")}
+            if self.encoding in accepted:
+                content_encoding = self.encoding
+
+        headers = {
+            "Vary": "Accept-Encoding",
+            # 매번 재검증 (바뀌지 않았으면 304 로 본문 전송 생략)
+            "Cache-Control": "no-cache",
+            "ETag": f'"{self.etag}-{content_encoding}"' if content_encoding else f'"{self.etag}"',
+            "Last-Modified": formatdate(self.last_modified, usegmt=True)
+        }
+        if self.status_code == 200 and self.is_not_modified(if_none_match, if_modified_since):
+            return Response(status_code=304, headers=headers)
+
+        body = self.body
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        elif self.encoding:
+            body = _decompress(body, self.encoding)
+
+        return Response(content=body, status_code=self.status_code, media_type=self.media_type, headers=headers)
+
+
+def is_cached_response_dict(value: Any) -> bool:
+    return isinstance(value, dict) and value.get(RESPONSE_MARKER) == 1
+
+
+class CacheRequestMiddleware:
+    """요청의 Accept-Encoding / 조건부 요청 헤더를 컨텍스트에 저장 (캐시된 응답 협상용, ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        values = {}
+        for name, value in scope.get("headers", []):
+            if name in _REQUEST_HEADER_VARS:
+                values[name] = value.decode("latin-1")
+
+        tokens = [(var, var.set(values.get(name, ""))) for name, var in _REQUEST_HEADER_VARS.items()]
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            for var, token in tokens:
+                var.reset(token)
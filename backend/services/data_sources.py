@@ -0,0 +1,144 @@
+"""Dashboard data sources
+
+data_inspection_results.data_source 컬럼에 저장되는 데이터 소스 키, 데이터 소스 레지스트리,
+원본 테이블명/inspection_id 로부터 키를 결정하는 규칙을 정의합니다.
+db/ 의 검사 결과 저장 서비스(data_inspection_service.py)도 이 모듈을 직접 import 하므로
+backend 의 다른 모듈에 의존하지 않도록 유지합니다.
+"""
+
+from typing import Optional, Dict, Any, List
+
+
+class DataSource:
+    """데이터 소스 키"""
+    AIS = "ais"
+    TOS = "tos"
+    TC = "tc"
+    QC = "qc"
+    YT = "yt"
+    VSSL_SPEC = "vssl_spec"
+    PORT_VSSL = "port_vssl"
+    TOS_VSSL = "tos_vssl"
+
+
+class DataSourceInfo:
+    """대시보드 데이터 소스 정의 (품질 분석 엔진/공용 라우터가 사용)"""
+
+    def __init__(self, key: str, label: str, table_name: str, description: str = "",
+                 route_prefix: Optional[str] = None):
+        self.key = key                  # data_inspection_results.data_source 값
+        self.label = label              # 응답/에러 메시지용 표시 이름
+        self.table_name = table_name    # 검사 대상 원본 테이블
+        self.description = description
+        # 기존 경로 규칙 /{route_prefix}-quality-summary 등에 쓰는 접두어
+        self.route_prefix = route_prefix or key.replace("_", "-")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "label": self.label,
+            "table_name": self.table_name,
+            "description": self.description,
+        }
+
+
+# 데이터 소스 레지스트리 (키 → 정의)
+DATA_SOURCE_REGISTRY: Dict[str, DataSourceInfo] = {}
+
+
+def register_data_source(key: str, label: str, table_name: str, description: str = "",
+                         route_prefix: Optional[str] = None) -> DataSourceInfo:
+    """데이터 소스 등록 (등록만 하면 /api/dashboard/quality/{key}/... 대시보드 API 사용 가능)"""
+    info = DataSourceInfo(key, label, table_name, description, route_prefix)
+    DATA_SOURCE_REGISTRY[key] = info
+    return info
+
+
+def get_data_source(key: str) -> Optional[DataSourceInfo]:
+    """등록된 데이터 소스 조회"""
+    return DATA_SOURCE_REGISTRY.get(key)
+
+
+def list_data_sources() -> List[DataSourceInfo]:
+    """등록된 데이터 소스 목록"""
+    return list(DATA_SOURCE_REGISTRY.values())
+
+
+# 전용 대시보드가 있는 데이터 소스
+register_data_source(DataSource.AIS, "AIS", "ais_info", "AIS 정보")
+register_data_source(DataSource.TOS, "TOS", "berth_schedule", "선석 계획")
+register_data_source(DataSource.TC, "TC", "tc_work_info", "TC 작업 정보")
+register_data_source(DataSource.QC, "QC", "qc_work_info", "QC 작업 정보")
+register_data_source(DataSource.YT, "YT", "yt_work_info", "YT 작업 정보")
+register_data_source(DataSource.VSSL_SPEC, "VsslSpecInfo", "vssl_spec_info", "선박 제원 정보")
+register_data_source(DataSource.PORT_VSSL, "PortMisVsslNo", "vssl_Port_VsslNo", "항만 선박번호 매칭 (PMIS→TOS)")
+register_data_source(DataSource.TOS_VSSL, "TosVsslNo", "vssl_Tos_VsslNo", "TOS 선박번호 매칭 (TOS→PMIS)")
+
+# 전용 대시보드 페이지가 있는 데이터 소스 (캐시 예열 대상)
+DASHBOARD_DATA_SOURCES = [
+    DataSource.AIS, DataSource.TOS, DataSource.TC, DataSource.QC, DataSource.YT,
+    DataSource.VSSL_SPEC, DataSource.PORT_VSSL, DataSource.TOS_VSSL,
+]
+
+# 그 밖의 동기화 대상 테이블 (db/sync_service/endpoint_mapper.py 의 api_table_mapping)
+# 데이터 소스 키는 resolve_data_source() 규칙대로 테이블명과 같음
+for _table_name, _description in [
+    ("cntr_load_unload_info", "컨테이너 양적하정보"),
+    ("cntr_report_detail", "컨테이너 신고상세정보"),
+    ("vssl_entr_report", "선박 입항신고정보"),
+    ("vssl_dprt_report", "선박 출항신고정보"),
+    ("vssl_history", "관제정보 (VTCHistory)"),
+    ("vssl_pass_report", "외항통과선박신청정보"),
+    ("cargo_imp_exp_report", "화물반출입신고정보"),
+    ("cargo_item_code", "화물품목코드"),
+    ("dg_imp_report", "위험물반입신고서"),
+    ("dg_manifest", "위험물 적하알림표"),
+    ("fac_use_statement", "항만시설사용 신청/결과정보"),
+    ("fac_use_stmt_bill", "항만시설사용신고정보-화물료"),
+    ("vssl_sec_isps_info", "선박보안인증서 통보"),
+    ("vssl_sec_port_info", "선박보안인증서 통보 경유지 정보"),
+    ("load_unload_from_to_info", "선박양적하 시작종료정보"),
+    ("vssl_sanction_info", "제재대상선박 정보"),
+]:
+    register_data_source(_table_name, _table_name, _table_name, _description)
+
+# 원본 테이블명 → 데이터 소스 키
+TABLE_DATA_SOURCES = {info.table_name: info.key for info in DATA_SOURCE_REGISTRY.values()}
+
+# 테이블명을 알 수 없을 때 inspection_id 로 판별하는 패턴 (앞쪽이 우선)
+INSPECTION_ID_PATTERNS = [
+    ("ais_info", DataSource.AIS),
+    ("ais_inspection", DataSource.AIS),
+    ("berth", DataSource.TOS),
+    ("tc_work", DataSource.TC),
+    ("tc_inspection", DataSource.TC),
+    ("qc_work", DataSource.QC),
+    ("qc_inspection", DataSource.QC),
+    ("yt_work", DataSource.YT),
+    ("yt_inspection", DataSource.YT),
+]
+
+# 데이터 소스를 결정하지 못한 검사 결과의 키 (일별 집계/필드 통계 기본 키가 NOT NULL 이므로 NULL 대신 빈 문자열)
+UNKNOWN_DATA_SOURCE = ""
+
+# 대시보드 page 파라미터 → 데이터 소스 키
+PAGE_DATA_SOURCES = {
+    "AIS": DataSource.AIS,
+    "TOS": DataSource.TOS,
+    "TC": DataSource.TC,
+    "QC": DataSource.QC,
+    "YT": DataSource.YT,
+}
+
+
+def resolve_data_source(inspection_id: str, table_name: Optional[str] = None) -> str:
+    """검사 결과의 데이터 소스 키 결정 (알려진 테이블 → inspection_id 패턴 → 테이블명 그대로 → UNKNOWN_DATA_SOURCE)"""
+    if table_name in TABLE_DATA_SOURCES:
+        return TABLE_DATA_SOURCES[table_name]
+
+    lowered = (inspection_id or "").lower()
+    for pattern, data_source in INSPECTION_ID_PATTERNS:
+        if pattern in lowered:
+            return data_source
+
+    return table_name or UNKNOWN_DATA_SOURCE
@@ -2,9 +2,11 @@
 
 import pymysql
 import sqlite3
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 from contextlib import contextmanager
 from config.settings import settings
+from config.database import get_db_connection
+from services.log_writer import log_api_call as enqueue_api_call_log, log_page_visit as enqueue_page_visit_log
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,19 +27,9 @@ class DatabaseService:
     
     @contextmanager
     def get_mysql_connection(self):
-        """MySQL 연결 컨텍스트 매니저"""
-        connection = None
-        try:
-            connection = pymysql.connect(**self.mysql_config)
+        """MySQL 연결 컨텍스트 매니저 (config.database 공용 커넥션 풀에서 대여)"""
+        with get_db_connection() as connection:
             yield connection
-        except Exception as e:
-            logger.error(f"MySQL 연결 실패: {e}")
-            if connection:
-                connection.rollback()
-            raise
-        finally:
-            if connection:
-                connection.close()
     
     @contextmanager
     def get_ais_connection(self):
@@ -92,6 +84,33 @@ class DatabaseService:
         except Exception as e:
             logger.error(f"AIS 쿼리 실행 실패: {e}")
             raise
+    
+    def iter_ais_query(self, query: str, params: tuple = (), batch_size: int = None) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """
+        AIS SQLite 쿼리 결과를 batch_size 행씩 반환 (스트리밍 응답용)
+        
+        SQLite 커서는 fetchmany 할 때마다 다음 행을 읽으므로 결과 전체를 메모리에 올리지 않습니다.
+        스트리밍 응답은 배치마다 다른 스레드에서 이어 읽을 수 있어 check_same_thread 를 끕니다
+        (한 번에 한 스레드만 사용). 중간에 끊겨도 close() 시 연결을 닫습니다.
+        
+        Yields:
+            (컬럼명 목록, 행 튜플 목록)
+        """
+        batch_size = batch_size or settings.ais_stream_batch_size
+        connection = sqlite3.connect(self.ais_db_path, check_same_thread=False)
+        try:
+            cursor = connection.execute(query, params)
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield columns, rows
+        except Exception as e:
+            logger.error(f"AIS 스트리밍 쿼리 실패: {e}")
+            raise
+        finally:
+            connection.close()
 
 class UIDataService:
     """UI 데이터 서비스 (기존 ui_data_service.py 기능 통합)"""
@@ -101,63 +120,105 @@ class UIDataService:
     
     def log_page_visit(self, user_id: str, page_name: str, page_url: str, 
                       login_status: str, visit_duration: int, session_id: str = None,
-                      ip_address: str = None, user_agent: str = None, referrer: str = None,
-                      visit_hour: int = None, visit_weekday: int = None) -> bool:
-        """페이지 방문 로그 저장"""
-        try:
-            query = """
-                INSERT INTO ui_log_page_visits 
-                (user_id, page_name, page_url, login_status, visit_duration, 
-                 session_id, ip_address, user_agent, referrer, visit_hour, visit_weekday)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            params = (user_id, page_name, page_url, login_status, visit_duration,
-                     session_id, ip_address, user_agent, referrer, visit_hour, visit_weekday)
-            
-            self.db_service.execute_query(query, params, fetch_all=False)
-            return True
-        except Exception as e:
-            logger.error(f"페이지 방문 로그 저장 실패: {e}")
-            return False
+                      ip_address: str = None, user_agent: str = None, referrer: str = None) -> bool:
+        """페이지 방문 로그 저장 (기록 큐에 추가, visit_hour/visit_weekday 는 수신 시각으로 계산)"""
+        return enqueue_page_visit_log(
+            user_id, page_name, page_url, login_status, visit_duration,
+            session_id=session_id, ip_address=ip_address, user_agent=user_agent, referrer=referrer
+        )
     
     def log_api_call(self, endpoint: str, method: str, status_code: int, 
                     response_time: int, user_id: str = None, ip_address: str = None,
                     user_agent: str = None) -> bool:
-        """API 호출 로그 저장"""
-        try:
-            query = """
-                INSERT INTO api_call_info 
-                (api_endpoint, request_params, response_status_code, response_time_ms, 
-                 data_retrieval_start_time, created_at)
-                VALUES (%s, %s, %s, %s, NOW(), NOW())
-            """
-            params = (endpoint, f'{{"method": "{method}"}}', status_code, response_time)
-            
-            self.db_service.execute_query(query, params, fetch_all=False)
-            return True
-        except Exception as e:
-            logger.error(f"API 호출 로그 저장 실패: {e}")
-            return False
+        """API 호출 로그 저장 (기록 큐에 추가, DB INSERT 는 services.log_writer 가 배치로 처리)"""
+        return enqueue_api_call_log(
+            endpoint, method, status_code, response_time,
+            user_id=user_id, ip_address=ip_address, user_agent=user_agent
+        )
 
 class AISService:
     """AIS 데이터 서비스 (기존 ais_service.py 기능 통합)"""
     
     def __init__(self, db_service: DatabaseService):
         self.db_service = db_service
+        self._columns: Optional[List[str]] = None
+    
+    def get_columns(self) -> List[str]:
+        """ais_info 컬럼 목록 (처음 한 번만 조회)"""
+        if self._columns is None:
+            rows = self.db_service.execute_ais_query("PRAGMA table_info(ais_info)")
+            self._columns = [row["name"] for row in rows]
+        return self._columns
+    
+    def build_query(self, fields: List[str] = None, where: str = "", params: tuple = (),
+                    after: int = None, limit: int = None) -> Tuple[str, tuple]:
+        """
+        ais_info 조회 쿼리 생성
+        
+        fields 를 지정하면 테이블에 있는 컬럼만 SELECT 하며, 맨 앞에는 항상 rowid(_rowid) 를 읽습니다.
+        after(rowid) 를 지정하면 rowid 순 키셋 페이지네이션으로 그 다음 행부터 읽습니다.
+        SQLite 인덱스는 rowid 를 포함하므로 (mmsiNo/flag/vsslTp = ?) 조건과 rowid 정렬을 한 인덱스로 처리합니다.
+        
+        Args:
+            fields: SELECT 할 컬럼 (None 이면 전체)
+            where: '?' 자리표시자 조건
+            params: where 파라미터
+            after: 이 rowid 보다 큰 행만 (rowid 순 정렬)
+            limit: 최대 행 수
+        """
+        if fields is None:
+            select_list = "rowid AS _rowid, *"
+        else:
+            table_columns = set(self.get_columns())
+            select_list = ", ".join(["rowid AS _rowid"] + [f'"{field}"' for field in fields if field in table_columns])
+        
+        conditions = [where] if where else []
+        params = tuple(params)
+        if after is not None:
+            conditions.append("rowid > ?")
+            params += (int(after),)
+        
+        query = f"SELECT {select_list} FROM ais_info"
+        if conditions:
+            query += " WHERE " + " AND ".join(f"({condition})" for condition in conditions)
+        if after is not None or limit:
+            query += " ORDER BY rowid"
+        if limit:
+            query += " LIMIT ?"
+            params += (int(limit),)
+        return query, params
+    
+    def load_rows(self, fields: List[str] = None, where: str = "", params: tuple = (),
+                  after: int = None, limit: int = None) -> Tuple[List[str], List[tuple]]:
+        """ais_info 조회 (컬럼명 목록, 행 목록) 반환, 첫 컬럼은 _rowid"""
+        query, params = self.build_query(fields, where, params, after, limit)
+        with self.db_service.get_ais_connection() as conn:
+            cursor = conn.execute(query, params)
+            columns = [description[0] for description in cursor.description]
+            return columns, cursor.fetchall()
     
     def load_all_data(self, limit: int = None) -> List[Dict[str, Any]]:
         """모든 AIS 데이터 로드"""
         try:
             query = "SELECT * FROM ais_info"
+            params = None
             if limit:
-                query += f" LIMIT {limit}"
+                query += " ORDER BY rowid LIMIT ?"
+                params = (int(limit),)
             
-            rows = self.db_service.execute_ais_query(query)
+            rows = self.db_service.execute_ais_query(query, params)
             return [dict(row) for row in rows] if rows else []
         except Exception as e:
             logger.error(f"AIS 데이터 로드 실패: {e}")
             return []
     
+    def iter_rows(self, where: str = "", params: tuple = (), limit: int = None,
+                  batch_size: int = None, fields: List[str] = None,
+                  after: int = None) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """ais_info 조회 결과를 배치 단위로 반환 (조건은 build_query 와 같음)"""
+        query, params = self.build_query(fields, where, params, after, limit)
+        return self.db_service.iter_ais_query(query, params, batch_size)
+    
     def load_by_mmsi(self, mmsi: str) -> List[Dict[str, Any]]:
         """MMSI로 AIS 데이터 검색"""
         try:
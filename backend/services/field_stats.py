@@ -0,0 +1,88 @@
+"""Per-field quality statistics
+
+필드별 분석 데이터를 field_quality_stats 테이블에서 조회합니다.
+필드명/건수는 검사 결과 저장 시(db/data_inspection_service.py) 미리 추출되어 있으므로
+조회 시 details JSON 파싱이나 정규식 매칭이 필요 없습니다.
+"""
+
+from typing import Dict, Any, List
+
+from config import execute_query_async
+from utils import calculate_pass_rate
+
+# 최신 검사 한 건: (data_source, created_at) 인덱스로 inspection_id 를 찾은 뒤 기본 키로 조회
+_LATEST_FIELD_STATS_QUERY = """
+    SELECT
+        f.field_name,
+        f.check_type,
+        f.total_rows,
+        f.pass_count,
+        f.fail_count,
+        f.error_count,
+        f.last_message
+    FROM field_quality_stats f
+    WHERE f.inspection_id = (
+        SELECT inspection_id FROM field_quality_stats
+        WHERE data_source = %s
+        ORDER BY created_at DESC
+        LIMIT 1
+    )
+    ORDER BY f.check_type, f.field_name
+"""
+
+# 최근 검사 여러 건 합산 (메시지는 가장 최근 검사의 것, 구분자는 ASCII RS)
+_RECENT_FIELD_STATS_QUERY = """
+    SELECT
+        f.field_name,
+        f.check_type,
+        MAX(f.total_rows) as total_rows,
+        SUM(f.pass_count) as pass_count,
+        SUM(f.fail_count) as fail_count,
+        MAX(f.error_count) as error_count,
+        SUBSTRING_INDEX(GROUP_CONCAT(f.last_message ORDER BY f.created_at DESC SEPARATOR '\x1e'), '\x1e', 1) as last_message
+    FROM field_quality_stats f
+    INNER JOIN (
+        SELECT inspection_id
+        FROM field_quality_stats
+        WHERE data_source = %s
+        GROUP BY inspection_id
+        ORDER BY MAX(created_at) DESC
+        LIMIT %s
+    ) recent ON f.inspection_id = recent.inspection_id
+    GROUP BY f.field_name, f.check_type
+    ORDER BY f.check_type, f.field_name
+"""
+
+
+async def fetch_field_statistics(data_source: str, recent_inspections: int = 1) -> List[Dict[str, Any]]:
+    """
+    데이터 소스의 필드별 검사 통계 조회
+
+    Args:
+        data_source: 데이터 소스 키 (services.data_sources.DataSource)
+        recent_inspections: 집계할 최근 검사 수 (기본: 최신 검사 1건)
+
+    Returns:
+        field_statistics 응답 형식의 목록
+        (field_name, check_type, total_checks, pass_count, fail_count, pass_rate, affected_rows, original_message)
+    """
+    if recent_inspections <= 1:
+        rows = await execute_query_async(_LATEST_FIELD_STATS_QUERY, [data_source])
+    else:
+        rows = await execute_query_async(_RECENT_FIELD_STATS_QUERY, [data_source, recent_inspections])
+
+    field_statistics = []
+    for field_name, check_type, total_rows, pass_count, fail_count, error_count, last_message in rows:
+        pass_count = int(pass_count or 0)
+        fail_count = int(fail_count or 0)
+        field_statistics.append({
+            "field_name": field_name,
+            "check_type": check_type,
+            "total_checks": int(total_rows or 0),  # 실제 검사한 데이터 행 수
+            "pass_count": pass_count,
+            "fail_count": fail_count,
+            "pass_rate": calculate_pass_rate(pass_count, pass_count + fail_count),
+            "affected_rows": int(error_count or 0),  # 오류/빈값 개수
+            "original_message": last_message or ""
+        })
+    return field_statistics
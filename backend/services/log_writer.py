@@ -0,0 +1,382 @@
+"""비동기 배치 로그 기록 모듈
+
+요청 처리 경로에서 DB INSERT 를 하지 않도록, 로그 행을 메모리 큐에 넣고
+백그라운드 태스크가 여러 행을 한 번의 multi-row INSERT 로 기록합니다.
+
+    - 큐 크기 제한 (가득 차면 버리고 dropped 카운터 증가, 요청은 절대 대기하지 않음)
+    - batch_size 행이 모이거나 flush_interval 이 지나면 기록
+    - 기록 실패 시 해당 배치를 버리고 failed 카운터 증가 (재시도로 큐가 밀리지 않도록, 교착 상태만 재시도)
+    - 종료 시 큐에 남은 행을 모두 기록 (stop)
+    - rollup 함수가 있으면 원본 INSERT 와 같은 트랜잭션에서 집계 테이블을 갱신 (services.ui_rollup)
+
+기록기:
+    api_call_log_writer     api_call_info (ApiCallLogMiddleware)
+    page_visit_log_writer   ui_log_page_visits (/ui/log/page-visit, /ui/log/page-visits:batch)
+
+enqueue() 는 이벤트 루프 밖(스레드풀의 동기 함수 등)에서 호출해도 안전합니다.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from config import settings, get_async_connection
+from services.ui_rollup import create_ui_rollup_tables, rollup_api_calls, rollup_page_visits
+
+logger = logging.getLogger(__name__)
+
+# 교착 상태(1213) / 잠금 대기 시간 초과(1205) 는 배치 전체를 다시 시도
+RETRYABLE_ERROR_CODES = (1213, 1205)
+WRITE_RETRIES = 2
+
+
+class BatchLogWriter:
+    """메모리 큐 + 백그라운드 multi-row INSERT 기록기"""
+
+    def __init__(self, name: str, query: str, max_queue: Optional[int] = None,
+                 batch_size: Optional[int] = None, flush_interval: Optional[float] = None,
+                 rollup: Optional[Callable[[Any, list], Awaitable[None]]] = None):
+        """
+        Args:
+            name: 로그/통계 표시 이름 (보통 테이블명)
+            query: 한 행용 INSERT 쿼리 (INSERT INTO t (...) VALUES (%s, ...)), executemany 로 여러 행을 한 번에 기록
+            rollup: 배치를 집계 테이블에 반영하는 함수 async (cursor, batch), 원본 INSERT 와 같은 트랜잭션에서 실행
+            max_queue: 큐 최대 행 수. None이면 settings.log_queue_size
+            batch_size: 한 번에 기록할 최대 행 수. None이면 settings.log_batch_size
+            flush_interval: 최대 기록 간격(초). None이면 settings.log_flush_interval_ms
+        """
+        self.name = name
+        self.query = query
+        self.rollup = rollup
+        self.max_queue = max_queue or settings.log_queue_size
+        self.batch_size = batch_size or settings.log_batch_size
+        self.flush_interval = flush_interval or settings.log_flush_interval_ms / 1000
+
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_error: Optional[str] = None
+        self.last_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, row: Sequence[Any]) -> bool:
+        """
+        로그 행 추가 (대기 없음)
+
+        Returns:
+            큐에 넣었으면 True, 큐가 가득 차서 버렸으면 False
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append(tuple(row))
+            self.enqueued += 1
+            full = len(self._queue) >= self.batch_size
+
+        if full:
+            self._notify()
+        return True
+
+    def _notify(self):
+        """batch_size 가 찼으면 기록 태스크를 바로 깨움"""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _take_batch(self) -> list:
+        with self._lock:
+            count = min(len(self._queue), self.batch_size)
+            return [self._queue.popleft() for _ in range(count)]
+
+    async def flush(self) -> int:
+        """큐에 쌓인 행을 모두 기록하고 기록한 행 수 반환"""
+        written = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return written
+            written += await self._write(batch)
+
+    async def _write(self, batch: list) -> int:
+        started = time.perf_counter()
+        for attempt in range(WRITE_RETRIES + 1):
+            try:
+                async with get_async_connection() as connection:
+                    await connection.begin()
+                    async with connection.cursor() as cursor:
+                        # INSERT ... VALUES (...) 는 executemany 가 multi-row INSERT 한 번으로 보냄
+                        await cursor.executemany(self.query, batch)
+                        if self.rollup is not None:
+                            await self.rollup(cursor, batch)
+                    await connection.commit()
+                break
+            except Exception as e:
+                error_code = e.args[0] if e.args else None
+                if error_code in RETRYABLE_ERROR_CODES and attempt < WRITE_RETRIES:
+                    logger.warning(f"⚠️ {self.name} 로그 기록 재시도 ({attempt + 1}/{WRITE_RETRIES}): {e}")
+                    continue
+                self.failed += len(batch)
+                self.last_error = str(e)
+                logger.error(f"❌ {self.name} 로그 {len(batch)}건 기록 실패: {e}")
+                return 0
+
+        self.written += len(batch)
+        self.batches += 1
+        self.last_flush_ms = round((time.perf_counter() - started) * 1000, 1)
+        return len(batch)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ {self.name} 로그 기록 오류: {e}")
+
+    def start(self):
+        """기록 태스크 시작 (애플리케이션 lifespan / startup 에서 호출)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"📝 {self.name} 배치 로그 기록 시작 "
+            f"(큐 {self.max_queue}, 배치 {self.batch_size}행, 간격 {self.flush_interval * 1000:.0f}ms)"
+        )
+
+    async def stop(self, timeout: float = 10.0):
+        """기록 태스크 중지 후 남은 행 기록"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            written = await asyncio.wait_for(self.flush(), timeout=timeout)
+            if written:
+                logger.info(f"📝 {self.name} 종료 전 로그 {written}건 기록")
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ {self.name} 종료 전 로그 기록 시간 초과 ({len(self._queue)}건 남음)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 반환"""
+        return {
+            "name": self.name,
+            "running": self.running,
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval_ms": round(self.flush_interval * 1000),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "last_flush_ms": self.last_flush_ms,
+            "last_error": self.last_error
+        }
+
+    def render_prometheus(self, prefix: str = "port_dashboard_log_writer") -> str:
+        """Prometheus 텍스트 노출 형식"""
+        labels = f'writer="{self.name}"'
+        lines = []
+        for metric, kind, value in (
+            ("rows_enqueued_total", "counter", self.enqueued),
+            ("rows_written_total", "counter", self.written),
+            ("rows_dropped_total", "counter", self.dropped),
+            ("rows_failed_total", "counter", self.failed),
+            ("batches_total", "counter", self.batches),
+            ("queue_rows", "gauge", len(self._queue)),
+        ):
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            lines.append(f"{prefix}_{metric}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# ==================== API 호출 로그 ====================
+
+API_CALL_INSERT_QUERY = """
+    INSERT INTO api_call_info
+    (api_endpoint, request_params, response_status_code, response_time_ms,
+     data_retrieval_start_time, created_at, user_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+# 전역 API 호출 로그 기록기
+api_call_log_writer = BatchLogWriter("api_call_info", API_CALL_INSERT_QUERY, rollup=rollup_api_calls)
+
+
+def log_api_call(endpoint: str, method: str, status_code: int, response_time_ms: int,
+                 started_at: Optional[datetime] = None, user_id: Optional[str] = None,
+                 **request_info: Any) -> bool:
+    """
+    API 호출 로그를 기록 큐에 추가 (DB 기록은 백그라운드)
+
+    Args:
+        endpoint: 요청 경로
+        method: HTTP 메서드
+        status_code: 응답 상태 코드
+        response_time_ms: 응답 시간(밀리초)
+        started_at: 요청 시작 시각
+        user_id: 호출한 사용자 (user_id 컬럼, /ui/logs/api-calls?user_id= 필터)
+        **request_info: request_params(JSON)에 함께 저장할 값 (query, session_id, ip_address 등, None 은 제외)
+    """
+    params = {"method": method}
+    params.update({key: value for key, value in request_info.items() if value is not None})
+    now = datetime.now()
+    return api_call_log_writer.enqueue((
+        endpoint,
+        json.dumps(params, ensure_ascii=False),
+        status_code,
+        response_time_ms,
+        started_at or now,
+        now,
+        user_id
+    ))
+
+
+# ==================== 페이지 방문 로그 ====================
+
+PAGE_VISIT_INSERT_QUERY = """
+    INSERT INTO ui_log_page_visits
+    (user_id, page_name, page_url, login_status, visit_duration,
+     session_id, ip_address, user_agent, referrer, visit_hour, visit_weekday, created_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# 전역 페이지 방문 로그 기록기
+page_visit_log_writer = BatchLogWriter("ui_log_page_visits", PAGE_VISIT_INSERT_QUERY, rollup=rollup_page_visits)
+
+
+def log_page_visit(user_id: str, page_name: str, page_url: str, login_status: str = "visit",
+                   visit_duration: Optional[int] = None, session_id: Optional[str] = None,
+                   ip_address: Optional[str] = None, user_agent: Optional[str] = None,
+                   referrer: Optional[str] = None, visited_at: Optional[datetime] = None,
+                   received_at: Optional[datetime] = None) -> bool:
+    """
+    페이지 방문 로그를 기록 큐에 추가 (DB 기록은 백그라운드)
+
+    Args:
+        visited_at: 클라이언트가 보낸 방문 시각 (visit_hour, visit_weekday 도 이 값으로 계산).
+            None이면 수신 시각, 범위를 벗어나면
+            [received_at - page_visit_max_delay_minutes, received_at] 로 맞춤
+        received_at: 서버 수신 시각. None이면 현재 시각
+    """
+    received_at = received_at or datetime.now()
+    visited_at = visited_at or received_at
+    if visited_at.tzinfo is not None:
+        # 클라이언트가 보낸 시각(UTC 등)은 서버 로컬 시각으로 맞춰 created_at 과 같은 기준으로 저장
+        visited_at = visited_at.astimezone().replace(tzinfo=None)
+    # 클라이언트 시계/임의 값이 시간별 집계와 keyset 페이지 순서를 흐트러뜨리지 않도록 수신 시각 기준으로 제한
+    earliest = received_at - timedelta(minutes=settings.page_visit_max_delay_minutes)
+    visited_at = min(max(visited_at, earliest), received_at)
+    return page_visit_log_writer.enqueue((
+        user_id,
+        page_name,
+        page_url,
+        login_status,
+        visit_duration,
+        session_id,
+        ip_address,
+        user_agent,
+        referrer,
+        visited_at.hour,
+        visited_at.weekday(),
+        visited_at
+    ))
+
+
+# ==================== 기록기 관리 ====================
+
+log_writers = [api_call_log_writer, page_visit_log_writer]
+
+
+async def start_log_writers():
+    """집계 테이블 확인 후 모든 로그 기록 태스크 시작 (커넥션 풀 생성 후)"""
+    try:
+        await create_ui_rollup_tables()
+    except Exception as e:
+        logger.warning(f"⚠️ UI 집계 테이블 생성 실패: {e}")
+    for writer in log_writers:
+        writer.start()
+
+
+async def stop_log_writers(timeout: float = 10.0):
+    """모든 로그 기록 태스크 중지 및 남은 행 기록 (커넥션 풀 종료 전)"""
+    for writer in log_writers:
+        await writer.stop(timeout)
+
+
+class ApiCallLogMiddleware:
+    """API 호출 로그 ASGI 미들웨어 (응답 후 큐에 넣기만 하므로 응답 시간에 DB 기록이 포함되지 않음)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if (scope["type"] != "http" or not settings.api_log_enabled
+                or path.startswith(tuple(settings.api_log_exclude_paths))):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = datetime.now()
+        started = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            headers = {name: value for name, value in scope.get("headers", [])
+                       if name in (b"x-user-id", b"x-session-id")}
+            client = scope.get("client")
+            log_api_call(
+                endpoint=path,
+                method=scope.get("method", ""),
+                status_code=status["code"],
+                response_time_ms=int((time.perf_counter() - started) * 1000),
+                started_at=started_at,
+                query=scope.get("query_string", b"").decode("latin-1") or None,
+                user_id=headers.get(b"x-user-id", b"anonymous").decode("latin-1"),
+                session_id=headers[b"x-session-id"].decode("latin-1") if b"x-session-id" in headers else None,
+                ip_address=client[0] if client else None
+            )
@@ -0,0 +1,293 @@
+"""Quality analytics engine
+
+데이터 소스 하나에 대한 품질 분석(요약/최신 결과/히스토리/필드 분석)을 제공합니다.
+모든 데이터 소스가 같은 쿼리와 캐시 규칙을 공유하므로,
+쿼리 최적화나 캐싱은 이 모듈에서 한 번만 적용하면 됩니다.
+"""
+
+from typing import Optional, Dict, Any, List
+
+from config import execute_query_async, gather_queries
+from utils import calculate_pass_rate, create_response_data
+from config.redis_config import redis_settings, get_ttl_for_endpoint
+
+from services.cache.cache_decorator import cached
+from services.cache.cache_keys import CacheEndpoint
+from services.cache.cache_tags import source_tag
+from services.data_sources import DataSource, DataSourceInfo, get_data_source
+from services.field_stats import fetch_field_statistics
+from services.quality_rollup import fetch_quality_history
+from services.quality_stats import fetch_quality_stats
+
+# 대시보드에 표시하는 검사 유형
+CHECK_TYPES = ("completeness", "validity")
+
+_SEVERITY_QUERY = """
+    SELECT
+        severity,
+        COUNT(*) as count,
+        check_type
+    FROM data_inspection_results
+    WHERE data_source = %s AND severity IS NOT NULL
+    GROUP BY severity, check_type
+    ORDER BY count DESC
+"""
+
+_RECENT_RESULTS_QUERY = """
+    SELECT
+        inspection_id,
+        check_type,
+        check_name,
+        status,
+        message,
+        affected_rows,
+        created_at
+    FROM data_inspection_results
+    WHERE data_source = %s
+    ORDER BY created_at DESC
+    LIMIT %s
+"""
+
+# 전용 라우트가 기본값과 다른 인자로 호출하는 메서드 (캐시 예열 시 같은 키를 만들기 위해)
+_ROUTE_CALL_ARGS = {
+    DataSource.VSSL_SPEC: {
+        "inspection_history": {"limit": 30, "descending": True},
+        "field_analysis_response": {"include_severity": False},
+    },
+    DataSource.PORT_VSSL: {
+        "inspection_history": {"limit": 30},
+        "field_analysis": {"recent_inspections": 5, "include_severity": False},
+    },
+    DataSource.TOS_VSSL: {
+        "inspection_history": {"limit": 30},
+        "field_analysis": {"recent_inspections": 5, "include_severity": False},
+    },
+}
+
+
+class QualityEngine:
+    """데이터 소스별 품질 분석 엔진
+
+    조회 메서드는 데이터 소스 키를 캐시 네임스페이스로 하여 Redis 에 캐싱됩니다.
+    (예: port_dashboard:tc:quality_summary)
+    """
+
+    def __init__(self, source: DataSourceInfo):
+        self.source = source
+        namespace = source.key
+        tags = [source_tag(source.key)]
+
+        self.quality_summary = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.QUALITY_SUMMARY,
+            ttl=get_ttl_for_endpoint('summary'),
+            stale_ttl=redis_settings.CACHE_STALE_TTL,
+            tags=tags
+        )(self._quality_summary)
+        self.latest_results = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.QUALITY_STATUS,
+            ttl=get_ttl_for_endpoint('realtime'),
+            tags=tags
+        )(self._latest_results)
+        self.recent_results = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.QUALITY_DETAILS,
+            ttl=get_ttl_for_endpoint('realtime'),
+            key_params=['limit'],
+            tags=tags
+        )(self._recent_results)
+        self.inspection_history = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.INSPECTION_HISTORY,
+            ttl=get_ttl_for_endpoint('history'),
+            key_params=['period', 'start_date', 'end_date', 'limit', 'descending'],
+            warm=self._warm_calls("inspection_history", with_periods=True),
+            tags=tags
+        )(self._inspection_history)
+        self.field_analysis = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.FIELD_ANALYSIS,
+            ttl=get_ttl_for_endpoint('detail'),
+            key_params=['recent_inspections', 'include_severity'],
+            warm=self._warm_calls("field_analysis"),
+            tags=tags
+        )(self._field_analysis)
+        # 라우트용: 직렬화/압축된 응답 바이트를 캐싱 (ETag 조건부 요청 지원, 필드 분석은 응답이 큼)
+        self.quality_summary_response = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.QUALITY_SUMMARY_RESPONSE,
+            ttl=get_ttl_for_endpoint('summary'),
+            stale_ttl=redis_settings.CACHE_STALE_TTL,
+            response=True,
+            tags=tags
+        )(self._quality_summary_response)
+        self.latest_results_response = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.QUALITY_STATUS_RESPONSE,
+            ttl=get_ttl_for_endpoint('realtime'),
+            response=True,
+            tags=tags
+        )(self._latest_results_response)
+        self.inspection_history_response = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.INSPECTION_HISTORY_RESPONSE,
+            ttl=get_ttl_for_endpoint('history'),
+            key_params=['period', 'start_date', 'end_date'],
+            response=True,
+            warm=self._warm_calls("inspection_history_response", with_periods=True),
+            tags=tags
+        )(self._inspection_history_response)
+        self.field_analysis_response = cached(
+            namespace=namespace,
+            endpoint=CacheEndpoint.FIELD_ANALYSIS_RESPONSE,
+            ttl=get_ttl_for_endpoint('detail'),
+            key_params=['recent_inspections', 'include_severity'],
+            response=True,
+            warm=self._warm_calls("field_analysis_response"),
+            tags=tags
+        )(self._field_analysis_response)
+
+    def _warm_calls(self, method: str, with_periods: bool = False) -> List[Dict[str, Any]]:
+        """캐시 예열 인자 목록 (기본값 + 전용 라우트 호출 인자)"""
+        variants = [{}]
+        route_args = _ROUTE_CALL_ARGS.get(self.source.key, {}).get(method)
+        if route_args:
+            variants.append(route_args)
+        if with_periods:
+            return [
+                {"period": period, **variant}
+                for variant in variants
+                for period in redis_settings.CACHE_WARM_PERIODS
+            ]
+        return variants
+
+    async def _quality_summary(self) -> Dict[str, Any]:
+        """전체 및 검사 유형별 품질 요약"""
+        stats = await fetch_quality_stats("r.data_source = %s", [self.source.key])
+        overall = stats.overall
+        last_inspection = stats.last_inspection
+
+        summary = {
+            "total_inspections": overall["total_inspections"],
+            "total_checks": overall["total_checks"],
+            "pass_count": overall["pass_count"],
+            "fail_count": overall["fail_count"],
+            "pass_rate": overall["pass_rate"],
+            "last_inspection_date": last_inspection.strftime('%Y-%m-%d') if last_inspection else None,
+        }
+        for check_type in CHECK_TYPES:
+            summary[check_type] = stats.summary(check_type)
+        return summary
+
+    async def _latest_results(self) -> Dict[str, Any]:
+        """최신 검사 1건의 검사 유형별 통과/실패"""
+        stats = await fetch_quality_stats("r.data_source = %s", [self.source.key], latest_only=True)
+
+        latest_results = {}
+        for check_type in CHECK_TYPES:
+            check_stats = stats.check_type(check_type)
+            pass_count, fail_count = check_stats["pass_count"], check_stats["fail_count"]
+            latest_results[check_type] = {
+                "passCount": pass_count,
+                "failCount": fail_count,
+                "passRate": calculate_pass_rate(pass_count, pass_count + fail_count)
+            }
+        return latest_results
+
+    async def _recent_results(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 검사 결과 행"""
+        rows = await execute_query_async(_RECENT_RESULTS_QUERY, [self.source.key, limit])
+        return [
+            {
+                "inspection_id": row[0],
+                "check_type": row[1],
+                "check_name": row[2],
+                "status": row[3],
+                "message": row[4],
+                "affected_rows": row[5],
+                "created_at": row[6].isoformat() if row[6] else None
+            } for row in rows
+        ]
+
+    async def _inspection_history(
+        self,
+        period: str = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 50,
+        descending: bool = False
+    ) -> List[Dict[str, Any]]:
+        """기간별 검사 히스토리 (대시보드 차트 형식)"""
+        history = await fetch_quality_history(
+            self.source.key, period, start_date, end_date, limit=limit, descending=descending
+        )
+        return [
+            {
+                "date": row["period_label"],
+                "score": row["pass_rate"],
+                "totalChecks": row["total_checks"],
+                "passedChecks": row["pass_count"],
+                "failedChecks": row["fail_count"],
+                "completenessRate": row["completeness_rate"],
+                "validityRate": row["validity_rate"]
+            } for row in history
+        ]
+
+    async def _field_analysis(self, recent_inspections: int = 1, include_severity: bool = True) -> Dict[str, Any]:
+        """필드별 분석 및 심각도 분포"""
+        if include_severity:
+            field_statistics, severity_stats = await gather_queries(
+                fetch_field_statistics(self.source.key, recent_inspections),
+                execute_query_async(_SEVERITY_QUERY, [self.source.key])
+            )
+        else:
+            field_statistics = await fetch_field_statistics(self.source.key, recent_inspections)
+            severity_stats = []
+
+        return {
+            "field_statistics": field_statistics,
+            "severity_distribution": [
+                {
+                    "severity": row[0],
+                    "count": row[1],
+                    "check_type": row[2]
+                } for row in severity_stats
+            ]
+        }
+
+    async def _quality_summary_response(self) -> Dict[str, Any]:
+        """품질 요약 표준 응답"""
+        return create_response_data([await self.quality_summary()])
+
+    async def _latest_results_response(self) -> Dict[str, Any]:
+        """최신 검사 결과 표준 응답"""
+        return create_response_data(await self.latest_results())
+
+    async def _inspection_history_response(
+        self,
+        period: str = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """검사 히스토리 응답 (차트 데이터 목록 그대로)"""
+        return await self.inspection_history(period, start_date, end_date)
+
+    async def _field_analysis_response(self, recent_inspections: int = 1,
+                                       include_severity: bool = True) -> Dict[str, Any]:
+        """필드 분석 표준 응답 (create_response_data 형식)"""
+        return create_response_data([await self._field_analysis(recent_inspections, include_severity)])
+
+
+_engines: Dict[str, QualityEngine] = {}
+
+
+def get_quality_engine(key: str) -> Optional[QualityEngine]:
+    """등록된 데이터 소스의 품질 분석 엔진 (없으면 None)"""
+    engine = _engines.get(key)
+    if engine is None:
+        source = get_data_source(key)
+        if source is None:
+            return None
+        engine = _engines[key] = QualityEngine(source)
+    return engine
@@ -0,0 +1,96 @@
+"""Inspection history over the daily quality rollup
+
+검사 히스토리(일/주/월별 통과율)를 data_inspection_results 원본 대신
+quality_daily_rollup 일별 집계 테이블에서 계산합니다.
+집계는 db/data_inspection_service.py 가 검사 결과 저장 시 갱신하고,
+db/backfill_quality_rollup.py 로 다시 만들 수 있습니다.
+"""
+
+from typing import Optional, Dict, Any, List
+
+from config import execute_query_async
+from utils import calculate_pass_rate, get_sql_date_condition, get_sql_group_by
+
+# 안쪽: 기간 × check_type 합계, 바깥쪽: 기간 합계
+# 검사 수는 check_type 별 검사 수 중 최댓값 (한 검사가 여러 check_type 을 포함하므로)
+_HISTORY_QUERY = """
+    SELECT
+        MIN(period_label) as period_label,
+        period_key,
+        MAX(inspection_count) as total_inspections,
+        SUM(total_checks) as total_checks,
+        SUM(pass_count) as pass_count,
+        SUM(fail_count) as fail_count,
+        SUM(CASE WHEN check_type = 'completeness' THEN pass_count ELSE 0 END) as completeness_pass,
+        SUM(CASE WHEN check_type = 'completeness' THEN total_checks ELSE 0 END) as completeness_total,
+        SUM(CASE WHEN check_type = 'validity' THEN pass_count ELSE 0 END) as validity_pass,
+        SUM(CASE WHEN check_type = 'validity' THEN total_checks ELSE 0 END) as validity_total
+    FROM (
+        SELECT
+            MIN({date_format}) as period_label,
+            {group_by} as period_key,
+            check_type,
+            SUM(total_checks) as total_checks,
+            SUM(pass_count) as pass_count,
+            SUM(fail_count) as fail_count,
+            SUM(inspection_count) as inspection_count
+        FROM quality_daily_rollup
+        WHERE data_source = %s
+        {date_condition}
+        GROUP BY {group_by}, check_type
+    ) t
+    GROUP BY period_key
+    ORDER BY period_key {order}
+    LIMIT %s
+"""
+
+
+async def fetch_quality_history(
+    data_source: str,
+    period: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 50,
+    descending: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    데이터 소스의 기간별 검사 히스토리 조회
+
+    Args:
+        data_source: 데이터 소스 키 (services.data_sources.DataSource)
+        period: daily, weekly, monthly, custom
+        start_date / end_date: custom 기간 (YYYY-MM-DD)
+        limit: 최대 기간 수
+        descending: True 이면 최근 기간부터
+
+    Returns:
+        기간별 집계 목록 (period_label, total_checks, pass_rate, completeness_rate, ...)
+    """
+    date_condition, date_params = get_sql_date_condition(period, start_date, end_date, column="day")
+    group_by, date_format = get_sql_group_by(period, column="day")
+
+    query = _HISTORY_QUERY.format(
+        date_format=date_format,
+        group_by=group_by,
+        date_condition=date_condition,
+        order="DESC" if descending else "ASC",
+    )
+    rows = await execute_query_async(query, [data_source, *date_params, limit])
+
+    history = []
+    for row in rows:
+        (period_label, _period_key, total_inspections, total_checks, pass_count, fail_count,
+         completeness_pass, completeness_total, validity_pass, validity_total) = row
+        total_checks = int(total_checks or 0)
+        pass_count = int(pass_count or 0)
+        history.append({
+            "period_label": str(period_label),
+            "total_inspections": int(total_inspections or 0),
+            "total_checks": total_checks,
+            "pass_count": pass_count,
+            "fail_count": int(fail_count or 0),
+            "pass_rate": calculate_pass_rate(pass_count, total_checks),
+            "completeness_rate": calculate_pass_rate(int(completeness_pass or 0), int(completeness_total or 0)),
+            "validity_rate": calculate_pass_rate(int(validity_pass or 0), int(validity_total or 0)),
+        })
+    return history
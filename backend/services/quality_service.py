@@ -7,6 +7,8 @@ from datetime import datetime
 import uuid
 import logging
 from services.database import db_service
+from services.data_sources import DataSource, PAGE_DATA_SOURCES, resolve_data_source
+from services.quality_stats import build_quality_stats_query, parse_quality_stats
 from models.schemas import QualityCheckResult, QualityCheckHistory, FailedItemData, FailedItemsResponse
 
 logger = logging.getLogger(__name__)
@@ -164,6 +166,8 @@ class QualityService:
                         CREATE TABLE IF NOT EXISTS data_inspection_results (
                             id INT AUTO_INCREMENT PRIMARY KEY,
                             inspection_id VARCHAR(100) NOT NULL,
+                            data_source VARCHAR(50),
+                            table_name VARCHAR(100),
                             check_name VARCHAR(100) NOT NULL,
                             check_type VARCHAR(50) NOT NULL,
                             status VARCHAR(10) NOT NULL,
@@ -173,7 +177,25 @@ class QualityService:
                             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                             INDEX idx_inspection_id (inspection_id),
                             INDEX idx_check_type (check_type),
-                            INDEX idx_status (status)
+                            INDEX idx_status (status),
+                            INDEX idx_source_created (data_source, created_at),
+                            INDEX idx_source_type_status (data_source, check_type, status)
+                        )
+                    """)
+                    
+                    # 검사 히스토리용 일별 집계 테이블
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS quality_daily_rollup (
+                            data_source VARCHAR(50) NOT NULL,
+                            check_type VARCHAR(50) NOT NULL,
+                            day DATE NOT NULL,
+                            total_checks INT NOT NULL DEFAULT 0,
+                            pass_count INT NOT NULL DEFAULT 0,
+                            fail_count INT NOT NULL DEFAULT 0,
+                            inspection_count INT NOT NULL DEFAULT 0,
+                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                            PRIMARY KEY (data_source, day, check_type),
+                            INDEX idx_day (day)
                         )
                     """)
                     
@@ -185,16 +207,35 @@ class QualityService:
     
     def save_quality_check_result(self, inspection_id: str, check_name: str, 
                                  check_type: str, status: str, message: str = None,
-                                 details: str = None, affected_rows: int = 0):
+                                 details: str = None, affected_rows: int = 0,
+                                 table_name: str = None):
         """품질 검사 결과 저장"""
         try:
             query = """
                 INSERT INTO data_inspection_results 
-                (inspection_id, check_name, check_type, status, message, details, affected_rows)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                (inspection_id, data_source, table_name, check_name, check_type, status, message, details, affected_rows)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
-            params = (inspection_id, check_name, check_type, status, message, details, affected_rows)
-            self.db_service.execute_query(query, params, fetch_all=False)
+            data_source = resolve_data_source(inspection_id, table_name)
+            params = (inspection_id, data_source, table_name, check_name, check_type, status, message, details, affected_rows)
+            
+            # 결과 행과 일별 집계를 같은 트랜잭션에서 반영 (단건 저장이므로 검사 수는 올리지 않음)
+            rollup_query = """
+                INSERT INTO quality_daily_rollup
+                (data_source, check_type, day, total_checks, pass_count, fail_count, inspection_count)
+                VALUES (%s, %s, CURDATE(), 1, %s, %s, 0)
+                ON DUPLICATE KEY UPDATE
+                    total_checks = total_checks + 1,
+                    pass_count = pass_count + VALUES(pass_count),
+                    fail_count = fail_count + VALUES(fail_count)
+            """
+            rollup_params = (data_source, check_type, int(status == 'PASS'), int(status == 'FAIL'))
+            
+            with self.db_service.get_mysql_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    cursor.execute(rollup_query, rollup_params)
+                conn.commit()
         except Exception as e:
             logger.error(f"품질 검사 결과 저장 실패: {e}")
             raise
@@ -202,15 +243,8 @@ class QualityService:
     def get_failed_items(self, page: str) -> FailedItemsResponse:
         """실패/성공한 항목 조회"""
         try:
-            # 페이지별 inspection_id 패턴 설정
-            inspection_patterns = {
-                'AIS': '%ais_info%',
-                'TOS': '%berth_schedule%',
-                'TC': '%tc%',
-                'QC': '%qc_work%'
-            }
-            
-            pattern = inspection_patterns.get(page, '%ais_info%')
+            # 페이지별 데이터 소스
+            data_source = PAGE_DATA_SOURCES.get(page, DataSource.AIS)
             
             # 실패한 항목들 조회
             failed_query = """
@@ -222,13 +256,13 @@ class QualityService:
                     affected_rows,
                     created_at
                 FROM data_inspection_results 
-                WHERE inspection_id LIKE %s 
+                WHERE data_source = %s 
                 AND status = 'FAIL'
                 ORDER BY created_at DESC
                 LIMIT 5
             """
             
-            failed_rows = self.db_service.execute_query(failed_query, (pattern,))
+            failed_rows = self.db_service.execute_query(failed_query, (data_source,))
             failed_items = []
             if failed_rows:
                 for row in failed_rows:
@@ -251,13 +285,13 @@ class QualityService:
                     affected_rows,
                     created_at
                 FROM data_inspection_results 
-                WHERE inspection_id LIKE %s 
+                WHERE data_source = %s 
                 AND status = 'PASS'
                 ORDER BY created_at DESC
                 LIMIT 5
             """
             
-            success_rows = self.db_service.execute_query(success_query, (pattern,))
+            success_rows = self.db_service.execute_query(success_query, (data_source,))
             success_items = []
             if success_rows:
                 for row in success_rows:
@@ -283,113 +317,41 @@ class QualityService:
     def get_latest_inspection_results(self, page: str) -> Dict[str, Any]:
         """최신 검사 결과 조회"""
         try:
-            # 페이지별 inspection_id 패턴 설정
-            inspection_patterns = {
-                'AIS': '%ais_info%',
-                'TOS': '%berth_schedule%',
-                'TC': '%tc%',
-                'QC': '%qc_work%'
-            }
-            
-            pattern = inspection_patterns.get(page, '%ais_info%')
-            
-            # 최신 검사 ID와 시간 조회
-            latest_query = """
-                SELECT inspection_id, MAX(created_at) as latest_time
-                FROM data_inspection_results 
-                WHERE inspection_id LIKE %s 
-                GROUP BY inspection_id
-                ORDER BY latest_time DESC 
-                LIMIT 1
-            """
+            # 페이지별 데이터 소스
+            data_source = PAGE_DATA_SOURCES.get(page, DataSource.AIS)
             
-            latest_inspection = self.db_service.execute_query(latest_query, (pattern,), fetch_one=True)
-            if not latest_inspection:
+            # 최신 검사의 전체/검사 유형별 집계 (단일 쿼리)
+            query, params = build_quality_stats_query(
+                "r.data_source = %s", [data_source], latest_only=True
+            )
+            stats = parse_quality_stats(self.db_service.execute_query(query, tuple(params)))
+            latest_time = stats.last_inspection
+            if latest_time is None:
                 return {
                     "completeness": {"pass_rate": 0, "total_checks": 0, "pass_count": 0, "fail_count": 0, "fields_checked": 0, "last_updated": None},
                     "validity": {"pass_rate": 0, "total_checks": 0, "pass_count": 0, "fail_count": 0, "fields_checked": 0, "last_updated": None}
                 }
             
-            latest_inspection_id = latest_inspection[0]
-            latest_time = latest_inspection[1]
-            
-            # 완전성 검사 결과
-            completeness_query = """
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass,
-                    SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail
-                FROM data_inspection_results 
-                WHERE inspection_id = %s AND check_type = 'completeness'
-            """
-            
-            completeness = self.db_service.execute_query(completeness_query, (latest_inspection_id,), fetch_one=True)
-            comp_total = completeness[0] if completeness[0] else 0
-            comp_pass = completeness[1] if completeness[1] else 0
-            comp_fail = completeness[2] if completeness[2] else 0
-            comp_pass_rate = (comp_pass / comp_total * 100) if comp_total > 0 else 0
-            
-            # 유효성 검사 결과
-            validity_query = """
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass,
-                    SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail
-                FROM data_inspection_results 
-                WHERE inspection_id = %s AND check_type = 'validity'
-            """
-            
-            validity = self.db_service.execute_query(validity_query, (latest_inspection_id,), fetch_one=True)
-            val_total = validity[0] if validity[0] else 0
-            val_pass = validity[1] if validity[1] else 0
-            val_fail = validity[2] if validity[2] else 0
-            val_pass_rate = (val_pass / val_total * 100) if val_total > 0 else 0
-            
-            result = {
-                "completeness": {
-                    "pass_rate": round(comp_pass_rate, 1),
-                    "total_checks": comp_total,
-                    "pass_count": comp_pass,
-                    "fail_count": comp_fail,
-                    "fields_checked": comp_total,
-                    "last_updated": latest_time.isoformat() if latest_time else None
-                },
-                "validity": {
-                    "pass_rate": round(val_pass_rate, 1),
-                    "total_checks": val_total,
-                    "pass_count": val_pass,
-                    "fail_count": val_fail,
-                    "fields_checked": val_total,
+            def to_result(check_type: str) -> Dict[str, Any]:
+                check_stats = stats.check_type(check_type)
+                total = check_stats["total_checks"]
+                return {
+                    "pass_rate": round(check_stats["pass_count"] / total * 100, 1) if total > 0 else 0,
+                    "total_checks": total,
+                    "pass_count": check_stats["pass_count"],
+                    "fail_count": check_stats["fail_count"],
+                    "fields_checked": total,
                     "last_updated": latest_time.isoformat() if latest_time else None
                 }
+            
+            result = {
+                "completeness": to_result("completeness"),
+                "validity": to_result("validity")
             }
             
             # TC 페이지인 경우 usage 데이터 추가
-            if page == 'TC':
-                usage_query = """
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass,
-                        SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail
-                    FROM data_inspection_results 
-                    WHERE inspection_id = %s AND check_type = 'usage'
-                """
-                
-                usage = self.db_service.execute_query(usage_query, (latest_inspection_id,), fetch_one=True)
-                usage_total = usage[0] if usage[0] else 0
-                usage_pass = usage[1] if usage[1] else 0
-                usage_fail = usage[2] if usage[2] else 0
-                usage_pass_rate = (usage_pass / usage_total * 100) if usage_total > 0 else 0
-                
-                if usage_total > 0:
-                    result["usage"] = {
-                        "pass_rate": round(usage_pass_rate, 1),
-                        "total_checks": usage_total,
-                        "pass_count": usage_pass,
-                        "fail_count": usage_fail,
-                        "fields_checked": usage_total,
-                        "last_updated": latest_time.isoformat() if latest_time else None
-                    }
+            if page == 'TC' and stats.check_type("usage")["total_checks"] > 0:
+                result["usage"] = to_result("usage")
             
             return result
             
@@ -0,0 +1,145 @@
+"""Quality statistics over data_inspection_results
+
+전체 및 검사 유형(check_type)별 PASS/FAIL 집계를
+GROUP BY check_type WITH ROLLUP 한 번의 스캔으로 계산합니다.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple
+
+from config import execute_query_async
+from utils import calculate_pass_rate
+
+# check_type 은 NOT NULL 컬럼이므로 check_type 이 NULL 인 행은 ROLLUP 합계 행
+_QUALITY_STATS_QUERY = """
+    SELECT
+        r.check_type,
+        COUNT(DISTINCT r.inspection_id) as total_inspections,
+        COUNT(*) as total_checks,
+        SUM(CASE WHEN r.status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
+        SUM(CASE WHEN r.status = 'FAIL' THEN 1 ELSE 0 END) as fail_count,
+        COUNT(DISTINCT r.check_name) as distinct_fields,
+        MAX(r.created_at) as last_inspection
+    FROM data_inspection_results r
+    {joins}
+    WHERE {where}
+    GROUP BY r.check_type WITH ROLLUP
+"""
+
+# 최신 검사(inspection_id) 한 건으로 범위를 좁히는 조건
+LATEST_INSPECTION_CONDITION = """r.inspection_id = (
+        SELECT inspection_id FROM data_inspection_results r
+        {joins}
+        WHERE {where}
+        ORDER BY r.created_at DESC
+        LIMIT 1
+    )"""
+
+
+class QualityStats:
+    """전체 및 검사 유형별 품질 집계 결과"""
+
+    def __init__(self, overall: Dict[str, Any], by_check_type: Dict[str, Dict[str, Any]]):
+        self.overall = overall
+        self.by_check_type = by_check_type
+
+    def check_type(self, check_type: str) -> Dict[str, Any]:
+        """검사 유형별 집계 (해당 유형이 없으면 0으로 채운 값)"""
+        return self.by_check_type.get(check_type) or _empty_stats()
+
+    def summary(self, check_type: str) -> Dict[str, Any]:
+        """대시보드 응답용 검사 유형 요약 (fields_checked/pass_count/fail_count/pass_rate)"""
+        stats = self.check_type(check_type)
+        return {
+            "fields_checked": stats["total_checks"],
+            "pass_count": stats["pass_count"],
+            "fail_count": stats["total_checks"] - stats["pass_count"],
+            "pass_rate": stats["pass_rate"],
+        }
+
+    def rate_summary(self, check_type: str) -> Dict[str, Any]:
+        """선박 매칭/제원 대시보드 응답용 검사 유형 요약 (rate/total/passed)"""
+        stats = self.check_type(check_type)
+        return {
+            "rate": f"{stats['pass_rate']:.2f}",
+            "total": stats["total_checks"],
+            "passed": str(stats["pass_count"]),
+        }
+
+    @property
+    def last_inspection(self):
+        return self.overall["last_inspection"]
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        "total_inspections": 0,
+        "total_checks": 0,
+        "pass_count": 0,
+        "fail_count": 0,
+        "distinct_fields": 0,
+        "pass_rate": 0.0,
+        "last_inspection": None,
+    }
+
+
+def build_quality_stats_query(
+    where: str,
+    params: Optional[List] = None,
+    joins: str = "",
+    latest_only: bool = False
+) -> Tuple[str, List]:
+    """
+    품질 집계 쿼리 생성
+
+    Args:
+        where: data_inspection_results 별칭 r 기준 WHERE 조건 (예: "r.data_source = %s")
+        params: 조건 파라미터
+        joins: 추가 JOIN 절
+        latest_only: True 이면 조건에 맞는 가장 최근 검사 한 건만 집계
+
+    Returns:
+        (쿼리, 파라미터)
+    """
+    params = list(params or [])
+    if latest_only:
+        where = LATEST_INSPECTION_CONDITION.format(joins=joins, where=where)
+        joins = ""
+    return _QUALITY_STATS_QUERY.format(joins=joins, where=where), params
+
+
+def parse_quality_stats(rows) -> QualityStats:
+    """ROLLUP 결과 행을 QualityStats 로 변환"""
+    overall = _empty_stats()
+    by_check_type: Dict[str, Dict[str, Any]] = {}
+
+    for row in rows or []:
+        check_type, total_inspections, total_checks, pass_count, fail_count, distinct_fields, last_inspection = row
+        total_checks = int(total_checks or 0)
+        pass_count = int(pass_count or 0)
+        stats = {
+            "total_inspections": int(total_inspections or 0),
+            "total_checks": total_checks,
+            "pass_count": pass_count,
+            "fail_count": int(fail_count or 0),
+            "distinct_fields": int(distinct_fields or 0),
+            "pass_rate": calculate_pass_rate(pass_count, total_checks),
+            "last_inspection": last_inspection,
+        }
+        if check_type is None:
+            overall = stats
+        else:
+            by_check_type[check_type] = stats
+
+    return QualityStats(overall, by_check_type)
+
+
+async def fetch_quality_stats(
+    where: str,
+    params: Optional[List] = None,
+    joins: str = "",
+    latest_only: bool = False
+) -> QualityStats:
+    """전체/검사 유형별 품질 집계를 한 번의 쿼리로 조회"""
+    query, query_params = build_quality_stats_query(where, params, joins, latest_only)
+    rows = await execute_query_async(query, query_params)
+    return parse_quality_stats(rows)
@@ -0,0 +1,355 @@
+"""UI analytics over hourly rollups
+
+/ui/statistics, /ui/statistics/visitor-trends, /ui/statistics/time-based 를
+ui_log_page_visits / api_call_info 원본 대신 시간별 집계 테이블에서 계산합니다.
+
+    ui_page_visit_hourly   (hour, page_name, login_status) 별 방문 수 / 체류 시간 합계
+    ui_api_call_hourly     (hour, api_endpoint) 별 호출 수 / 오류 수 / 응답 시간 합계
+    ui_visitor_hll         일/주/월/전체 기간별 고유 사용자 HyperLogLog 스케치
+
+집계는 services.log_writer 가 원본 로그를 기록하는 같은 트랜잭션에서 증분으로 갱신하고,
+db/backfill_ui_rollup.py 로 다시 만들 수 있습니다.
+시간대/요일별 패턴은 hour 컬럼에서 계산하므로 원본의 visit_hour/visit_weekday 와 같은 기준입니다.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import execute_query_async, gather_queries, get_async_connection
+from utils import HyperLogLog, get_sql_date_condition, get_sql_group_by
+
+logger = logging.getLogger(__name__)
+
+# 고유 사용자 스케치 기간 종류
+PERIOD_DAY = "day"        # YYYY-MM-DD
+PERIOD_WEEK = "week"      # YYYYWW (MySQL YEARWEEK(..., 1) / ISO 주차)
+PERIOD_MONTH = "month"    # YYYY-MM
+PERIOD_ALL = "all"        # all
+
+CREATE_UI_PAGE_VISIT_HOURLY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ui_page_visit_hourly (
+    hour DATETIME NOT NULL,  -- 방문 시각을 시 단위로 자른 값
+    page_name VARCHAR(100) NOT NULL,
+    login_status VARCHAR(20) NOT NULL,
+    visit_count INT NOT NULL DEFAULT 0,
+    duration_sum BIGINT NOT NULL DEFAULT 0,  -- visit_duration 합계
+    duration_count INT NOT NULL DEFAULT 0,  -- visit_duration 이 있는 방문 수
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (hour, page_name, login_status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+CREATE_UI_API_CALL_HOURLY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ui_api_call_hourly (
+    hour DATETIME NOT NULL,  -- 호출 시각을 시 단위로 자른 값
+    api_endpoint VARCHAR(255) NOT NULL,
+    call_count INT NOT NULL DEFAULT 0,
+    error_count INT NOT NULL DEFAULT 0,  -- 상태 코드 400 이상
+    response_time_sum BIGINT NOT NULL DEFAULT 0,
+    response_time_count INT NOT NULL DEFAULT 0,  -- response_time_ms 가 있는 호출 수
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (hour, api_endpoint)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+CREATE_UI_VISITOR_HLL_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ui_visitor_hll (
+    period_type VARCHAR(10) NOT NULL,  -- day, week, month, all
+    period_key VARCHAR(10) NOT NULL,  -- 2025-08-25, 202535, 2025-08, all
+    sketch BLOB NOT NULL,  -- utils.hyperloglog.HyperLogLog.to_bytes()
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (period_type, period_key)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+UPSERT_PAGE_VISIT_HOURLY_SQL = """
+    INSERT INTO ui_page_visit_hourly
+    (hour, page_name, login_status, visit_count, duration_sum, duration_count)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        visit_count = visit_count + VALUES(visit_count),
+        duration_sum = duration_sum + VALUES(duration_sum),
+        duration_count = duration_count + VALUES(duration_count)
+"""
+
+UPSERT_API_CALL_HOURLY_SQL = """
+    INSERT INTO ui_api_call_hourly
+    (hour, api_endpoint, call_count, error_count, response_time_sum, response_time_count)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        call_count = call_count + VALUES(call_count),
+        error_count = error_count + VALUES(error_count),
+        response_time_sum = response_time_sum + VALUES(response_time_sum),
+        response_time_count = response_time_count + VALUES(response_time_count)
+"""
+
+UPSERT_VISITOR_HLL_SQL = """
+    INSERT INTO ui_visitor_hll (period_type, period_key, sketch)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE sketch = VALUES(sketch)
+"""
+
+
+async def create_ui_rollup_tables():
+    """집계 테이블 생성 (없을 때만)"""
+    async with get_async_connection() as connection:
+        async with connection.cursor() as cursor:
+            for create_sql in (CREATE_UI_PAGE_VISIT_HOURLY_TABLE_SQL,
+                               CREATE_UI_API_CALL_HOURLY_TABLE_SQL,
+                               CREATE_UI_VISITOR_HLL_TABLE_SQL):
+                await cursor.execute(create_sql)
+
+
+def truncate_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def visitor_periods(value: datetime) -> List[Tuple[str, str]]:
+    """방문 시각이 속한 스케치 기간 목록 (일, 주, 월, 전체)"""
+    iso_year, iso_week, _ = value.isocalendar()
+    return [
+        (PERIOD_DAY, value.strftime("%Y-%m-%d")),
+        (PERIOD_WEEK, f"{iso_year}{iso_week:02d}"),
+        (PERIOD_MONTH, value.strftime("%Y-%m")),
+        (PERIOD_ALL, PERIOD_ALL),
+    ]
+
+
+# ==================== 증분 집계 (services.log_writer 기록 트랜잭션 안에서 호출) ====================
+
+async def merge_visitor_sketches(cursor, sketches: Dict[Tuple[str, str], HyperLogLog]):
+    """
+    배치의 스케치를 저장된 스케치와 합쳐 저장
+
+    스케치 합치기는 레지스터별 최댓값이라 SQL 로 표현할 수 없으므로
+    해당 행을 FOR UPDATE 로 잠근 뒤 읽어서 합칩니다 (잠금 순서를 고정해 교착 가능성을 줄임).
+    """
+    if not sketches:
+        return
+    periods = sorted(sketches)
+    placeholders = ", ".join(["(%s, %s)"] * len(periods))
+    await cursor.execute(
+        f"SELECT period_type, period_key, sketch FROM ui_visitor_hll "
+        f"WHERE (period_type, period_key) IN ({placeholders}) FOR UPDATE",
+        [value for period in periods for value in period]
+    )
+    for period_type, period_key, stored in await cursor.fetchall():
+        try:
+            sketches[(period_type, period_key)].merge(HyperLogLog.from_bytes(stored))
+        except ValueError as e:
+            logger.warning(f"⚠️ 고유 사용자 스케치 {period_type}:{period_key} 를 새로 시작합니다: {e}")
+
+    await cursor.executemany(
+        UPSERT_VISITOR_HLL_SQL,
+        [(period_type, period_key, sketches[(period_type, period_key)].to_bytes())
+         for period_type, period_key in periods]
+    )
+
+
+async def rollup_page_visits(cursor, batch: List[tuple]):
+    """
+    페이지 방문 배치를 시간별 집계/고유 사용자 스케치에 반영
+
+    batch 행 형식은 services.log_writer.PAGE_VISIT_INSERT_QUERY 의 값 순서와 같습니다.
+    """
+    counts: Dict[tuple, List[int]] = {}
+    sketches: Dict[Tuple[str, str], HyperLogLog] = {}
+    for row in batch:
+        user_id, page_name, login_status, visit_duration, visited_at = row[0], row[1], row[3], row[4], row[11]
+        key = (truncate_hour(visited_at), page_name or "", login_status or "")
+        bucket = counts.setdefault(key, [0, 0, 0])
+        bucket[0] += 1
+        if visit_duration is not None:
+            bucket[1] += int(visit_duration)
+            bucket[2] += 1
+        for period in visitor_periods(visited_at):
+            sketches.setdefault(period, HyperLogLog()).add(user_id)
+
+    await cursor.executemany(
+        UPSERT_PAGE_VISIT_HOURLY_SQL,
+        [(*key, *values) for key, values in sorted(counts.items())]
+    )
+    await merge_visitor_sketches(cursor, sketches)
+
+
+async def rollup_api_calls(cursor, batch: List[tuple]):
+    """
+    API 호출 배치를 시간별 집계에 반영
+
+    batch 행 형식은 services.log_writer.API_CALL_INSERT_QUERY 의 값 순서와 같습니다.
+    """
+    counts: Dict[tuple, List[int]] = {}
+    for row in batch:
+        endpoint, status_code, response_time_ms, called_at = row[0], row[2], row[3], row[5]
+        bucket = counts.setdefault((truncate_hour(called_at), endpoint or ""), [0, 0, 0, 0])
+        bucket[0] += 1
+        if status_code is not None and status_code >= 400:
+            bucket[1] += 1
+        if response_time_ms is not None:
+            bucket[2] += int(response_time_ms)
+            bucket[3] += 1
+
+    await cursor.executemany(
+        UPSERT_API_CALL_HOURLY_SQL,
+        [(*key, *values) for key, values in sorted(counts.items())]
+    )
+
+
+# ==================== 조회 ====================
+
+async def count_visitors(period_type: str, period_keys: Iterable[str]) -> Dict[str, int]:
+    """기간별 고유 사용자 추정값 {period_key: count}"""
+    period_keys = sorted({str(key) for key in period_keys})
+    if not period_keys:
+        return {}
+    placeholders = ", ".join(["%s"] * len(period_keys))
+    rows = await execute_query_async(
+        f"SELECT period_key, sketch FROM ui_visitor_hll "
+        f"WHERE period_type = %s AND period_key IN ({placeholders})",
+        [period_type, *period_keys]
+    )
+    return {period_key: HyperLogLog.from_bytes(sketch).count() for period_key, sketch in rows}
+
+
+async def fetch_ui_statistics() -> Dict[str, Any]:
+    """전체 기간 UI 통계 (UIStatisticsResponse 필드)"""
+    visit_total, login_status_rows, page_rows, api_rows, api_total, visitors = await gather_queries(
+        execute_query_async("SELECT COALESCE(SUM(visit_count), 0) FROM ui_page_visit_hourly"),
+        execute_query_async("""
+            SELECT login_status, SUM(visit_count)
+            FROM ui_page_visit_hourly
+            GROUP BY login_status
+        """),
+        execute_query_async("""
+            SELECT page_name, SUM(visit_count) as visit_count
+            FROM ui_page_visit_hourly
+            GROUP BY page_name
+            ORDER BY visit_count DESC
+            LIMIT 5
+        """),
+        execute_query_async("""
+            SELECT api_endpoint, SUM(call_count) as call_count
+            FROM ui_api_call_hourly
+            GROUP BY api_endpoint
+            ORDER BY call_count DESC
+            LIMIT 5
+        """),
+        execute_query_async("""
+            SELECT COALESCE(SUM(call_count), 0), SUM(response_time_sum), SUM(response_time_count)
+            FROM ui_api_call_hourly
+        """),
+        count_visitors(PERIOD_ALL, [PERIOD_ALL])
+    )
+
+    total_api_calls, response_time_sum, response_time_count = api_total[0]
+    return {
+        "total_page_visits": int(visit_total[0][0]),
+        "total_api_calls": int(total_api_calls),
+        "unique_users": visitors.get(PERIOD_ALL, 0),
+        "login_status_stats": [(status, int(count)) for status, count in login_status_rows],
+        "most_visited_pages": [(page, int(count)) for page, count in page_rows],
+        "most_called_apis": [(endpoint, int(count)) for endpoint, count in api_rows],
+        "avg_response_time_ms": (
+            float(response_time_sum) / int(response_time_count) if response_time_count else 0.0
+        ),
+    }
+
+
+async def fetch_visitor_trends() -> Dict[str, Any]:
+    """최근 30일 일별 방문/고유 방문자, 최근 7일 시간대별, 최근 30일 요일별 방문 수"""
+    daily_rows, hourly_rows, weekday_rows = await gather_queries(
+        execute_query_async("""
+            SELECT DATE(hour) as day, SUM(visit_count)
+            FROM ui_page_visit_hourly
+            WHERE hour >= DATE_SUB(NOW(), INTERVAL 30 DAY)
+            GROUP BY DATE(hour)
+            ORDER BY day ASC
+        """),
+        execute_query_async("""
+            SELECT HOUR(hour) as visit_hour, SUM(visit_count)
+            FROM ui_page_visit_hourly
+            WHERE hour >= DATE_SUB(NOW(), INTERVAL 7 DAY)
+            GROUP BY HOUR(hour)
+            ORDER BY visit_hour ASC
+        """),
+        execute_query_async("""
+            SELECT WEEKDAY(hour) as visit_weekday, SUM(visit_count)
+            FROM ui_page_visit_hourly
+            WHERE hour >= DATE_SUB(NOW(), INTERVAL 30 DAY)
+            GROUP BY WEEKDAY(hour)
+            ORDER BY visit_weekday ASC
+        """)
+    )
+    visitors = await count_visitors(PERIOD_DAY, (row[0] for row in daily_rows))
+
+    return {
+        "daily_trends": [
+            {"date": str(day), "visits": int(visits), "unique_visitors": visitors.get(str(day), 0)}
+            for day, visits in daily_rows
+        ],
+        "hourly_pattern": [{"hour": int(hour), "visits": int(visits)} for hour, visits in hourly_rows],
+        "weekday_pattern": [{"weekday": int(weekday), "visits": int(visits)} for weekday, visits in weekday_rows]
+    }
+
+
+# 기간 타입별 스케치 종류 (get_sql_group_by 의 그룹 키가 스케치 period_key 와 같은 형식)
+_PERIOD_SKETCH_TYPES = {
+    "daily": PERIOD_DAY,
+    "custom": PERIOD_DAY,
+    "weekly": PERIOD_WEEK,
+    "monthly": PERIOD_MONTH,
+}
+
+_TIME_BASED_QUERY = """
+    SELECT
+        MIN({date_format}) as period_label,
+        {group_by} as period_key,
+        SUM({count_column})
+    FROM {table}
+    WHERE 1=1 {date_condition}
+    GROUP BY {group_by}
+    ORDER BY period_key ASC
+"""
+
+
+async def fetch_time_based_statistics(
+    period: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    기간별 방문 수 / 고유 사용자 / API 호출 수
+
+    Args:
+        period: daily(최근 14일), weekly(최근 12주), monthly(최근 12개월), custom(start_date ~ end_date 일별)
+    """
+    date_condition, date_params = get_sql_date_condition(period, start_date, end_date, column="hour")
+    group_by, date_format = get_sql_group_by(period, column="hour")
+
+    def build(table: str, count_column: str) -> str:
+        return _TIME_BASED_QUERY.format(
+            date_format=date_format,
+            group_by=group_by,
+            count_column=count_column,
+            table=table,
+            date_condition=date_condition,
+        )
+
+    visit_rows, api_rows = await gather_queries(
+        execute_query_async(build("ui_page_visit_hourly", "visit_count"), date_params),
+        execute_query_async(build("ui_api_call_hourly", "call_count"), date_params)
+    )
+    api_calls = {str(period_key): int(count) for _, period_key, count in api_rows}
+    visitors = await count_visitors(_PERIOD_SKETCH_TYPES.get(period, PERIOD_DAY),
+                                    (row[1] for row in visit_rows))
+
+    return [
+        {
+            "period": str(period_label),
+            "page_visits": int(visits),
+            "unique_users": visitors.get(str(period_key), 0),
+            "api_calls": api_calls.get(str(period_key), 0)
+        }
+        for period_label, period_key, visits in visit_rows
+    ]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+소스별 품질 라우트 점검 스크립트
+
+add_source_quality_routes() 로 생성한 /{prefix}-quality-summary, /{prefix}-field-analysis,
+/{prefix}-inspection-history 를 소스마다 한 번씩 호출해 200 응답과
+엔진에 넘어가는 파라미터 값(Query 객체가 아닌 실제 값)을 확인합니다.
+품질 엔진 응답 함수는 가짜로 바꾸므로 DB/Redis 없이 실행됩니다.
+
+사용법:
+    cd backend && python test_quality_routes.py
+"""
+
+import asyncio
+import sys
+
+import httpx
+from fastapi import FastAPI
+
+from routers import tos_routes, tc_routes, qc_routes, yt_routes
+from services.data_sources import DataSource, get_data_source
+from services.quality_engine import get_quality_engine
+
+SOURCE_ROUTERS = {
+    DataSource.TOS: tos_routes.router,
+    DataSource.TC: tc_routes.router,
+    DataSource.QC: qc_routes.router,
+    DataSource.YT: yt_routes.router,
+}
+
+
+def _install_fake_engine(source_key: str, calls: list):
+    """엔진 응답 함수를 받은 인자를 검사/기록하는 가짜로 교체"""
+    engine = get_quality_engine(source_key)
+
+    async def quality_summary_response():
+        calls.append(("quality_summary", {}))
+        return {"success": True}
+
+    async def field_analysis_response(recent_inspections=1):
+        assert isinstance(recent_inspections, int), f"recent_inspections 가 값이 아님: {recent_inspections!r}"
+        calls.append(("field_analysis", {"recent_inspections": recent_inspections}))
+        return {"success": True}
+
+    async def inspection_history_response(period="daily", start_date=None, end_date=None):
+        for value in (period, start_date, end_date):
+            assert value is None or isinstance(value, str), f"기간 파라미터가 값이 아님: {value!r}"
+        calls.append(("inspection_history", {"period": period}))
+        return []
+
+    engine.quality_summary_response = quality_summary_response
+    engine.field_analysis_response = field_analysis_response
+    engine.inspection_history_response = inspection_history_response
+
+
+async def check_source_routes() -> int:
+    """모든 소스의 생성 라우트를 한 번씩 호출, 실패 수 반환"""
+    app = FastAPI()
+    for router in SOURCE_ROUTERS.values():
+        app.include_router(router, prefix="/api/dashboard")
+
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for source_key in SOURCE_ROUTERS:
+            calls = []
+            _install_fake_engine(source_key, calls)
+            prefix = get_data_source(source_key).route_prefix
+
+            for path, expected in [
+                (f"/{prefix}-quality-summary", ("quality_summary", {})),
+                (f"/{prefix}-field-analysis", ("field_analysis", {"recent_inspections": 1})),
+                (f"/{prefix}-field-analysis?recent_inspections=3", ("field_analysis", {"recent_inspections": 3})),
+                (f"/{prefix}-inspection-history", ("inspection_history", {"period": "daily"})),
+            ]:
+                calls.clear()
+                response = await client.get(f"/api/dashboard{path}")
+                if response.status_code == 200 and calls == [expected]:
+                    print(f"✅ {path}")
+                else:
+                    failures += 1
+                    print(f"❌ {path}: {response.status_code} {response.text[:200]} {calls}")
+
+    return failures
+
+
+def main():
+    failures = asyncio.run(check_source_routes())
+    if failures:
+        print(f"\n❌ 실패 {failures}건")
+        sys.exit(1)
+    print("\n🎉 모든 소스별 품질 라우트 정상")
+
+
+if __name__ == "__main__":
+    main()
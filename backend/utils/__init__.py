@@ -24,6 +24,25 @@ from .helpers import (
     create_response_data,
     create_error_response
 )
+from .hyperloglog import HyperLogLog
+from .geo import (
+    GridIndex,
+    grid_cell,
+    haversine_nm,
+    bbox_cell_ranges,
+    radius_bbox,
+    in_bbox,
+    validate_bbox
+)
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+    encode_id_cursor,
+    decode_id_cursor,
+    keyset_condition,
+    next_cursor,
+    escape_like
+)
 
 __all__ = [
     # Logger
@@ -51,5 +70,26 @@ __all__ = [
     "get_sql_date_condition",
     "get_sql_group_by",
     "create_response_data",
-    "create_error_response"
+    "create_error_response",
+    
+    # Sketches
+    "HyperLogLog",
+    
+    # Spatial grid
+    "GridIndex",
+    "grid_cell",
+    "haversine_nm",
+    "bbox_cell_ranges",
+    "radius_bbox",
+    "in_bbox",
+    "validate_bbox",
+    
+    # Pagination
+    "encode_cursor",
+    "decode_cursor",
+    "encode_id_cursor",
+    "decode_id_cursor",
+    "keyset_condition",
+    "next_cursor",
+    "escape_like"
 ]
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""Spatial grid helpers
+
+위경도를 0.1도 격자 셀 번호로 나눠 영역(bbox)/반경 검색의 후보를 줄입니다.
+
+    셀 번호 = 위도 줄(FLOOR((lat + 90) * 10)) * 3600 + 경도 칸(FLOOR((lon + 180) * 10) mod 3600)
+
+같은 위도 줄의 셀은 번호가 연속이므로, bbox 는 위도 줄마다 하나의 번호 범위(BETWEEN)가 되어
+grid_cell B-tree 인덱스로 후보 행만 읽습니다. MySQL 의 grid_cell 생성 컬럼
+(db/add_ais_grid_cell.py)도 같은 식을 사용합니다.
+
+부동소수점 경계 오차로 셀이 하나 어긋날 수 있으므로 후보 범위는 한 셀씩 넓혀 잡고,
+최종 판정은 항상 정확한 좌표 비교/거리 계산으로 합니다.
+"""
+
+import math
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+GRID_CELLS_PER_DEGREE = 10
+GRID_COLUMNS = 360 * GRID_CELLS_PER_DEGREE
+GRID_ROWS = 180 * GRID_CELLS_PER_DEGREE
+
+EARTH_RADIUS_NM = 3440.065  # 지구 반지름 (해리)
+NM_PER_DEGREE_LAT = 60.0
+
+# grid_cell 생성 컬럼 식 (MySQL, grid_cell() 과 같은 값)
+GRID_CELL_SQL = (
+    f"LEAST(GREATEST(FLOOR((lat + 90) * {GRID_CELLS_PER_DEGREE}), 0), {GRID_ROWS - 1}) * {GRID_COLUMNS}"
+    f" + MOD(FLOOR((lon + 180) * {GRID_CELLS_PER_DEGREE}), {GRID_COLUMNS})"
+)
+
+
+def haversine_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 지점 간의 거리 (해리, Haversine 공식)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    a = (math.sin(delta_lat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
+    return EARTH_RADIUS_NM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def _grid_row(lat: float) -> int:
+    return min(max(int(math.floor((lat + 90) * GRID_CELLS_PER_DEGREE)), 0), GRID_ROWS - 1)
+
+
+def _grid_column(lon: float) -> int:
+    return int(math.floor((lon + 180) * GRID_CELLS_PER_DEGREE)) % GRID_COLUMNS
+
+
+def grid_cell(lat: float, lon: float) -> int:
+    """좌표의 격자 셀 번호"""
+    return _grid_row(lat) * GRID_COLUMNS + _grid_column(lon)
+
+
+def validate_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> None:
+    """
+    bbox 범위 확인 (min_lon > max_lon 이면 날짜변경선을 넘는 영역)
+
+    Raises:
+        ValueError: 잘못된 범위
+    """
+    if not (-90 <= min_lat <= max_lat <= 90):
+        raise ValueError(f"위도 범위가 잘못되었습니다: {min_lat} ~ {max_lat}")
+    if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+        raise ValueError(f"경도 범위가 잘못되었습니다: {min_lon} ~ {max_lon}")
+
+
+def in_bbox(lat: float, lon: float, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> bool:
+    """좌표가 bbox 안에 있는지 (날짜변경선을 넘는 bbox 포함)"""
+    if not min_lat <= lat <= max_lat:
+        return False
+    if min_lon <= max_lon:
+        return min_lon <= lon <= max_lon
+    return lon >= min_lon or lon <= max_lon
+
+
+def _column_spans(min_lon: float, max_lon: float) -> List[Tuple[int, int]]:
+    """bbox 경도 범위의 셀 열 구간 (양쪽으로 한 셀씩 넓히고, 날짜변경선에서 나눔)"""
+    if min_lon > max_lon:
+        return _column_spans(min_lon, 180.0) + _column_spans(-180.0, max_lon)
+    first = int(math.floor((min_lon + 180) * GRID_CELLS_PER_DEGREE)) - 1
+    last = int(math.floor((max_lon + 180) * GRID_CELLS_PER_DEGREE)) + 1
+    if last - first + 1 >= GRID_COLUMNS:
+        return [(0, GRID_COLUMNS - 1)]
+    spans = [(max(first, 0), min(last, GRID_COLUMNS - 1))]
+    if first < 0:
+        spans.append((GRID_COLUMNS + first, GRID_COLUMNS - 1))
+    if last >= GRID_COLUMNS:
+        spans.append((0, last - GRID_COLUMNS))
+    return spans
+
+
+def bbox_cell_ranges(min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[Tuple[int, int]]:
+    """
+    bbox 후보 셀 번호 구간 목록 (위도 줄마다 연속 구간)
+
+    grid_cell BETWEEN a AND b 조건으로 바로 사용할 수 있습니다.
+    """
+    first_row = max(_grid_row(min_lat) - 1, 0)
+    last_row = min(_grid_row(max_lat) + 1, GRID_ROWS - 1)
+    # 날짜변경선 부근에서 넓힌 구간이 겹치지 않도록 합침
+    spans = []
+    for first, last in sorted(_column_spans(min_lon, max_lon)):
+        if spans and first <= spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], last))
+        else:
+            spans.append((first, last))
+    return [
+        (row * GRID_COLUMNS + first, row * GRID_COLUMNS + last)
+        for row in range(first_row, last_row + 1)
+        for first, last in spans
+    ]
+
+
+def radius_bbox(lat: float, lon: float, radius_nm: float) -> Tuple[float, float, float, float]:
+    """반경 검색을 감싸는 bbox (min_lat, min_lon, max_lat, max_lon)"""
+    delta_lat = radius_nm / NM_PER_DEGREE_LAT
+    min_lat = max(lat - delta_lat, -90.0)
+    max_lat = min(lat + delta_lat, 90.0)
+    # 극 근처이거나 반경이 너무 크면 경도 전체
+    cos_lat = min(math.cos(math.radians(min_lat)), math.cos(math.radians(max_lat)))
+    if cos_lat <= 0.01 or min_lat <= -90 or max_lat >= 90:
+        return min_lat, -180.0, max_lat, 180.0
+    delta_lon = radius_nm / (NM_PER_DEGREE_LAT * cos_lat)
+    if delta_lon >= 180:
+        return min_lat, -180.0, max_lat, 180.0
+    min_lon = lon - delta_lon
+    max_lon = lon + delta_lon
+    if min_lon < -180:
+        min_lon += 360
+    if max_lon > 180:
+        max_lon -= 360
+    return min_lat, min_lon, max_lat, max_lon
+
+
+class GridIndex:
+    """
+    격자 셀 → 항목 메모리 인덱스 (선박별 최신 위치용)
+
+    key(예: MMSI)마다 항목 하나를 유지하며, 위치가 바뀌면 이전 셀에서 옮깁니다.
+    항목은 lat/lon 키를 가진 dict 입니다.
+    """
+
+    def __init__(self):
+        self.cells: Dict[int, Dict[Hashable, Dict[str, Any]]] = {}
+        self.item_cells: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.item_cells)
+
+    def upsert(self, key: Hashable, item: Dict[str, Any]) -> None:
+        """항목 추가/갱신 (좌표가 없으면 인덱스에서 제거)"""
+        self.remove(key)
+        lat, lon = item.get("lat"), item.get("lon")
+        if lat is None or lon is None or not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            return
+        cell = grid_cell(lat, lon)
+        self.cells.setdefault(cell, {})[key] = item
+        self.item_cells[key] = cell
+
+    def remove(self, key: Hashable) -> None:
+        cell = self.item_cells.pop(key, None)
+        if cell is None:
+            return
+        items = self.cells.get(cell)
+        if items is not None:
+            items.pop(key, None)
+            if not items:
+                del self.cells[cell]
+
+    def _candidates(self, ranges: Iterable[Tuple[int, int]]) -> Iterable[Dict[str, Any]]:
+        for first, last in ranges:
+            if last - first + 1 <= len(self.cells):
+                cells = (self.cells.get(cell) for cell in range(first, last + 1))
+            else:
+                # 구간이 채워진 셀 수보다 넓으면 채워진 셀만 확인
+                cells = (items for cell, items in self.cells.items() if first <= cell <= last)
+            for items in cells:
+                if items:
+                    yield from items.values()
+
+    def query_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                   limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """bbox 안의 항목 (후보 셀만 확인한 뒤 정확한 좌표 비교)"""
+        results = []
+        for item in self._candidates(bbox_cell_ranges(min_lat, min_lon, max_lat, max_lon)):
+            if in_bbox(item["lat"], item["lon"], min_lat, min_lon, max_lat, max_lon):
+                results.append(item)
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def query_near(self, lat: float, lon: float, radius_nm: float,
+                   limit: Optional[int] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """반경 안의 항목을 (거리, 항목) 가까운 순으로 반환"""
+        results = []
+        for item in self._candidates(bbox_cell_ranges(*radius_bbox(lat, lon, radius_nm))):
+            distance = haversine_nm(lat, lon, item["lat"], item["lon"])
+            if distance <= radius_nm:
+                results.append((distance, item))
+        results.sort(key=lambda result: result[0])
+        return results[:limit] if limit else results
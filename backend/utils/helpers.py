@@ -116,29 +116,34 @@ def validate_period(period: str) -> bool:
     """기간 타입 유효성 검사"""
     return period in ['daily', 'weekly', 'monthly', 'custom']
 
-def get_sql_date_condition(period: str, start_date: str = None, end_date: str = None) -> tuple:
-    """SQL 날짜 조건 생성"""
+def get_sql_date_condition(period: str, start_date: str = None, end_date: str = None,
+                           column: str = "created_at") -> tuple:
+    """SQL 날짜 조건 생성 (column 에 함수를 씌우지 않아 인덱스 사용 가능)"""
     if period == 'custom' and start_date and end_date:
-        return "AND DATE(created_at) BETWEEN %s AND %s", [start_date, end_date]
+        return f"AND {column} >= %s AND {column} < DATE_ADD(%s, INTERVAL 1 DAY)", [start_date, end_date]
     elif period == 'daily':
-        return "AND created_at >= DATE_SUB(NOW(), INTERVAL 14 DAY)", []
+        return f"AND {column} >= DATE_SUB(NOW(), INTERVAL 14 DAY)", []
     elif period == 'weekly':
-        return "AND created_at >= DATE_SUB(NOW(), INTERVAL 12 WEEK)", []
+        return f"AND {column} >= DATE_SUB(NOW(), INTERVAL 12 WEEK)", []
     elif period == 'monthly':
-        return "AND created_at >= DATE_SUB(NOW(), INTERVAL 12 MONTH)", []
+        return f"AND {column} >= DATE_SUB(NOW(), INTERVAL 12 MONTH)", []
     else:
         return "", []
 
-def get_sql_group_by(period: str) -> tuple:
-    """SQL GROUP BY 절 생성"""
+def get_sql_group_by(period: str, column: str = "created_at") -> tuple:
+    """SQL GROUP BY 절 생성 (그룹 키, 표시용 라벨)"""
     if period == 'daily':
-        return "DATE(created_at)", "DATE(created_at)"
+        return f"DATE({column})", f"DATE({column})"
     elif period == 'weekly':
-        return "YEARWEEK(created_at, 1)", "CONCAT(YEAR(created_at), '년 ', LPAD(MONTH(created_at), 2, '0'), '월 ', (WEEK(created_at, 1) - WEEK(DATE_SUB(created_at, INTERVAL DAY(created_at)-1 DAY), 1) + 1), '주차')"
+        return (
+            f"YEARWEEK({column}, 1)",
+            f"CONCAT(YEAR({column}), '년 ', LPAD(MONTH({column}), 2, '0'), '월 ', "
+            f"(WEEK({column}, 1) - WEEK(DATE_SUB({column}, INTERVAL DAY({column})-1 DAY), 1) + 1), '주차')"
+        )
     elif period == 'monthly':
-        return "DATE_FORMAT(created_at, '%%Y-%%m')", "DATE_FORMAT(created_at, '%%Y년 %%m월')"
+        return f"DATE_FORMAT({column}, '%%Y-%%m')", f"DATE_FORMAT({column}, '%%Y년 %%m월')"
     else:
-        return "DATE(created_at)", "DATE(created_at)"
+        return f"DATE({column})", f"DATE({column})"
 
 def create_response_data(data: List[Dict[str, Any]], message: str = "Success") -> Dict[str, Any]:
     """표준 응답 데이터 생성"""
@@ -0,0 +1,79 @@
+"""HyperLogLog 고유 개수 추정
+
+COUNT(DISTINCT ...) 대신 고정 크기 스케치로 고유 사용자 수를 추정합니다.
+스케치끼리 합칠 수 있으므로(레지스터별 최댓값) 시간/일 단위 스케치를 모아
+주/월/전체 기간의 고유 수를 원본 로그 없이 계산할 수 있습니다.
+
+정밀도 p=12 (레지스터 4096개) 기준 표준 오차는 약 1.6% 입니다.
+"""
+
+import hashlib
+import math
+import zlib
+from typing import Iterable, Optional
+
+DEFAULT_PRECISION = 12
+HASH_BITS = 64
+
+
+class HyperLogLog:
+    """HyperLogLog 스케치 (레지스터당 1바이트)"""
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = DEFAULT_PRECISION, registers: Optional[bytes] = None):
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision 은 4~16 사이여야 합니다: {precision}")
+        self.precision = precision
+        size = 1 << precision
+        if registers is None:
+            self.registers = bytearray(size)
+        elif len(registers) == size:
+            self.registers = bytearray(registers)
+        else:
+            raise ValueError(f"레지스터 크기가 맞지 않습니다: {len(registers)} != {size}")
+
+    def add(self, value) -> None:
+        """값 추가 (str(value) 기준, 프로세스와 무관하게 같은 해시)"""
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        index = hashed >> (HASH_BITS - self.precision)
+        remaining_bits = HASH_BITS - self.precision
+        remaining = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable) -> "HyperLogLog":
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """다른 스케치를 합침 (합집합)"""
+        if other.precision != self.precision:
+            raise ValueError("precision 이 다른 스케치는 합칠 수 없습니다")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        """고유 개수 추정값"""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # 작은 값은 linear counting 이 더 정확
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def to_bytes(self) -> bytes:
+        """DB 저장용 직렬화 (정밀도 1바이트 + zlib 압축 레지스터, 희소한 스케치는 수십 바이트)"""
+        return bytes([self.precision]) + zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        return cls(data[0], zlib.decompress(data[1:]))
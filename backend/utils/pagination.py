@@ -0,0 +1,95 @@
+"""Keyset (cursor) pagination helpers
+
+로그 조회를 OFFSET 대신 (created_at, id) 기준 키셋 페이지네이션으로 처리합니다.
+(AIS 목록은 rowid 하나로 정렬하므로 encode_id_cursor/decode_id_cursor 를 사용합니다.)
+페이지마다 마지막 행의 (created_at, id) 를 커서 토큰으로 돌려주고,
+다음 요청은 그보다 작은 행만 인덱스 범위로 읽으므로 몇 페이지째든 비용이 같습니다.
+(필터는 등호 조건이고 (필터, created_at, id) 복합 인덱스가 있어야 합니다. 범위/LIKE 필터는 일치 행 전체를 정렬)
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+def _encode(payload: Any) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(token: str) -> Any:
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """마지막 행의 (created_at, id) 를 URL 에 넣을 수 있는 불투명 토큰으로 변환"""
+    return _encode([created_at.isoformat(), int(row_id)])
+
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """
+    커서 토큰 해석
+
+    Raises:
+        ValueError: 형식이 잘못된 토큰
+    """
+    try:
+        created_at, row_id = _decode(token)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {token}") from e
+
+
+def encode_id_cursor(row_id: int) -> str:
+    """id 하나로 정렬하는 목록의 커서 토큰 (AIS rowid 페이지네이션)"""
+    return _encode([int(row_id)])
+
+
+def decode_id_cursor(token: str) -> int:
+    """
+    id 커서 토큰 해석
+
+    Raises:
+        ValueError: 형식이 잘못된 토큰
+    """
+    try:
+        (row_id,) = _decode(token)
+        return int(row_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {token}") from e
+
+
+def keyset_condition(cursor: Optional[str], created_column: str = "created_at",
+                     id_column: str = "id") -> Tuple[str, List[Any]]:
+    """
+    커서 이후(더 오래된) 행 조건 (ORDER BY created_at DESC, id DESC 기준)
+
+    (created_at, id) < (%s, %s) 행 비교 대신 앞쪽 조건을 풀어 써서
+    (..., created_at, id) 인덱스의 범위 스캔을 쓰도록 합니다.
+    """
+    if not cursor:
+        return "", []
+    created_at, row_id = decode_cursor(cursor)
+    return (
+        f"AND {created_column} <= %s AND ({created_column} < %s OR {id_column} < %s)",
+        [created_at, created_at, row_id]
+    )
+
+
+def escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프 (접두사 검색용)"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def next_cursor(rows: Sequence[tuple], limit: int, created_index: int, id_index: int) -> Optional[str]:
+    """
+    다음 페이지 커서 (limit + 1 행을 조회해 남는 행이 있을 때만)
+
+    rows 는 limit + 1 개까지 조회한 결과이며, 호출자는 rows[:limit] 만 응답에 사용합니다.
+    """
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last[created_index], last[id_index])
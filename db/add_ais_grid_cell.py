@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AIS 격자 셀(grid_cell) 컬럼 추가 스크립트
+
+ais_info, ais_latest_position 에 lat/lon 으로 계산되는 grid_cell 생성 컬럼(STORED)과
+B-tree 인덱스를 추가합니다. /ais/bbox, /ais/near (scope=history) 는 영역을 셀 번호 구간으로
+바꿔 이 인덱스로 후보 행만 읽은 뒤 정확한 좌표/거리 조건을 적용합니다.
+생성 컬럼이므로 동기화 서비스 등 기존 INSERT 는 바꿀 필요가 없습니다.
+
+셀 계산식은 backend/utils/geo.py 의 GRID_CELL_SQL 을 그대로 사용합니다.
+
+사용법:
+    python add_ais_grid_cell.py
+"""
+
+import logging
+import os
+import sys
+
+import pymysql
+
+from database_config import MYSQL_CONFIG
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+from utils.geo import GRID_CELL_SQL  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+TABLES = ["ais_info", "ais_latest_position"]
+
+
+def add_grid_cell(cursor):
+    """누락된 grid_cell 컬럼/인덱스만 추가"""
+    for table in TABLES:
+        cursor.execute("SHOW TABLES LIKE %s", (table,))
+        if not cursor.fetchone():
+            logger.warning(f"⚠️ 테이블 {table} 없음, 건너뜀")
+            continue
+
+        cursor.execute(f"SHOW COLUMNS FROM {table} LIKE 'grid_cell'")
+        if cursor.fetchone():
+            logger.info(f"ℹ️ {table}.grid_cell 이미 존재")
+        else:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN grid_cell INT AS ({GRID_CELL_SQL}) STORED")
+            logger.info(f"✅ 컬럼 추가: {table}.grid_cell")
+
+        cursor.execute(f"SHOW INDEX FROM {table}")
+        if "idx_grid_cell" in {row[2] for row in cursor.fetchall()}:
+            logger.info(f"ℹ️ {table}.idx_grid_cell 이미 존재")
+        else:
+            cursor.execute(f"ALTER TABLE {table} ADD INDEX idx_grid_cell (grid_cell)")
+            logger.info(f"✅ 인덱스 추가: {table}.idx_grid_cell")
+
+
+def main():
+    conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        cursor = conn.cursor()
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        add_grid_cell(cursor)
+
+        logger.info("🎉 AIS 격자 셀 컬럼 추가 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 격자 셀 컬럼 추가 실패: {e}")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
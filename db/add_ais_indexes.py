@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AIS SQLite 조회용 인덱스 추가 스크립트
+
+/ais/mmsi, /ais/flag, /ais/type 은 ais_info 를 mmsiNo / flag / vsslTp 등호 조건으로 조회하고,
+?cursor= 페이지네이션은 rowid 순으로 읽습니다. SQLite 인덱스는 항목마다 rowid 를 포함하므로
+각 컬럼 단일 인덱스만으로 조건 검색과 rowid 정렬/범위를 함께 처리합니다.
+
+사용법:
+    python add_ais_indexes.py                        # 기본 경로 (../ais_database.db)
+    python add_ais_indexes.py --db /path/to/ais_database.db
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ais_database.db')
+
+NEW_INDEXES = [
+    ("idx_ais_info_mmsi", "CREATE INDEX idx_ais_info_mmsi ON ais_info (mmsiNo)"),
+    ("idx_ais_info_flag", "CREATE INDEX idx_ais_info_flag ON ais_info (flag)"),
+    ("idx_ais_info_type", "CREATE INDEX idx_ais_info_type ON ais_info (vsslTp)"),
+]
+
+
+def add_indexes(conn):
+    """누락된 인덱스만 추가"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'ais_info'")
+    existing_indexes = {row[0] for row in cursor.fetchall()}
+    for index, ddl in NEW_INDEXES:
+        if index in existing_indexes:
+            logger.info(f"ℹ️ ais_info.{index} 이미 존재")
+            continue
+        cursor.execute(ddl)
+        logger.info(f"✅ 인덱스 추가: ais_info.{index}")
+    cursor.execute("ANALYZE ais_info")
+    conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AIS SQLite 인덱스 추가')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='AIS SQLite 파일 경로')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        logger.error(f"❌ AIS 데이터베이스 파일 없음: {args.db}")
+        return
+
+    conn = None
+    try:
+        logger.info(f"🔌 AIS 데이터베이스 연결 중... ({args.db})")
+        conn = sqlite3.connect(args.db)
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        add_indexes(conn)
+
+        logger.info("🎉 AIS 인덱스 추가 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 인덱스 추가 실패: {e}")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
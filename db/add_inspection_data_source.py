@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+data_inspection_results 데이터 소스 컬럼 추가 및 백필 스크립트
+
+대시보드 쿼리가 inspection_id LIKE '%pattern%' 대신 인덱스를 타는
+data_source = %s 조건을 쓸 수 있도록 data_source / table_name 컬럼과
+(data_source, created_at), (data_source, check_type, status) 인덱스를 추가하고
+기존 행을 검사 단위(inspection_id)로 채웁니다.
+
+사용법:
+    python add_inspection_data_source.py
+"""
+
+import pymysql
+import logging
+
+from database_config import MYSQL_CONFIG
+from data_inspection_service import resolve_data_source
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+NEW_COLUMNS = [
+    ("data_source", "ALTER TABLE data_inspection_results ADD COLUMN data_source VARCHAR(50) NULL AFTER inspection_id"),
+    ("table_name", "ALTER TABLE data_inspection_results ADD COLUMN table_name VARCHAR(100) NULL AFTER data_source"),
+]
+
+NEW_INDEXES = [
+    ("idx_source_created", "ALTER TABLE data_inspection_results ADD INDEX idx_source_created (data_source, created_at)"),
+    ("idx_source_type_status", "ALTER TABLE data_inspection_results ADD INDEX idx_source_type_status (data_source, check_type, status)"),
+]
+
+# 한 번에 커밋할 검사(inspection_id) 수
+COMMIT_EVERY = 100
+
+
+def add_columns_and_indexes(cursor):
+    """누락된 컬럼/인덱스만 추가"""
+    cursor.execute("SHOW COLUMNS FROM data_inspection_results")
+    existing_columns = {row[0] for row in cursor.fetchall()}
+    for column, ddl in NEW_COLUMNS:
+        if column in existing_columns:
+            logger.info(f"ℹ️ 컬럼 {column} 이미 존재")
+            continue
+        cursor.execute(ddl)
+        logger.info(f"✅ 컬럼 추가: {column}")
+
+    cursor.execute("SHOW INDEX FROM data_inspection_results")
+    existing_indexes = {row[2] for row in cursor.fetchall()}
+    for index, ddl in NEW_INDEXES:
+        if index in existing_indexes:
+            logger.info(f"ℹ️ 인덱스 {index} 이미 존재")
+            continue
+        cursor.execute(ddl)
+        logger.info(f"✅ 인덱스 추가: {index}")
+
+
+def backfill(conn, cursor):
+    """data_source 가 비어 있는 기존 검사 결과를 검사 단위로 채움"""
+    cursor.execute("""
+        SELECT r.inspection_id, MAX(i.table_name)
+        FROM data_inspection_results r
+        LEFT JOIN data_inspection_info i ON r.inspection_id = i.inspection_id
+        WHERE r.data_source IS NULL
+        GROUP BY r.inspection_id
+    """)
+    inspections = cursor.fetchall()
+    logger.info(f"📋 백필 대상 검사: {len(inspections):,}건")
+
+    updated_rows = 0
+    for index, (inspection_id, table_name) in enumerate(inspections, start=1):
+        data_source = resolve_data_source(inspection_id, table_name)
+        cursor.execute("""
+            UPDATE data_inspection_results
+            SET data_source = %s, table_name = %s
+            WHERE inspection_id = %s AND data_source IS NULL
+        """, (data_source, table_name, inspection_id))
+        updated_rows += cursor.rowcount
+
+        if index % COMMIT_EVERY == 0:
+            conn.commit()
+            logger.info(f"  ... {index:,}/{len(inspections):,} 검사 처리 ({updated_rows:,}행)")
+
+    conn.commit()
+    logger.info(f"✅ 백필 완료: {updated_rows:,}행")
+
+    cursor.execute("""
+        SELECT data_source, COUNT(*)
+        FROM data_inspection_results
+        GROUP BY data_source
+        ORDER BY COUNT(*) DESC
+    """)
+    for data_source, count in cursor.fetchall():
+        logger.info(f"  {data_source}: {count:,}행")
+
+
+def main():
+    conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        cursor = conn.cursor()
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        add_columns_and_indexes(cursor)
+        backfill(conn, cursor)
+
+        logger.info("🎉 data_inspection_results 데이터 소스 마이그레이션 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 마이그레이션 실패: {e}")
+        if conn:
+            conn.rollback()
+            logger.info("🔄 변경사항 롤백 완료")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
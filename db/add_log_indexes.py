@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로그 테이블 조회용 인덱스 추가 스크립트
+
+/ui/logs/page-visits, /ui/logs/api-calls 는 (created_at, id) 키셋 페이지네이션으로
+최신순 조회하므로, 지원하는 필터마다 (필터, created_at, id) 복합 인덱스를 추가합니다.
+필터는 모두 등호 조건이라 필터와 정렬을 한 인덱스로 처리해 몇 페이지째든 읽는 행 수가 페이지 크기와 같습니다.
+
+    ui_log_page_visits: 필터 없음 / user_id / login_status
+    api_call_info:      필터 없음 / api_endpoint / user_id / response_status_code
+
+api_call_info.user_id 컬럼이 없으면 추가하고, 기존 행은 request_params JSON 의 user_id 로 채웁니다.
+
+사용법:
+    python add_log_indexes.py
+"""
+
+import pymysql
+import logging
+
+from database_config import MYSQL_CONFIG
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 인덱스보다 먼저 추가할 컬럼 (컬럼 추가 DDL, 기존 행 채우기 SQL)
+NEW_COLUMNS = {
+    "api_call_info": [
+        ("user_id",
+         "ALTER TABLE api_call_info ADD COLUMN user_id VARCHAR(100) NULL AFTER data_file_path",
+         "UPDATE api_call_info SET user_id = JSON_UNQUOTE(JSON_EXTRACT(request_params, '$.user_id'))"
+         " WHERE user_id IS NULL AND JSON_EXTRACT(request_params, '$.user_id') IS NOT NULL"),
+    ],
+}
+
+NEW_INDEXES = {
+    "ui_log_page_visits": [
+        ("idx_created_id", "ALTER TABLE ui_log_page_visits ADD INDEX idx_created_id (created_at, id)"),
+        ("idx_user_created_id", "ALTER TABLE ui_log_page_visits ADD INDEX idx_user_created_id (user_id, created_at, id)"),
+        ("idx_status_created_id", "ALTER TABLE ui_log_page_visits ADD INDEX idx_status_created_id (login_status, created_at, id)"),
+    ],
+    "api_call_info": [
+        ("idx_created_id", "ALTER TABLE api_call_info ADD INDEX idx_created_id (created_at, id)"),
+        ("idx_endpoint_created_id", "ALTER TABLE api_call_info ADD INDEX idx_endpoint_created_id (api_endpoint, created_at, id)"),
+        ("idx_user_created_id", "ALTER TABLE api_call_info ADD INDEX idx_user_created_id (user_id, created_at, id)"),
+        ("idx_status_created_id", "ALTER TABLE api_call_info ADD INDEX idx_status_created_id (response_status_code, created_at, id)"),
+    ],
+}
+
+
+def add_columns(cursor):
+    """누락된 컬럼만 추가하고 기존 행 채우기"""
+    for table, columns in NEW_COLUMNS.items():
+        cursor.execute("SHOW TABLES LIKE %s", (table,))
+        if not cursor.fetchone():
+            continue
+
+        cursor.execute(f"SHOW COLUMNS FROM {table}")
+        existing_columns = {row[0] for row in cursor.fetchall()}
+        for column, ddl, backfill_sql in columns:
+            if column in existing_columns:
+                logger.info(f"ℹ️ {table}.{column} 컬럼 이미 존재")
+                continue
+            cursor.execute(ddl)
+            logger.info(f"✅ 컬럼 추가: {table}.{column}")
+            cursor.execute(backfill_sql)
+            logger.info(f"  기존 행 {cursor.rowcount:,}개 채움")
+
+
+def add_indexes(cursor):
+    """누락된 인덱스만 추가"""
+    for table, indexes in NEW_INDEXES.items():
+        cursor.execute("SHOW TABLES LIKE %s", (table,))
+        if not cursor.fetchone():
+            logger.warning(f"⚠️ 테이블 {table} 없음, 건너뜀")
+            continue
+
+        cursor.execute(f"SHOW INDEX FROM {table}")
+        existing_indexes = {row[2] for row in cursor.fetchall()}
+        for index, ddl in indexes:
+            if index in existing_indexes:
+                logger.info(f"ℹ️ {table}.{index} 이미 존재")
+                continue
+            cursor.execute(ddl)
+            logger.info(f"✅ 인덱스 추가: {table}.{index}")
+
+
+def main():
+    conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        cursor = conn.cursor()
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        add_columns(cursor)
+        conn.commit()
+        add_indexes(cursor)
+
+        logger.info("🎉 로그 테이블 인덱스 추가 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 인덱스 추가 실패: {e}")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
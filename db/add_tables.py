@@ -5,6 +5,7 @@
 
 import pymysql
 from database_config import MYSQL_CONFIG
+from ais_latest_position import CREATE_AIS_LATEST_POSITION_TABLE_SQL
 import sys
 
 # TC 작업 정보 테이블 생성 SQL
@@ -158,6 +159,8 @@ CREATE_DATA_INSPECTION_RESULTS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS data_inspection_results (
     id INT AUTO_INCREMENT PRIMARY KEY,
     inspection_id VARCHAR(100) NOT NULL,
+    data_source VARCHAR(50),  -- 대시보드 데이터 소스 키 ('ais', 'tos', 'tc', ...)
+    table_name VARCHAR(100),  -- 검사 대상 원본 테이블명
     check_type VARCHAR(50) NOT NULL,  -- 'DV', 'DC', 'DU' 등
     check_name VARCHAR(100) NOT NULL,  -- 'RANGE', 'DUPLICATE', 'USAGE' 등
     message TEXT NOT NULL,
@@ -172,7 +175,82 @@ CREATE TABLE IF NOT EXISTS data_inspection_results (
     INDEX idx_check_type (check_type),
     INDEX idx_status (status),
     INDEX idx_severity (severity),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_source_created (data_source, created_at),
+    INDEX idx_source_type_status (data_source, check_type, status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+# 일별 품질 집계 테이블 생성 SQL (검사 히스토리 조회용)
+CREATE_QUALITY_DAILY_ROLLUP_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS quality_daily_rollup (
+    data_source VARCHAR(50) NOT NULL,  -- data_inspection_results.data_source
+    check_type VARCHAR(50) NOT NULL,
+    day DATE NOT NULL,
+    total_checks INT NOT NULL DEFAULT 0,
+    pass_count INT NOT NULL DEFAULT 0,
+    fail_count INT NOT NULL DEFAULT 0,
+    inspection_count INT NOT NULL DEFAULT 0,  -- 해당 check_type 을 포함한 검사 수
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (data_source, day, check_type),
+    INDEX idx_day (day)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+# 필드별 검사 통계 테이블 생성 SQL (필드별 분석 조회용)
+CREATE_FIELD_QUALITY_STATS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS field_quality_stats (
+    inspection_id VARCHAR(100) NOT NULL,
+    data_source VARCHAR(50) NOT NULL,
+    field_name VARCHAR(200) NOT NULL,  -- 검사 메시지의 [필드명]
+    check_type VARCHAR(50) NOT NULL,
+    total_rows INT NOT NULL DEFAULT 0,  -- 검사 대상 데이터 행 수 (details.total)
+    pass_count INT NOT NULL DEFAULT 0,
+    fail_count INT NOT NULL DEFAULT 0,
+    error_count INT NOT NULL DEFAULT 0,  -- 실패 결과의 오류 행 수 중 최댓값
+    last_message TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (inspection_id, field_name, check_type),
+    INDEX idx_source_created (data_source, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+# UI 시간별 페이지 방문 집계 테이블 생성 SQL (/ui/statistics 조회용, backend/services/ui_rollup.py)
+CREATE_UI_PAGE_VISIT_HOURLY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ui_page_visit_hourly (
+    hour DATETIME NOT NULL,  -- 방문 시각을 시 단위로 자른 값
+    page_name VARCHAR(100) NOT NULL,
+    login_status VARCHAR(20) NOT NULL,
+    visit_count INT NOT NULL DEFAULT 0,
+    duration_sum BIGINT NOT NULL DEFAULT 0,  -- visit_duration 합계
+    duration_count INT NOT NULL DEFAULT 0,  -- visit_duration 이 있는 방문 수
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (hour, page_name, login_status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+# UI 시간별 API 호출 집계 테이블 생성 SQL
+CREATE_UI_API_CALL_HOURLY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ui_api_call_hourly (
+    hour DATETIME NOT NULL,  -- 호출 시각을 시 단위로 자른 값
+    api_endpoint VARCHAR(255) NOT NULL,
+    call_count INT NOT NULL DEFAULT 0,
+    error_count INT NOT NULL DEFAULT 0,  -- 상태 코드 400 이상
+    response_time_sum BIGINT NOT NULL DEFAULT 0,
+    response_time_count INT NOT NULL DEFAULT 0,  -- response_time_ms 가 있는 호출 수
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (hour, api_endpoint)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+# UI 고유 사용자 HyperLogLog 스케치 테이블 생성 SQL
+CREATE_UI_VISITOR_HLL_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ui_visitor_hll (
+    period_type VARCHAR(10) NOT NULL,  -- day, week, month, all
+    period_key VARCHAR(10) NOT NULL,  -- 2025-08-25, 202535, 2025-08, all
+    sketch BLOB NOT NULL,  -- utils.hyperloglog.HyperLogLog.to_bytes()
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (period_type, period_key)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
@@ -214,12 +292,17 @@ CREATE TABLE IF NOT EXISTS api_call_info (
     data_retrieval_duration_ms INT,  -- 데이터 조회 소요 시간
     total_records_retrieved INT,  -- 조회된 총 레코드 수
     data_file_path VARCHAR(500),  -- 저장된 CSV 파일 경로
+    user_id VARCHAR(100),  -- 호출한 사용자 (백엔드 API 호출 로그)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (inspection_id) REFERENCES data_inspection_info(inspection_id) ON DELETE CASCADE,
     INDEX idx_inspection_id (inspection_id),
     INDEX idx_api_endpoint (api_endpoint),
     INDEX idx_data_retrieval_start_time (data_retrieval_start_time),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_created_id (created_at, id),  -- /ui/logs/api-calls 키셋 페이지네이션
+    INDEX idx_endpoint_created_id (api_endpoint, created_at, id),
+    INDEX idx_user_created_id (user_id, created_at, id),
+    INDEX idx_status_created_id (response_status_code, created_at, id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
@@ -313,14 +396,24 @@ def main():
         ("yt_work_info", CREATE_YT_WORK_INFO_TABLE_SQL),
         ("berth_schedule", CREATE_BERTH_SCHEDULE_TABLE_SQL),
         
+        # AIS 선박별 최신 위치 (ais_latest_position.py)
+        ("ais_latest_position", CREATE_AIS_LATEST_POSITION_TABLE_SQL),
+        
         # 데이터 검사 관련 테이블들
         ("data_inspection_info", CREATE_DATA_INSPECTION_INFO_TABLE_SQL),
         ("data_inspection_results", CREATE_DATA_INSPECTION_RESULTS_TABLE_SQL),
         ("data_inspection_summary", CREATE_DATA_INSPECTION_SUMMARY_TABLE_SQL),
+        ("quality_daily_rollup", CREATE_QUALITY_DAILY_ROLLUP_TABLE_SQL),
+        ("field_quality_stats", CREATE_FIELD_QUALITY_STATS_TABLE_SQL),
         
         # API 호출 및 응답 데이터 관련 테이블들
         ("api_call_info", CREATE_API_CALL_INFO_TABLE_SQL),
-        ("api_response_data", CREATE_API_RESPONSE_DATA_TABLE_SQL)
+        ("api_response_data", CREATE_API_RESPONSE_DATA_TABLE_SQL),
+        
+        # UI 통계 집계 테이블들
+        ("ui_page_visit_hourly", CREATE_UI_PAGE_VISIT_HOURLY_TABLE_SQL),
+        ("ui_api_call_hourly", CREATE_UI_API_CALL_HOURLY_TABLE_SQL),
+        ("ui_visitor_hll", CREATE_UI_VISITOR_HLL_TABLE_SQL)
     ]
     
     print("\n📝 테이블 추가 시작...")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+선박별 최신 위치 테이블 (ais_latest_position) 갱신
+
+ais_info 는 수신한 AIS 이력을 모두 쌓으므로 "선박별 최신 위치" 를 구하려면
+GROUP BY mmsiNo + 자기 조인이 필요합니다. 대신 동기화(sync_service/db_sync_manager.py)가
+ais_info 에 저장할 때마다 이 테이블을 MMSI 기준으로 upsert 하고,
+백엔드의 /ais/latest, /ais/live-map 은 선박 수만큼의 행만 읽습니다.
+
+dt_pos_utc 가 기존 행보다 최신인 경우에만 덮어쓰므로 늦게 도착한 과거 위치는 무시됩니다.
+dt_pos_utc 는 YYYYMMDDHHMMSS 문자열이므로 문자열 비교로 최신 여부를 판단합니다.
+
+기존 ais_info 이력으로 처음 채울 때는 backfill_ais_latest_position.py 를 실행합니다.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# ais_info 와 같은 컬럼 (id, created_at 제외)
+LATEST_POSITION_COLUMNS = [
+    "mmsiNo", "imoNo", "vsslNm", "callLetter", "vsslTp", "vsslTpCd", "vsslTpCrgo", "vsslCls",
+    "vsslLen", "vsslWidth", "flag", "flagCd", "vsslDefBrd", "lon", "lat", "sog", "cog", "rot",
+    "headSide", "vsslNavi", "vsslNaviCd", "source", "dt_pos_utc", "dt_static_utc",
+    "vsslTpMain", "vsslTpSub", "dstNm", "dstCd", "eta"
+]
+
+CREATE_AIS_LATEST_POSITION_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ais_latest_position (
+    mmsiNo VARCHAR(20) NOT NULL,
+    imoNo VARCHAR(20),
+    vsslNm VARCHAR(200),
+    callLetter VARCHAR(20),
+    vsslTp VARCHAR(100),
+    vsslTpCd VARCHAR(10),
+    vsslTpCrgo VARCHAR(100),
+    vsslCls VARCHAR(10),
+    vsslLen DECIMAL(10,2),
+    vsslWidth DECIMAL(10,2),
+    flag VARCHAR(100),
+    flagCd VARCHAR(10),
+    vsslDefBrd DECIMAL(10,2),
+    lon DECIMAL(15,10),
+    lat DECIMAL(15,10),
+    sog DECIMAL(8,2),
+    cog DECIMAL(8,2),
+    rot DECIMAL(8,2),
+    headSide VARCHAR(10),
+    vsslNavi VARCHAR(100),
+    vsslNaviCd VARCHAR(10),
+    source VARCHAR(50),
+    dt_pos_utc VARCHAR(20),  -- YYYYMMDDHHMMSS, 더 최신일 때만 갱신
+    dt_static_utc VARCHAR(20),
+    vsslTpMain VARCHAR(100),
+    vsslTpSub VARCHAR(100),
+    dstNm VARCHAR(100),
+    dstCd VARCHAR(20),
+    eta VARCHAR(20),
+    -- 0.1도 격자 셀 (backend/utils/geo.py GRID_CELL_SQL 과 같은 식, 영역/반경 검색 후보 필터)
+    grid_cell INT AS (LEAST(GREATEST(FLOOR((lat + 90) * 10), 0), 1799) * 3600 + MOD(FLOOR((lon + 180) * 10), 3600)) STORED,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (mmsiNo),
+    INDEX idx_dt_pos_utc (dt_pos_utc),
+    INDEX idx_grid_cell (grid_cell)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
+
+# 기존 행이 없거나 더 오래된 경우에만 새 값 사용
+# (INSERT ... SELECT 에서도 모호하지 않도록 기존 값은 테이블명으로 한정)
+NEWER_CONDITION = (
+    "(ais_latest_position.dt_pos_utc IS NULL"
+    " OR VALUES(dt_pos_utc) > ais_latest_position.dt_pos_utc)"
+)
+
+
+def build_upsert_clause(columns: List[str]) -> str:
+    """
+    최신 위치만 반영하는 ON DUPLICATE KEY UPDATE 절
+
+    MySQL 은 SET 을 왼쪽부터 적용하므로 dt_pos_utc 를 마지막에 갱신해야
+    다른 컬럼의 비교가 모두 기존 dt_pos_utc 기준으로 이루어집니다.
+    """
+    updates = [
+        f"{column} = IF({NEWER_CONDITION}, VALUES({column}), ais_latest_position.{column})"
+        for column in columns if column not in ("mmsiNo", "dt_pos_utc")
+    ]
+    updates.append(f"dt_pos_utc = IF({NEWER_CONDITION}, VALUES(dt_pos_utc), ais_latest_position.dt_pos_utc)")
+    return "ON DUPLICATE KEY UPDATE\n            " + ",\n            ".join(updates)
+
+
+def build_upsert_query(columns: List[str]) -> str:
+    """ais_latest_position upsert 쿼리 (columns 는 LATEST_POSITION_COLUMNS 의 부분집합)"""
+    return f"""
+        INSERT INTO ais_latest_position ({', '.join(columns)})
+        VALUES ({', '.join(['%s'] * len(columns))})
+        {build_upsert_clause(columns)}
+    """
+
+
+def pick_latest(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """배치 안에서 MMSI 별 가장 최신 행만 남김 (MMSI 순 정렬, 잠금 순서 고정)"""
+    latest = {}
+    for row in rows:
+        mmsi = row.get("mmsiNo")
+        if mmsi in (None, ""):
+            continue
+        mmsi = str(mmsi)
+        current = latest.get(mmsi)
+        if current is None or str(row.get("dt_pos_utc") or "") >= str(current.get("dt_pos_utc") or ""):
+            latest[mmsi] = row
+    return [latest[mmsi] for mmsi in sorted(latest)]
+
+
+def upsert_latest_positions(cursor, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    ais_info 에 저장한 행으로 선박별 최신 위치 갱신
+
+    Args:
+        cursor: pymysql 커서 (커밋은 호출자가 처리)
+        rows: ais_info 행 dict 목록
+
+    Returns:
+        반영 대상 선박 수
+    """
+    latest_rows = pick_latest(rows)
+    if not latest_rows:
+        return 0
+
+    columns = [column for column in LATEST_POSITION_COLUMNS if column in latest_rows[0]]
+    if "dt_pos_utc" not in columns:
+        logger.warning("⚠️ dt_pos_utc 가 없는 AIS 데이터는 최신 위치에 반영하지 않습니다")
+        return 0
+
+    cursor.executemany(build_upsert_query(columns), [
+        tuple(row.get(column) for column in columns) for row in latest_rows
+    ])
+    return len(latest_rows)
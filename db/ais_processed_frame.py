@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+AIS 가공 데이터 일괄 계산 (DataFrame 컬럼 연산)
+
+AISProcessedInfo(ais_value_object.py)는 선박 한 건마다 객체를 만들고 math 함수와 if/elif 로
+위치 구역, 속도/방향, 크기/화물 구분, 시간대, 위험도를 계산합니다.
+여기서는 같은 규칙을 AIS 행 묶음(pandas DataFrame)의 컬럼 단위 NumPy 연산으로 한 번에 계산하므로
+하루치 위치 데이터도 객체 생성 없이 처리할 수 있습니다.
+
+    frame = ais_info_frame(ais_service.load_all_data())   # 또는 ais_info 조회 결과 DataFrame
+    processed = compute_processed_columns(frame)          # 가공 컬럼 12개
+    enriched = enrich_ais_frame(frame)                     # 원본 + 가공 컬럼
+
+입력 컬럼은 AISInfo 이름(vssl_len, vssl_tp, vssl_navi, dt_pos_utc ...)과
+ais_info 테이블 이름(vsslLen, vsslTp, vsslNavi ...)을 모두 받습니다.
+결과는 AISProcessedInfo.get_processed_info() 와 같은 값이며, 값이 없는 항목은 None
+(distance_from_port 는 NaN, processed_info_records 에서는 None)입니다.
+distance_from_port 는 NumPy 삼각함수 구현 차이로 math 결과와 마지막 자리(상대 오차 1e-15 수준)가 다를 수 있습니다.
+
+다른 점: 숫자 컬럼(lon, lat, sog, cog, vssl_len)의 NaN 은 None 과 같이 값 없음으로 처리합니다.
+DataFrame 은 DB NULL(None)을 숫자 컬럼에서 NaN 으로 바꾸므로 둘을 구분할 수 없기 때문입니다.
+AISProcessedInfo 는 float NaN(또는 문자열 "nan")을 참으로 보아
+lon/lat NaN → "원양", sog NaN → "고속"(is_moving True), vssl_len NaN → "대형", cog NaN → "NW" 가 되지만
+여기서는 각각 None, "정박"(is_moving False), None, None 입니다.
+비교 검증은 test_ais_processed_frame.py 를 참고하세요.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+# 기준 항구 (부산항)
+BUSAN_PORT_LON, BUSAN_PORT_LAT = 129.0, 35.1
+EARTH_RADIUS_NM = 3440.065  # 지구 반지름 (해리)
+
+# 구간 경계 (np.digitize: bins[i-1] <= x < bins[i])
+PORT_DISTANCE_BINS = [10, 50]  # 해리
+PORT_ZONES = np.array(["부산항", "부산항 근해", "원양"], dtype=object)
+
+SPEED_BINS = [5, 15]  # 노트 (0/없음은 정박)
+SPEED_CATEGORIES = np.array(["저속", "중속", "고속"], dtype=object)
+
+COURSE_BINS = [22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5]
+COURSE_DIRECTIONS = np.array(["N", "NE", "E", "SE", "S", "SW", "W", "NW", "N"], dtype=object)
+
+SHIP_SIZE_BINS = [100, 200]  # 미터
+SHIP_SIZE_CATEGORIES = np.array(["소형", "중형", "대형"], dtype=object)
+
+# 선박 타입 문자열에 포함된 키워드 (앞에서부터 우선)
+CARGO_KEYWORDS = [("CARGO", "화물선"), ("TANKER", "탱커선"), ("CONTAINER", "컨테이너선")]
+
+HOUR_BINS = [5, 12, 17, 21]  # UTC 시
+TIME_CATEGORIES = np.array(["밤", "오전", "오후", "저녁", "밤"], dtype=object)
+
+RISK_LEVELS = [(4, "높음", 0.8), (2, "보통", 0.5)]
+DEFAULT_RISK = ("낮음", 0.2)
+
+PROCESSED_COLUMNS = [
+    "location_zone", "is_in_port", "distance_from_port",
+    "speed_category", "course_direction", "is_moving",
+    "ship_size_category", "cargo_type_category",
+    "time_category", "is_recent_data",
+    "risk_level", "collision_risk"
+]
+
+# AISInfo 필드명 → ais_info 테이블 컬럼명
+TABLE_COLUMN_NAMES = {
+    "vssl_len": "vsslLen",
+    "vssl_tp": "vsslTp",
+    "vssl_navi": "vsslNavi",
+}
+
+
+def ais_info_frame(ships: Iterable[Any]) -> pd.DataFrame:
+    """AISInfo 객체 목록을 DataFrame 으로 변환 (AISService.load_* 결과용)"""
+    return pd.DataFrame.from_records([vars(ship) for ship in ships])
+
+
+def _column(frame: pd.DataFrame, name: str) -> pd.Series:
+    """AISInfo 이름 또는 ais_info 컬럼명으로 컬럼 조회 (없으면 전부 None)"""
+    for column in (name, TABLE_COLUMN_NAMES.get(name)):
+        if column and column in frame.columns:
+            return frame[column]
+    return pd.Series(None, index=frame.index, dtype=object)
+
+
+def _numeric(frame: pd.DataFrame, name: str) -> np.ndarray:
+    """숫자 컬럼 (AISInfo.__post_init__ 처럼 변환할 수 없는 값은 NaN)"""
+    return pd.to_numeric(_column(frame, name), errors="coerce").to_numpy(dtype=float)
+
+
+def _map_unique(frame: pd.DataFrame, name: str, func, missing: Any, dtype=object) -> np.ndarray:
+    """
+    문자열 컬럼을 고유값마다 한 번만 func 로 변환해 행 배열로 펼침
+
+    선박 타입/항해 상태/수신 시각은 행 수보다 고유값이 훨씬 적으므로
+    pandas 문자열 연산(행마다 Python 호출)보다 factorize 후 고유값만 계산하는 편이 빠르고,
+    AISProcessedInfo 와 같은 Python 연산을 쓰므로 결과도 같습니다. (None/NaN → missing)
+    """
+    codes, uniques = pd.factorize(_column(frame, name))
+    mapped = np.array([func(value) for value in uniques] + [missing], dtype=dtype)
+    return mapped[codes]
+
+
+def _cargo_type_category(vssl_tp: Any) -> Any:
+    if not vssl_tp:
+        return None
+    vssl_tp = str(vssl_tp).upper()
+    for keyword, category in CARGO_KEYWORDS:
+        if keyword in vssl_tp:
+            return category
+    return "기타"
+
+
+def _hour(dt_pos_utc: Any) -> float:
+    """YYYYMMDDHHMMSS 의 시 (읽을 수 없으면 NaN)"""
+    if not dt_pos_utc:
+        return np.nan
+    try:
+        return int(str(dt_pos_utc)[8:10])
+    except ValueError:
+        return np.nan
+
+
+def _categorize(values: np.ndarray, bins: List[float], labels: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """구간 라벨 (valid 가 아닌 행은 None)"""
+    index = np.digitize(np.where(valid, values, 0), bins)
+    return np.where(valid, labels[index], None)
+
+
+def haversine_nm(lon: np.ndarray, lat: np.ndarray, lon2: float, lat2: float) -> np.ndarray:
+    """각 좌표에서 한 지점까지의 거리 (해리, AISProcessedInfo._calculate_distance 와 같은 식)"""
+    lat1_rad = np.radians(lat)
+    lat2_rad = np.radians(lat2)
+    delta_lat = np.radians(lat2 - lat)
+    delta_lon = np.radians(lon2 - lon)
+
+    a = (np.sin(delta_lat / 2) ** 2 +
+         np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2)
+    return EARTH_RADIUS_NM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def compute_processed_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    AIS 행 묶음의 가공 컬럼 계산
+
+    Args:
+        frame: AIS 행 DataFrame (lon, lat, sog, cog, vssl_len, vssl_tp, vssl_navi, dt_pos_utc)
+
+    Returns:
+        pd.DataFrame: frame 과 같은 index 의 PROCESSED_COLUMNS
+    """
+    lon = _numeric(frame, "lon")
+    lat = _numeric(frame, "lat")
+    sog = _numeric(frame, "sog")
+    cog = _numeric(frame, "cog")
+    vssl_len = _numeric(frame, "vssl_len")
+
+    # 위치: 경도/위도가 모두 있고 0 이 아닐 때만
+    has_position = ~np.isnan(lon) & ~np.isnan(lat) & (lon != 0) & (lat != 0)
+    distance = np.where(has_position, haversine_nm(lon, lat, BUSAN_PORT_LON, BUSAN_PORT_LAT), np.nan)
+    location_zone = _categorize(distance, PORT_DISTANCE_BINS, PORT_ZONES, has_position)
+    is_in_port = has_position & (distance < PORT_DISTANCE_BINS[0])
+
+    # 항해: 속도 없음/0 은 정박
+    has_speed = ~np.isnan(sog) & (sog != 0)
+    speed_category = np.where(has_speed, SPEED_CATEGORIES[np.digitize(np.where(has_speed, sog, 0), SPEED_BINS)], "정박")
+    course_direction = _categorize(cog, COURSE_BINS, COURSE_DIRECTIONS, ~np.isnan(cog))
+
+    # 선박: 길이 0/없음, 타입 빈 값은 구분하지 않음
+    ship_size_category = _categorize(vssl_len, SHIP_SIZE_BINS, SHIP_SIZE_CATEGORIES, ~np.isnan(vssl_len) & (vssl_len != 0))
+    cargo_type_category = _map_unique(frame, "vssl_tp", _cargo_type_category, None)
+
+    # 시간: dt_pos_utc(YYYYMMDDHHMMSS) 의 시, 읽을 수 없으면 구분하지 않음
+    hour = _map_unique(frame, "dt_pos_utc", _hour, np.nan, dtype=float)
+    has_hour = ~np.isnan(hour)
+    time_category = _categorize(hour, HOUR_BINS, TIME_CATEGORIES, has_hour)
+
+    # 위험도: 고속 +2 / 10노트 초과 +1, 항구 내 10노트 초과 +3, 계류(MOORED) 아님 +1
+    risk_score = np.select([has_speed & (sog > 15), has_speed & (sog > 10)], [2, 1], default=0)
+    risk_score = risk_score + np.where(is_in_port & has_speed & (sog > 10), 3, 0)
+    risk_score = risk_score + _map_unique(frame, "vssl_navi", lambda navi: navi != "MOORED", True, dtype=int)
+    risk_conditions = [risk_score >= threshold for threshold, _, _ in RISK_LEVELS]
+    risk_level = np.select(risk_conditions, [level for _, level, _ in RISK_LEVELS], default=DEFAULT_RISK[0]).astype(object)
+    collision_risk = np.select(risk_conditions, [risk for _, _, risk in RISK_LEVELS], default=DEFAULT_RISK[1])
+
+    return pd.DataFrame({
+        "location_zone": location_zone,
+        "is_in_port": is_in_port,
+        "distance_from_port": distance,
+        "speed_category": speed_category.astype(object),
+        "course_direction": course_direction,
+        "is_moving": has_speed,
+        "ship_size_category": ship_size_category,
+        "cargo_type_category": cargo_type_category,
+        "time_category": time_category,
+        "is_recent_data": has_hour,
+        "risk_level": risk_level,
+        "collision_risk": collision_risk,
+    }, index=frame.index, columns=PROCESSED_COLUMNS)
+
+
+def enrich_ais_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """원본 AIS 컬럼 뒤에 가공 컬럼을 붙인 DataFrame (같은 이름의 기존 컬럼은 대체)"""
+    return frame.drop(columns=PROCESSED_COLUMNS, errors="ignore").join(compute_processed_columns(frame))
+
+
+def processed_info_records(processed: pd.DataFrame) -> List[Dict[str, Any]]:
+    """가공 컬럼을 get_processed_info() 형식의 dict 목록으로 변환 (NaN 은 None)"""
+    processed = processed[PROCESSED_COLUMNS].astype(object)
+    return processed.where(processed.notna(), None).to_dict("records")
@@ -11,6 +11,7 @@ from ais_service import AISInfo
 class AISProcessedInfo(AISInfo):
     """
     AISInfo를 상속받아 가공된 데이터를 추가로 저장하는 클래스
+    여러 건을 한 번에 가공할 때는 ais_processed_frame.compute_processed_columns (DataFrame 일괄 계산)를 사용
     """
     # 가공된 위치 정보
     location_zone: Optional[str] = None  # 위치 구역 (예: 부산항, 인천항 등)
@@ -12,6 +12,7 @@ import json
 
 from data_inspection_service import DataInspectionService
 from api_data_service import APIDataService
+from cache_invalidation import cache_invalidation_publisher
 
 app = FastAPI(title="Data Quality Inspection API")
 
@@ -71,9 +72,11 @@ async def receive_inspection_results(data: InspectionData):
         inspection_service.save_inspection_info(data.inspection_info)
         
         # 2. 검사 결과 저장
-        for result in data.inspection_results:
-            result_dict = result.dict()
-            inspection_service.save_inspection_results(inspection_id, [result_dict])
+        data_source = inspection_service.save_inspection_results(
+            inspection_id, [result.dict() for result in data.inspection_results]
+        )
+        # 해당 데이터 소스의 대시보드 캐시 무효화
+        cache_invalidation_publisher.publish([data_source], source="api", reference=inspection_id)
         
         # 3. 검사 요약 저장
         summary_dict = data.inspection_summary.dict()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+선박별 최신 위치 백필 스크립트
+
+ais_info 이력 전체에서 MMSI 별 가장 최신(dt_pos_utc) 행을 골라 ais_latest_position 을 채웁니다.
+이후에는 동기화 서비스가 ais_info 저장 시 증분으로 갱신하므로, 테이블을 처음 만들었을 때나
+동기화를 거치지 않고 ais_info 에 데이터를 넣은 뒤에만 실행하면 됩니다.
+기존 행보다 최신인 위치만 반영하므로 여러 번 실행해도 결과가 같습니다.
+
+dt_pos_utc 가 모두 비어 있는 선박은 최신 위치를 판단할 수 없어 제외됩니다.
+
+사용법:
+    python backfill_ais_latest_position.py
+"""
+
+import logging
+
+import pymysql
+
+from database_config import MYSQL_CONFIG
+from ais_latest_position import (
+    LATEST_POSITION_COLUMNS,
+    CREATE_AIS_LATEST_POSITION_TABLE_SQL,
+    build_upsert_clause
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+COLUMN_LIST = ", ".join(LATEST_POSITION_COLUMNS)
+
+# MMSI 별 최신 dt_pos_utc 와 같은 행만 INSERT ... SELECT (동률이면 id 가 가장 큰 행 유지)
+BACKFILL_SQL = f"""
+INSERT INTO ais_latest_position ({COLUMN_LIST})
+SELECT {", ".join(f"a.{column}" for column in LATEST_POSITION_COLUMNS)}
+FROM ais_info a
+JOIN (
+    SELECT mmsiNo, MAX(dt_pos_utc) as dt_pos_utc
+    FROM ais_info
+    WHERE mmsiNo IS NOT NULL AND mmsiNo <> ''
+    GROUP BY mmsiNo
+) latest ON a.mmsiNo = latest.mmsiNo AND a.dt_pos_utc = latest.dt_pos_utc
+ORDER BY a.mmsiNo, a.id DESC
+{build_upsert_clause(LATEST_POSITION_COLUMNS)}
+"""
+
+
+def backfill(conn):
+    """ais_info 이력으로 선박별 최신 위치 채우기"""
+    cursor = conn.cursor()
+    cursor.execute(CREATE_AIS_LATEST_POSITION_TABLE_SQL)
+
+    cursor.execute(BACKFILL_SQL)
+    logger.info(f"✅ ais_latest_position 반영: {cursor.rowcount:,}행 영향")
+    conn.commit()
+
+    cursor.execute("SELECT COUNT(*), MAX(dt_pos_utc) FROM ais_latest_position")
+    vessels, last_position = cursor.fetchone()
+    logger.info(f"  선박 {vessels:,}척, 최신 위치 시각 {last_position}")
+
+
+def main():
+    conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        backfill(conn)
+
+        logger.info("🎉 선박별 최신 위치 백필 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 백필 실패: {e}")
+        if conn:
+            conn.rollback()
+            logger.info("🔄 변경사항 롤백 완료")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
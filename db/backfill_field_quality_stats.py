@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+field_quality_stats 백필 스크립트
+
+기존 data_inspection_results 의 details JSON 을 한 번만 파싱해
+검사 × 필드 × check_type 별 통계를 다시 만듭니다.
+지정한 기간의 통계 행을 지운 뒤 검사 단위로 채우므로 여러 번 실행해도 결과가 같습니다.
+
+평소에는 DataInspectionService.save_inspection_results() 가 저장 시점에 통계를 갱신하므로,
+테이블을 처음 만들었을 때나 저장 경로를 거치지 않은 데이터를 넣은 뒤에만 실행하면 됩니다.
+
+사용법:
+    python backfill_field_quality_stats.py                      # 전체 기간 재계산
+    python backfill_field_quality_stats.py --since 2025-08-01   # 특정 날짜 이후만
+"""
+
+import argparse
+import logging
+
+import pymysql
+import pymysql.cursors
+
+from database_config import MYSQL_CONFIG
+from add_tables import CREATE_FIELD_QUALITY_STATS_TABLE_SQL
+from data_inspection_service import UPSERT_FIELD_STATS_SQL, build_field_stats_rows
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 한 번에 커밋할 검사(inspection_id) 수
+COMMIT_EVERY = 100
+
+
+def iter_inspections(conn, since: str = None):
+    """검사 결과를 inspection_id 순으로 스트리밍하며 검사 단위로 묶어 반환"""
+    where, params = "details IS NOT NULL", []
+    if since:
+        where += " AND created_at >= %s"
+        params.append(since)
+
+    cursor = conn.cursor(pymysql.cursors.SSDictCursor)
+    try:
+        cursor.execute(f"""
+            SELECT inspection_id, data_source, check_type, status, affected_rows, details, created_at
+            FROM data_inspection_results
+            WHERE {where}
+            ORDER BY inspection_id, id
+        """, params)
+
+        current_id, results = None, []
+        for row in cursor:
+            if row['inspection_id'] != current_id:
+                if results:
+                    yield current_id, results
+                current_id, results = row['inspection_id'], []
+            results.append(row)
+        if results:
+            yield current_id, results
+    finally:
+        cursor.close()
+
+
+def backfill(conn, write_conn, since: str = None):
+    """지정 기간의 필드별 통계를 재계산"""
+    cursor = write_conn.cursor()
+    cursor.execute(CREATE_FIELD_QUALITY_STATS_TABLE_SQL)
+
+    if since:
+        cursor.execute("DELETE FROM field_quality_stats WHERE created_at >= %s", (since,))
+    else:
+        cursor.execute("DELETE FROM field_quality_stats")
+    logger.info(f"🗑️ 기존 통계 삭제: {cursor.rowcount:,}행")
+    write_conn.commit()
+
+    inspections = 0
+    field_rows = 0
+    for inspection_id, results in iter_inspections(conn, since):
+        rows = build_field_stats_rows(
+            inspection_id, results[0]['data_source'], results, created_at=results[0]['created_at']
+        )
+        if rows:
+            cursor.executemany(UPSERT_FIELD_STATS_SQL, rows)
+            field_rows += len(rows)
+
+        inspections += 1
+        if inspections % COMMIT_EVERY == 0:
+            write_conn.commit()
+            logger.info(f"  ... {inspections:,}개 검사 처리 ({field_rows:,}행)")
+
+    write_conn.commit()
+    logger.info(f"✅ 통계 생성: 검사 {inspections:,}개, {field_rows:,}행")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='field_quality_stats 백필')
+    parser.add_argument('--since', help='재계산 시작 날짜 (YYYY-MM-DD, 포함)')
+    args = parser.parse_args()
+
+    # 스트리밍 조회 중에는 같은 연결로 쓰기를 할 수 없으므로 읽기/쓰기 연결을 분리
+    conn = write_conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        write_conn = pymysql.connect(**MYSQL_CONFIG)
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        backfill(conn, write_conn, args.since)
+
+        logger.info("🎉 field_quality_stats 백필 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 백필 실패: {e}")
+        if write_conn:
+            write_conn.rollback()
+            logger.info("🔄 변경사항 롤백 완료")
+    finally:
+        for connection in (conn, write_conn):
+            if connection:
+                connection.close()
+        logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
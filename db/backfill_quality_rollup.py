@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+quality_daily_rollup 백필 스크립트
+
+data_inspection_results 원본 행으로부터 (data_source, check_type, day) 일별 집계를
+다시 계산합니다. 지정한 기간의 집계 행을 지운 뒤 한 번의 INSERT ... SELECT 로
+채우므로 여러 번 실행해도 결과가 같습니다.
+
+평소에는 DataInspectionService.save_inspection_results() 가 증분으로 집계를 갱신하므로,
+테이블을 처음 만들었을 때나 집계 경로를 거치지 않은 데이터(더미 데이터 생성 등)를
+넣은 뒤에만 실행하면 됩니다. 오늘 날짜를 포함해 다시 계산할 때는 수집(MQTT)이
+멈춘 상태에서 실행하는 것이 안전합니다.
+
+사용법:
+    python backfill_quality_rollup.py                      # 전체 기간 재계산
+    python backfill_quality_rollup.py --since 2025-08-01   # 특정 날짜 이후만
+    python backfill_quality_rollup.py --since 2025-08-01 --until 2025-08-31
+"""
+
+import argparse
+import logging
+
+import pymysql
+
+from database_config import MYSQL_CONFIG
+from add_tables import CREATE_QUALITY_DAILY_ROLLUP_TABLE_SQL
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+REBUILD_SQL = """
+INSERT INTO quality_daily_rollup (
+    data_source, check_type, day, total_checks, pass_count, fail_count, inspection_count
+)
+SELECT
+    COALESCE(data_source, '') as data_source,
+    check_type,
+    DATE(created_at) as day,
+    COUNT(*) as total_checks,
+    SUM(CASE WHEN status = 'PASS' THEN 1 ELSE 0 END) as pass_count,
+    SUM(CASE WHEN status = 'FAIL' THEN 1 ELSE 0 END) as fail_count,
+    COUNT(DISTINCT inspection_id) as inspection_count
+FROM data_inspection_results
+WHERE {where}
+GROUP BY COALESCE(data_source, ''), check_type, DATE(created_at)
+"""
+
+
+def build_range_conditions(since: str = None, until: str = None, column: str = 'created_at'):
+    """--since/--until 을 인덱스를 탈 수 있는 범위 조건으로 변환"""
+    conditions, params = [], []
+    if since:
+        conditions.append(f"{column} >= %s")
+        params.append(since)
+    if until:
+        conditions.append(f"{column} < DATE_ADD(%s, INTERVAL 1 DAY)")
+        params.append(until)
+    return " AND ".join(conditions) or "1 = 1", params
+
+
+def backfill(conn, since: str = None, until: str = None):
+    """지정 기간의 일별 집계를 재계산"""
+    cursor = conn.cursor()
+    cursor.execute(CREATE_QUALITY_DAILY_ROLLUP_TABLE_SQL)
+
+    rollup_where, rollup_params = build_range_conditions(since, until, column='day')
+    cursor.execute(f"DELETE FROM quality_daily_rollup WHERE {rollup_where}", rollup_params)
+    logger.info(f"🗑️ 기존 집계 삭제: {cursor.rowcount:,}행")
+
+    source_where, source_params = build_range_conditions(since, until)
+    cursor.execute(REBUILD_SQL.format(where=source_where), source_params)
+    logger.info(f"✅ 집계 생성: {cursor.rowcount:,}행")
+
+    conn.commit()
+
+    cursor.execute("""
+        SELECT data_source, COUNT(*), MIN(day), MAX(day), SUM(total_checks)
+        FROM quality_daily_rollup
+        GROUP BY data_source
+        ORDER BY data_source
+    """)
+    for data_source, days, first_day, last_day, total_checks in cursor.fetchall():
+        logger.info(f"  {data_source or '(unknown)'}: {days:,}행 ({first_day} ~ {last_day}), 검사 {int(total_checks):,}건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='quality_daily_rollup 백필')
+    parser.add_argument('--since', help='재계산 시작 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--until', help='재계산 종료 날짜 (YYYY-MM-DD, 포함)')
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        backfill(conn, args.since, args.until)
+
+        logger.info("🎉 quality_daily_rollup 백필 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 백필 실패: {e}")
+        if conn:
+            conn.rollback()
+            logger.info("🔄 변경사항 롤백 완료")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI 통계 집계 백필 스크립트
+
+ui_log_page_visits / api_call_info 원본 행으로부터
+ui_page_visit_hourly, ui_api_call_hourly 시간별 집계와
+ui_visitor_hll 고유 사용자 스케치를 다시 계산합니다.
+지정한 기간의 집계 행을 지운 뒤 다시 채우므로 여러 번 실행해도 결과가 같습니다.
+
+    - 시간별 집계: 기간 삭제 후 INSERT ... SELECT 한 번
+    - 일별 스케치: 기간의 (날짜, user_id) 를 스트리밍하며 다시 생성
+    - 주/월/전체 스케치: 저장된 일별 스케치를 모두 합쳐 다시 생성
+
+평소에는 backend/services/log_writer.py 가 로그 기록 시 증분으로 집계를 갱신하므로,
+테이블을 처음 만들었을 때나 기록기를 거치지 않은 로그를 넣은 뒤에만 실행하면 됩니다.
+오늘 날짜를 포함해 다시 계산할 때는 백엔드를 멈춘 상태에서 실행하는 것이 안전합니다.
+
+사용법:
+    python backfill_ui_rollup.py                      # 전체 기간 재계산
+    python backfill_ui_rollup.py --since 2025-08-01   # 특정 날짜 이후만
+    python backfill_ui_rollup.py --since 2025-08-01 --until 2025-08-31
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+
+import pymysql
+import pymysql.cursors
+
+from database_config import MYSQL_CONFIG
+from add_tables import (
+    CREATE_UI_PAGE_VISIT_HOURLY_TABLE_SQL,
+    CREATE_UI_API_CALL_HOURLY_TABLE_SQL,
+    CREATE_UI_VISITOR_HLL_TABLE_SQL
+)
+from backfill_quality_rollup import build_range_conditions
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+from utils.hyperloglog import HyperLogLog  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 시 단위로 자른 시각 (services/ui_rollup.truncate_hour 와 같은 값)
+HOUR_EXPR = "DATE_ADD(DATE({column}), INTERVAL HOUR({column}) HOUR)"
+
+REBUILD_PAGE_VISITS_SQL = f"""
+INSERT INTO ui_page_visit_hourly (
+    hour, page_name, login_status, visit_count, duration_sum, duration_count
+)
+SELECT
+    {HOUR_EXPR.format(column='created_at')} as hour,
+    COALESCE(page_name, '') as page_name,
+    COALESCE(login_status, '') as login_status,
+    COUNT(*) as visit_count,
+    COALESCE(SUM(visit_duration), 0) as duration_sum,
+    COUNT(visit_duration) as duration_count
+FROM ui_log_page_visits
+WHERE {{where}}
+GROUP BY 1, 2, 3
+"""
+
+REBUILD_API_CALLS_SQL = f"""
+INSERT INTO ui_api_call_hourly (
+    hour, api_endpoint, call_count, error_count, response_time_sum, response_time_count
+)
+SELECT
+    {HOUR_EXPR.format(column='created_at')} as hour,
+    COALESCE(api_endpoint, '') as api_endpoint,
+    COUNT(*) as call_count,
+    SUM(CASE WHEN response_status_code >= 400 THEN 1 ELSE 0 END) as error_count,
+    COALESCE(SUM(response_time_ms), 0) as response_time_sum,
+    COUNT(response_time_ms) as response_time_count
+FROM api_call_info
+WHERE {{where}}
+GROUP BY 1, 2
+"""
+
+UPSERT_VISITOR_HLL_SQL = """
+INSERT INTO ui_visitor_hll (period_type, period_key, sketch)
+VALUES (%s, %s, %s)
+ON DUPLICATE KEY UPDATE sketch = VALUES(sketch)
+"""
+
+
+def visitor_periods(day):
+    """일별 스케치가 합쳐질 기간 (backend/services/ui_rollup.visitor_periods 와 같은 규칙)"""
+    iso_year, iso_week, _ = day.isocalendar()
+    return [
+        ('week', f"{iso_year}{iso_week:02d}"),
+        ('month', day.strftime('%Y-%m')),
+        ('all', 'all'),
+    ]
+
+
+def rebuild_counts(cursor, since: str = None, until: str = None):
+    """시간별 방문/API 호출 집계 재계산"""
+    rollup_where, rollup_params = build_range_conditions(since, until, column='hour')
+    source_where, source_params = build_range_conditions(since, until)
+
+    for table, rebuild_sql in (("ui_page_visit_hourly", REBUILD_PAGE_VISITS_SQL),
+                               ("ui_api_call_hourly", REBUILD_API_CALLS_SQL)):
+        cursor.execute(f"DELETE FROM {table} WHERE {rollup_where}", rollup_params)
+        logger.info(f"🗑️ {table} 기존 집계 삭제: {cursor.rowcount:,}행")
+        cursor.execute(rebuild_sql.format(where=source_where), source_params)
+        logger.info(f"✅ {table} 집계 생성: {cursor.rowcount:,}행")
+
+
+def rebuild_day_sketches(conn, since: str = None, until: str = None):
+    """기간의 일별 고유 사용자 스케치 재생성 (DISTINCT (날짜, user_id) 스트리밍)"""
+    where, params = build_range_conditions(since, until)
+    sketches = {}
+    with conn.cursor(pymysql.cursors.SSCursor) as stream:
+        stream.execute(f"""
+            SELECT DISTINCT DATE(created_at), user_id
+            FROM ui_log_page_visits
+            WHERE {where}
+        """, params)
+        for day, user_id in stream:
+            sketches.setdefault(day, HyperLogLog()).add(user_id)
+
+    # period_key(YYYY-MM-DD)는 문자열 비교로 날짜 범위를 표현할 수 있음
+    conditions, params = ["period_type = 'day'"], []
+    if since:
+        conditions.append("period_key >= %s")
+        params.append(since)
+    if until:
+        conditions.append("period_key <= %s")
+        params.append(until)
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM ui_visitor_hll WHERE {' AND '.join(conditions)}", params)
+    cursor.executemany(UPSERT_VISITOR_HLL_SQL, [
+        ('day', day.strftime('%Y-%m-%d'), sketch.to_bytes()) for day, sketch in sorted(sketches.items())
+    ])
+    logger.info(f"✅ 일별 고유 사용자 스케치 생성: {len(sketches):,}일")
+
+
+def rebuild_period_sketches(conn):
+    """저장된 일별 스케치를 합쳐 주/월/전체 스케치 재생성"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT period_key, sketch FROM ui_visitor_hll WHERE period_type = 'day'")
+    merged = {}
+    for period_key, stored in cursor.fetchall():
+        day_sketch = HyperLogLog.from_bytes(stored)
+        day = datetime.strptime(period_key, '%Y-%m-%d').date()
+        for period in visitor_periods(day):
+            merged.setdefault(period, HyperLogLog()).merge(day_sketch)
+
+    cursor.execute("DELETE FROM ui_visitor_hll WHERE period_type IN ('week', 'month', 'all')")
+    cursor.executemany(UPSERT_VISITOR_HLL_SQL, [
+        (period_type, period_key, sketch.to_bytes()) for (period_type, period_key), sketch in sorted(merged.items())
+    ])
+    logger.info(f"✅ 주/월/전체 고유 사용자 스케치 생성: {len(merged):,}개")
+
+
+def backfill(conn, since: str = None, until: str = None):
+    """지정 기간의 UI 통계 집계를 재계산"""
+    cursor = conn.cursor()
+    for create_sql in (CREATE_UI_PAGE_VISIT_HOURLY_TABLE_SQL,
+                       CREATE_UI_API_CALL_HOURLY_TABLE_SQL,
+                       CREATE_UI_VISITOR_HLL_TABLE_SQL):
+        cursor.execute(create_sql)
+
+    rebuild_counts(cursor, since, until)
+    rebuild_day_sketches(conn, since, until)
+    rebuild_period_sketches(conn)
+
+    conn.commit()
+
+    cursor.execute("""
+        SELECT MIN(hour), MAX(hour), SUM(visit_count)
+        FROM ui_page_visit_hourly
+    """)
+    first_hour, last_hour, total_visits = cursor.fetchone()
+    cursor.execute("SELECT sketch FROM ui_visitor_hll WHERE period_type = 'all' AND period_key = 'all'")
+    row = cursor.fetchone()
+    unique_users = HyperLogLog.from_bytes(row[0]).count() if row else 0
+    logger.info(f"  방문 {int(total_visits or 0):,}건 ({first_hour} ~ {last_hour}), 고유 사용자 약 {unique_users:,}명")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='UI 통계 집계 백필')
+    parser.add_argument('--since', help='재계산 시작 날짜 (YYYY-MM-DD, 포함)')
+    parser.add_argument('--until', help='재계산 종료 날짜 (YYYY-MM-DD, 포함)')
+    args = parser.parse_args()
+
+    conn = None
+    try:
+        logger.info("🔌 데이터베이스 연결 중...")
+        conn = pymysql.connect(**MYSQL_CONFIG)
+        logger.info("✅ 데이터베이스 연결 성공")
+
+        backfill(conn, args.since, args.until)
+
+        logger.info("🎉 UI 통계 집계 백필 완료!")
+
+    except Exception as e:
+        logger.error(f"❌ 백필 실패: {e}")
+        if conn:
+            conn.rollback()
+            logger.info("🔄 변경사항 롤백 완료")
+    finally:
+        if conn:
+            conn.close()
+            logger.info("🔌 데이터베이스 연결 해제")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+대시보드 캐시 무효화 이벤트 발행
+
+새 검사 결과나 동기화 데이터가 저장되면 해당 데이터 소스(네임스페이스)의
+대시보드 캐시를 비우도록 Redis pub/sub 채널에 이벤트를 발행합니다.
+백엔드(backend/services/cache/invalidation.py)가 채널을 구독하여
+해당 네임스페이스(또는 태그)에 등록된 캐시 키를 삭제하므로, 캐시 TTL 을 길게 유지해도
+새 데이터가 바로 반영됩니다.
+
+redis 패키지가 없거나 Redis 에 연결할 수 없으면 발행을 건너뜁니다.
+(이 경우 캐시는 TTL 만료 시 갱신됩니다)
+
+이벤트 형식:
+    {"namespace": "tc", "endpoints": null, "source": "mqtt", "reference": "tc_inspection_...", "timestamp": "..."}
+    {"namespace": null, "tags": ["source:tc", "date:2024-01-31"], "source": "...", ...}
+
+태그 규칙은 backend/services/cache/cache_tags.py 참고 (ns:, ep:, source:, date:)
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+try:
+    import redis
+except ImportError:  # redis 미설치 환경에서는 무효화 없이 동작
+    redis = None
+
+from data_inspection_service import resolve_data_source
+
+logger = logging.getLogger(__name__)
+
+# backend/config/redis_config.py 의 설정과 동일하게 유지할 것
+REDIS_CONFIG = {
+    'host': os.getenv('REDIS_HOST', 'localhost'),
+    'port': int(os.getenv('REDIS_PORT', 6379)),
+    'db': int(os.getenv('REDIS_DB', 0)),
+    'password': os.getenv('REDIS_PASSWORD', 'PortDashboard2024!'),
+    'socket_timeout': 5,
+    'socket_connect_timeout': 5,
+}
+CACHE_INVALIDATION_CHANNEL = os.getenv('CACHE_INVALIDATION_CHANNEL', 'port_dashboard:cache_invalidation')
+
+
+def table_namespace(table_name: str) -> Optional[str]:
+    """원본 테이블명 → 캐시 네임스페이스 (데이터 소스 키와 동일)"""
+    return resolve_data_source('', table_name)
+
+
+class CacheInvalidationPublisher:
+    """캐시 무효화 이벤트 발행기 (연결은 첫 발행 시 생성)"""
+
+    def __init__(self, channel: str = CACHE_INVALIDATION_CHANNEL, **redis_config):
+        self.channel = channel
+        self.redis_config = {**REDIS_CONFIG, **redis_config}
+        self._client = None
+
+    def _get_client(self):
+        if redis is None:
+            return None
+        if self._client is None:
+            self._client = redis.Redis(**self.redis_config)
+        return self._client
+
+    def publish(self, namespaces: Iterable[str], source: str,
+                reference: Optional[str] = None, endpoints: Optional[List[str]] = None) -> int:
+        """
+        네임스페이스별 무효화 이벤트 발행
+
+        Args:
+            namespaces: 무효화할 캐시 네임스페이스 (데이터 소스 키)
+            source: 이벤트 발생 위치 (예: 'mqtt', 'api_sync')
+            reference: 관련 검사 ID / 동기화 ID (로그용)
+            endpoints: 특정 엔드포인트만 무효화할 때 (None 이면 네임스페이스 전체)
+
+        Returns:
+            발행한 이벤트 수
+        """
+        client = self._get_client()
+        if client is None:
+            return 0
+
+        published = 0
+        timestamp = datetime.now().isoformat()
+        for namespace in sorted({ns for ns in namespaces if ns}):
+            event = {
+                "namespace": namespace,
+                "endpoints": endpoints,
+                "source": source,
+                "reference": reference,
+                "timestamp": timestamp,
+            }
+            try:
+                client.publish(self.channel, json.dumps(event, ensure_ascii=False))
+                published += 1
+            except Exception as e:
+                # 발행 실패는 저장 결과에 영향을 주지 않음 (TTL 만료 시 갱신)
+                logger.warning(f"⚠️ 캐시 무효화 이벤트 발행 실패 ({namespace}): {e}")
+                break
+
+        if published:
+            logger.info(f"📣 캐시 무효화 이벤트 발행: {published}개 네임스페이스 ({source})")
+        return published
+
+    def publish_tags(self, tags: Iterable[str], source: str, reference: Optional[str] = None) -> bool:
+        """
+        태그 무효화 이벤트 발행 (예: ['source:tc', 'date:2024-01-31'])
+
+        Returns:
+            발행 여부
+        """
+        client = self._get_client()
+        tags = sorted({tag for tag in tags if tag})
+        if client is None or not tags:
+            return False
+
+        event = {
+            "namespace": None,
+            "tags": tags,
+            "source": source,
+            "reference": reference,
+            "timestamp": datetime.now().isoformat(),
+        }
+        try:
+            client.publish(self.channel, json.dumps(event, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 무효화 이벤트 발행 실패 ({tags}): {e}")
+            return False
+
+        logger.info(f"📣 캐시 태그 무효화 이벤트 발행: {tags} ({source})")
+        return True
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+# 전역 인스턴스
+cache_invalidation_publisher = CacheInvalidationPublisher()
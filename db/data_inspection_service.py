@@ -3,12 +3,150 @@
 데이터 검사 결과를 데이터베이스에 저장하고 조회하는 서비스
 """
 
+import os
+import sys
 import pymysql
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from database_config import MYSQL_CONFIG
 
+# 데이터 소스 키 결정 규칙은 backend/services/data_sources.py 한 곳에서 관리
+# (typing 외 의존성이 없는 모듈이므로 backend 패키지 초기화 없이 직접 import)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend', 'services'))
+from data_sources import TABLE_DATA_SOURCES, INSPECTION_ID_PATTERNS, UNKNOWN_DATA_SOURCE, resolve_data_source  # noqa: E402,F401
+
+
+# 일별 품질 집계 증분 반영 (검사 결과와 같은 트랜잭션에서 실행)
+UPSERT_DAILY_ROLLUP_SQL = """
+INSERT INTO quality_daily_rollup (
+    data_source, check_type, day, total_checks, pass_count, fail_count, inspection_count
+) VALUES (%s, %s, CURDATE(), %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    total_checks = total_checks + VALUES(total_checks),
+    pass_count = pass_count + VALUES(pass_count),
+    fail_count = fail_count + VALUES(fail_count),
+    inspection_count = inspection_count + VALUES(inspection_count)
+"""
+
+
+def build_daily_rollup_rows(data_source: Optional[str], results: List[Dict[str, Any]],
+                            existing_check_types=()) -> List[tuple]:
+    """검사 결과 목록을 check_type 별 (data_source, check_type, total, pass, fail, 검사 수) 로 집계
+    
+    같은 검사의 결과가 나뉘어 저장되거나 재전송될 수 있으므로, 이미 저장된 check_type
+    (existing_check_types) 은 검사 수를 다시 세지 않습니다.
+    """
+    counts: Dict[str, List[int]] = {}
+    for result in results:
+        total_pass_fail = counts.setdefault(result['check_type'], [0, 0, 0])
+        total_pass_fail[0] += 1
+        if result['status'] == 'PASS':
+            total_pass_fail[1] += 1
+        elif result['status'] == 'FAIL':
+            total_pass_fail[2] += 1
+    
+    return [
+        (data_source or UNKNOWN_DATA_SOURCE, check_type, total, passed, failed, 0 if check_type in existing_check_types else 1)
+        for check_type, (total, passed, failed) in counts.items()
+    ]
+
+
+# 필드별 검사 통계 증분 반영 (검사 × 필드 × check_type 한 행)
+UPSERT_FIELD_STATS_SQL = """
+INSERT INTO field_quality_stats (
+    inspection_id, data_source, field_name, check_type,
+    total_rows, pass_count, fail_count, error_count, last_message, created_at
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()))
+ON DUPLICATE KEY UPDATE
+    pass_count = pass_count + VALUES(pass_count),
+    fail_count = fail_count + VALUES(fail_count),
+    error_count = GREATEST(error_count, VALUES(error_count)),
+    last_message = VALUES(last_message)
+"""
+
+# 검사 메시지의 [필드명]
+FIELD_NAME_PATTERN = re.compile(r'\[([^\]]+)\]')
+
+
+def _as_int(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_field_result(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """검사 결과 한 건에서 필드명과 건수(total/check/오류 수)를 추출
+    
+    메시지에 [필드명] 이 없는 결과는 필드 단위 결과가 아니므로 None 을 반환합니다.
+    """
+    details = result.get('details') or {}
+    if isinstance(details, str):
+        try:
+            details = json.loads(details)
+        except ValueError:
+            return None
+    if not isinstance(details, dict):
+        return None
+    
+    message = details.get('message') or ''
+    match = FIELD_NAME_PATTERN.search(message)
+    if not match:
+        return None
+    
+    field_name = match.group(1)
+    check_count = _as_int(details.get('check'))
+    
+    error_count = 0
+    if result['status'] != 'PASS':
+        # 유효성-그리드 검사는 affected_rows 에 바다(정상) 개수, check 에 육지(오류) 개수가 들어 있음
+        if '유효성-그리드' in field_name or 'grid' in field_name.lower():
+            error_count = check_count
+        else:
+            error_count = _as_int(result.get('affected_rows'))
+    
+    return {
+        'field_name': field_name[:200],
+        'total': _as_int(details.get('total')),
+        'error_count': error_count,
+        'message': message,
+    }
+
+
+def build_field_stats_rows(inspection_id: str, data_source: Optional[str],
+                           results: List[Dict[str, Any]], created_at=None) -> List[tuple]:
+    """검사 결과 목록을 (필드명, check_type) 별 field_quality_stats 업서트 행으로 집계"""
+    stats: Dict[tuple, Dict[str, Any]] = {}
+    for result in results:
+        parsed = parse_field_result(result)
+        if parsed is None:
+            continue
+        
+        key = (parsed['field_name'], result['check_type'])
+        entry = stats.get(key)
+        if entry is None:
+            entry = stats[key] = {
+                'total': parsed['total'],
+                'pass_count': 0,
+                'fail_count': 0,
+                'error_count': 0,
+            }
+        if result['status'] == 'PASS':
+            entry['pass_count'] += 1
+        else:
+            entry['fail_count'] += 1
+            entry['error_count'] = max(entry['error_count'], parsed['error_count'])
+        entry['message'] = parsed['message']
+    
+    return [
+        (inspection_id, data_source or UNKNOWN_DATA_SOURCE, field_name, check_type,
+         entry['total'], entry['pass_count'], entry['fail_count'], entry['error_count'],
+         entry['message'], created_at)
+        for (field_name, check_type), entry in stats.items()
+    ]
+
 class DataInspectionService:
     """데이터 검사 결과 관리 서비스"""
     
@@ -77,25 +215,56 @@ class DataInspectionService:
             print(f"❌ 검사 정보 저장 실패: {e}")
             return False
     
-    def save_inspection_results(self, inspection_id: str, results: List[Dict[str, Any]]) -> bool:
-        """검사 결과 상세 저장"""
+    def save_inspection_results(self, inspection_id: str, results: List[Dict[str, Any]],
+                                table_name: Optional[str] = None,
+                                data_source: Optional[str] = None) -> Optional[str]:
+        """검사 결과 상세 저장
+        
+        한 검사의 결과 목록을 한 번에 넘기면 데이터 소스 결정/기존 check_type 조회/커밋이
+        검사당 한 번만 일어납니다. data_source/table_name 이 주어지지 않으면
+        data_inspection_info 에서 찾아 resolve_data_source() 로 결정합니다.
+        
+        Returns:
+            저장한 결과의 데이터 소스 키 (캐시 무효화 이벤트용).
+            저장에 실패했거나 데이터 소스를 결정하지 못하면(UNKNOWN_DATA_SOURCE 로 저장) None
+        """
         try:
             connection = self.connect()
             if not connection:
-                return False
+                return None
             
             cursor = connection.cursor()
             
+            if table_name is None:
+                cursor.execute(
+                    "SELECT table_name FROM data_inspection_info WHERE inspection_id = %s",
+                    (inspection_id,)
+                )
+                info = cursor.fetchone()
+                if info:
+                    table_name = info[0]
+            if data_source is None:
+                data_source = resolve_data_source(inspection_id, table_name)
+            
+            # 이 검사에서 이미 저장된 check_type (일별 집계의 검사 수 중복 방지)
+            cursor.execute(
+                "SELECT DISTINCT check_type FROM data_inspection_results WHERE inspection_id = %s",
+                (inspection_id,)
+            )
+            existing_check_types = {row[0] for row in cursor.fetchall()}
+            
             sql = """
             INSERT INTO data_inspection_results (
-                inspection_id, check_type, check_name, message, status, severity,
+                inspection_id, data_source, table_name, check_type, check_name, message, status, severity,
                 affected_rows, affected_columns, details
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             
             for result in results:
                 values = (
                     inspection_id,
+                    data_source,
+                    table_name,
                     result['check_type'],
                     result['check_name'],
                     result['message'],
@@ -108,15 +277,25 @@ class DataInspectionService:
                 
                 cursor.execute(sql, values)
             
+            # 히스토리 조회용 일별 집계 갱신
+            rollup_rows = build_daily_rollup_rows(data_source, results, existing_check_types)
+            if rollup_rows:
+                cursor.executemany(UPSERT_DAILY_ROLLUP_SQL, rollup_rows)
+            
+            # 필드별 분석용 통계 갱신 (조회 시 details JSON 파싱 불필요)
+            field_rows = build_field_stats_rows(inspection_id, data_source, results)
+            if field_rows:
+                cursor.executemany(UPSERT_FIELD_STATS_SQL, field_rows)
+            
             connection.commit()
             connection.close()
             
             print(f"✅ 검사 결과 저장 완료: {len(results)}개")
-            return True
+            return data_source or None
             
         except Exception as e:
             print(f"❌ 검사 결과 저장 실패: {e}")
-            return False
+            return None
     
     def save_inspection_summary(self, inspection_id: str, summary_data: Dict[str, Any]) -> bool:
         """검사 요약 저장"""
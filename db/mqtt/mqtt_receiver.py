@@ -39,8 +39,9 @@ except Exception:
 # 상위 디렉토리의 서비스 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from data_inspection_service import DataInspectionService
+from data_inspection_service import DataInspectionService, resolve_data_source
 from api_data_service import APIDataService
+from cache_invalidation import cache_invalidation_publisher
 
 class MQTTInspectionReceiver:
     """
@@ -206,18 +207,26 @@ class MQTTInspectionReceiver:
                 self.inspection_service.save_inspection_info(data['inspection_info'])
                 self.logger.info(f"검사 정보 저장 완료: {inspection_id}")
             
-            # 2. 개별 검사 결과 저장 (각 결과를 개별적으로 저장)
+            # 2. 개별 검사 결과 저장 (검사 단위로 한 번에 저장)
             if 'inspection_results' in data:
-                for result in data['inspection_results']:
-                    self.inspection_service.save_inspection_results(inspection_id, [result])
-                self.logger.info(f"검사 결과 저장 완료: {inspection_id}")
+                # 데이터 소스는 메시지의 검사 정보로 한 번만 결정 (없으면 저장 시 DB 에서 한 번 조회)
+                table_name = data.get('inspection_info', {}).get('table_name')
+                data_source = resolve_data_source(inspection_id, table_name) if table_name else None
+                data_source = self.inspection_service.save_inspection_results(
+                    inspection_id, data['inspection_results'], table_name=table_name, data_source=data_source
+                )
+                self.logger.info(f"검사 결과 저장 완료: {inspection_id} ({data_source})")
             
             # 3. 검사 요약 정보 저장
             if 'inspection_summary' in data:
                 self.inspection_service.save_inspection_summary(inspection_id, data['inspection_summary'])
                 self.logger.info(f"검사 요약 저장 완료: {inspection_id}")
             
-            # 4. 성공 응답 메시지 발행
+            # 4. 해당 데이터 소스의 대시보드 캐시 무효화 (메시지당 한 번, 저장 시 결정된 데이터 소스 기준)
+            if 'inspection_results' in data:
+                cache_invalidation_publisher.publish([data_source], source="mqtt", reference=inspection_id)
+            
+            # 5. 성공 응답 메시지 발행
             response = {
                 "status": "success",
                 "inspection_id": inspection_id,
@@ -236,7 +245,7 @@ class MQTTInspectionReceiver:
             # 오류 발생 시 로그 기록
             self.logger.error(f"검사 결과 처리 실패: {e}")
             
-            # 5. 오류 응답 메시지 발행
+            # 6. 오류 응답 메시지 발행
             error_response = {
                 "status": "error",
                 "inspection_id": data.get('inspection_id'),
@@ -11,6 +11,7 @@ from typing import Dict, Any
 
 from data_inspection_service import DataInspectionService
 from api_data_service import APIDataService
+from cache_invalidation import cache_invalidation_publisher
 
 class MQTTInspectionReceiver:
     """MQTT를 통한 검사 결과 수신 서비스"""
@@ -99,9 +100,10 @@ class MQTTInspectionReceiver:
             
             # 2. 검사 결과 저장
             if 'inspection_results' in data:
-                for result in data['inspection_results']:
-                    self.inspection_service.save_inspection_results(inspection_id, [result])
-                self.logger.info(f"검사 결과 저장 완료: {inspection_id}")
+                data_source = self.inspection_service.save_inspection_results(inspection_id, data['inspection_results'])
+                self.logger.info(f"검사 결과 저장 완료: {inspection_id} ({data_source})")
+                # 해당 데이터 소스의 대시보드 캐시 무효화
+                cache_invalidation_publisher.publish([data_source], source="mqtt", reference=inspection_id)
             
             # 3. 검사 요약 저장
             if 'inspection_summary' in data:
@@ -22,6 +22,10 @@ from endpoint_mapper import endpoint_mapper
 from data_transformer import data_transformer
 from db_sync_manager import DBSyncManager
 
+# db/ 디렉토리의 캐시 무효화 발행기
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from cache_invalidation import cache_invalidation_publisher, table_namespace
+
 logger = logging.getLogger(__name__)
 
 class APISyncService:
@@ -44,6 +48,7 @@ class APISyncService:
         # 서비스 상태
         self.is_running = False
         self.current_sync_id = None
+        self.synced_tables = set()  # 이번 동기화에서 데이터가 저장된 테이블
         self.sync_stats = {
             "total_endpoints": 0,
             "successful_syncs": 0,
@@ -108,6 +113,7 @@ class APISyncService:
             
             # 서비스 상태 초기화
             self.is_running = True
+            self.synced_tables = set()
             self.sync_stats = {
                 "total_endpoints": len(target_endpoints),
                 "successful_syncs": 0,
@@ -134,6 +140,12 @@ class APISyncService:
                         logger.error(f"❌ 엔드포인트 동기화 실패 ({endpoint_name}): {e}")
                         self.sync_stats["failed_syncs"] += 1
             
+            # 데이터가 바뀐 테이블의 대시보드 캐시 무효화
+            cache_invalidation_publisher.publish(
+                [table_namespace(table) for table in self.synced_tables],
+                source="api_sync", reference=self.current_sync_id
+            )
+            
             # 동기화 완료
             self.is_running = False
             self.sync_stats["end_time"] = datetime.now().isoformat()
@@ -190,6 +202,7 @@ class APISyncService:
             
             # 4. 통계 업데이트
             self.sync_stats["total_records"] += transformed_data["count"]
+            self.synced_tables.add(table_name)
             
             logger.info(f"✅ {endpoint_name} 엔드포인트 동기화 완료: {transformed_data['count']}개 레코드")
             return True
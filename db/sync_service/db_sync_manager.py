@@ -11,6 +11,12 @@ import pymysql
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
+import sys
+import os
+
+# db/ 디렉토리의 선박별 최신 위치 갱신
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from ais_latest_position import CREATE_AIS_LATEST_POSITION_TABLE_SQL, upsert_latest_positions
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,7 @@ class DBSyncManager:
         self.charset = charset
         self.autocommit = autocommit
         self.connection = None
+        self.latest_position_table_ready = False
         
         # 업데이트된 테이블 목록 (28개)
         self.all_tables = [
@@ -55,11 +62,27 @@ class DBSyncManager:
                 autocommit=self.autocommit
             )
             logger.info(f"✅ DB 연결 성공: {self.host}:{self.port}/{self.database}")
+            self._ensure_latest_position_table()
             return True
         except Exception as e:
             logger.error(f"❌ DB 연결 실패: {e}")
             return False
     
+    def _ensure_latest_position_table(self):
+        """
+        선박별 최신 위치 테이블 생성 (연결 시 한 번)
+        
+        DDL 은 MySQL 에서 암묵적으로 커밋하므로 ais_info 저장 트랜잭션 안에서 실행하지 않습니다.
+        """
+        if self.latest_position_table_ready:
+            return
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(CREATE_AIS_LATEST_POSITION_TABLE_SQL)
+            self.latest_position_table_ready = True
+        except Exception as e:
+            logger.warning(f"⚠️ ais_latest_position 테이블 확인 실패 (add_tables.py 로 생성 필요): {e}")
+    
     def disconnect(self):
         """DB 연결 해제"""
         if self.connection:
@@ -666,6 +689,8 @@ class DBSyncManager:
             # 배치 삽입
             with self.connection.cursor() as cursor:
                 cursor.executemany(query, values)
+                if table_name == "ais_info":
+                    self._update_latest_positions(cursor, data)
                 self.connection.commit()
                 
             logger.info(f"✅ {table_name} 테이블에 {len(data)}개 행 삽입/업데이트 완료")
@@ -675,6 +700,14 @@ class DBSyncManager:
             logger.error(f"❌ 데이터 삽입 실패 ({table_name}): {e}")
             return False
     
+    def _update_latest_positions(self, cursor, data: List[Dict[str, Any]]):
+        """선박별 최신 위치 테이블 갱신 (실패해도 ais_info 저장은 유지)"""
+        try:
+            count = upsert_latest_positions(cursor, data)
+            logger.info(f"📍 ais_latest_position 선박 {count}척 갱신")
+        except Exception as e:
+            logger.warning(f"⚠️ 선박별 최신 위치 갱신 실패: {e}")
+    
     def update_data(self, table_name: str, data: Dict[str, Any], 
                    where_conditions: Dict[str, Any]) -> bool:
         """
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AIS 가공 데이터 일괄 계산(ais_processed_frame) 비교 검증 스크립트
+
+같은 입력 행을 AISProcessedInfo(행마다 객체 생성)와 compute_processed_columns(DataFrame 일괄 계산)로
+각각 계산해 가공 컬럼 12개가 같은지 확인합니다. DB 없이 실행됩니다.
+
+사용법:
+    cd db && python test_ais_processed_frame.py
+"""
+
+import math
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from ais_value_object import AISProcessedInfo
+from ais_processed_frame import (
+    PROCESSED_COLUMNS, TABLE_COLUMN_NAMES,
+    ais_info_frame, compute_processed_columns, enrich_ais_frame, processed_info_records
+)
+
+# distance_from_port 허용 오차 (NumPy/math 삼각함수 마지막 자리 차이)
+DISTANCE_REL_TOL = 1e-9
+
+
+def random_rows(count: int, seed: int = 7) -> list:
+    """경계값/빈 값/잘못된 문자열을 섞은 AIS 입력 행 (NaN 은 제외, test_nan_as_missing 참고)"""
+    rng = random.Random(seed)
+
+    def pick(*options):
+        return rng.choice(options)
+
+    return [
+        dict(
+            lon=pick(None, 0, 0.0, "", "abc", "129.05", 129.0,
+                     rng.uniform(128.5, 129.6), rng.uniform(-180, 180)),
+            lat=pick(None, 0, "", 35.1, rng.uniform(34.6, 35.6), rng.uniform(-90, 90)),
+            sog=pick(None, 0, 0.0, -1.0, 5, 5.0, 10, 10.01, 15, 15.01, "12.5", "x", rng.uniform(0, 30)),
+            cog=pick(None, 0, 22.5, 67.5, 337.5, 359.99, 360, 400, -10, "180", rng.uniform(0, 360)),
+            vssl_len=pick(None, 0, "", 99.99, 100, 200, -5, "150", rng.uniform(0, 400)),
+            vssl_tp=pick(None, "", "General Cargo", "oil tanker", "Container Ship", "Fishing", "cargo tanker"),
+            vssl_navi=pick(None, "", "MOORED", "moored", "UNDER_WAY"),
+            dt_pos_utc=pick(None, "", "20240101", "202401010", "2024010105", "20240101ab3000",
+                            "20240101" + f"{rng.randrange(24):02d}" + "3000"),
+        )
+        for _ in range(count)
+    ]
+
+
+def _same_value(column: str, expected, actual) -> bool:
+    if column == "distance_from_port" and expected is not None and actual is not None:
+        if math.isnan(expected) or math.isnan(actual):
+            return math.isnan(expected) and math.isnan(actual)
+        return math.isclose(expected, actual, rel_tol=DISTANCE_REL_TOL)
+    if isinstance(expected, bool):
+        return bool(actual) == expected
+    return expected == actual and type(expected) == type(actual)
+
+
+def compare(rows: list, frame: pd.DataFrame) -> int:
+    """AISProcessedInfo 결과와 일괄 계산 결과 비교, 다른 값 수 반환 (처음 몇 건 출력)"""
+    expected = [AISProcessedInfo(**row).get_processed_info() for row in rows]
+    actual = processed_info_records(compute_processed_columns(frame))
+
+    mismatches = 0
+    for row, exp, act in zip(rows, expected, actual):
+        for column in PROCESSED_COLUMNS:
+            if not _same_value(column, exp[column], act[column]):
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"   ❌ {column}: 객체 {exp[column]!r} / 일괄 {act[column]!r} - 입력 {row}")
+    return mismatches
+
+
+def test_matches_per_object() -> bool:
+    """AISInfo 이름 컬럼: 객체 계산과 같은 결과"""
+    print("🔍 객체 계산 비교 (AISInfo 컬럼명)...")
+    rows = random_rows(20000)
+    mismatches = compare(rows, pd.DataFrame.from_records(rows))
+    print(f"   {len(rows)}행 x {len(PROCESSED_COLUMNS)}컬럼, 불일치 {mismatches}건")
+    return mismatches == 0
+
+
+def test_table_column_names() -> bool:
+    """ais_info 테이블 컬럼명(vsslLen ...) 과 AISInfo 객체 목록 입력도 같은 결과"""
+    print("🔍 테이블 컬럼명 / AISInfo 객체 입력 비교...")
+    rows = random_rows(2000, seed=11)
+    frame = pd.DataFrame.from_records(rows)
+    table_frame = frame.rename(columns=TABLE_COLUMN_NAMES)
+
+    expected = processed_info_records(compute_processed_columns(frame))
+    same_table = processed_info_records(compute_processed_columns(table_frame)) == expected
+    objects = [AISProcessedInfo(**row) for row in rows]
+    same_objects = compare(rows, ais_info_frame(objects)) == 0
+    enriched = enrich_ais_frame(table_frame)
+    same_enriched = list(enriched.columns) == list(table_frame.columns) + PROCESSED_COLUMNS
+
+    print(f"   테이블 컬럼명: {same_table}, AISInfo 객체: {same_objects}, enrich 컬럼: {same_enriched}")
+    return same_table and same_objects and same_enriched
+
+
+def test_nan_as_missing() -> bool:
+    """
+    숫자 컬럼 NaN 은 None 과 같게 처리 (모듈 docstring 의 '다른 점')
+
+    AISProcessedInfo 는 NaN 을 참으로 보아 원양/고속/대형/NW 가 되므로 None 입력의 객체 계산과 비교합니다.
+    """
+    print("🔍 NaN 입력 = 값 없음 확인...")
+    base = dict(lon=129.05, lat=35.15, sog=12.0, cog=90.0, vssl_len=150.0,
+                vssl_tp="Cargo", vssl_navi="UNDER_WAY", dt_pos_utc="20240101093000")
+    passed = True
+    for column in ("lon", "lat", "sog", "cog", "vssl_len"):
+        # 일괄 계산(NaN 입력) == 객체 계산(None 입력)
+        same = compare([{**base, column: None}], pd.DataFrame.from_records([{**base, column: np.nan}])) == 0
+        print(f"   {'✅' if same else '❌'} {column}=NaN → None 과 같은 결과")
+        passed = passed and same
+    return passed
+
+
+def test_performance():
+    """참고용 처리 시간 (하루치 규모 DataFrame vs 객체 계산)"""
+    print("⏱️ 처리 시간...")
+    count = 200_000
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "lon": rng.uniform(125, 132, count), "lat": rng.uniform(32, 38, count),
+        "sog": rng.uniform(0, 25, count), "cog": rng.uniform(0, 360, count),
+        "vsslLen": rng.uniform(10, 350, count),
+        "vsslTp": rng.choice(["Cargo", "Tanker", "Container", "Fishing"], count),
+        "vsslNavi": rng.choice(["MOORED", "UNDER_WAY"], count),
+        "dt_pos_utc": rng.choice([f"20240101{hour:02d}0000" for hour in range(24)], count),
+    })
+    started = time.perf_counter()
+    compute_processed_columns(frame)
+    frame_seconds = time.perf_counter() - started
+
+    records = frame.head(20_000).rename(columns={v: k for k, v in TABLE_COLUMN_NAMES.items()}).to_dict("records")
+    started = time.perf_counter()
+    for record in records:
+        AISProcessedInfo(**record).get_processed_info()
+    object_seconds = (time.perf_counter() - started) * count / len(records)
+
+    print(f"   {count}행 일괄 계산 {frame_seconds:.3f}s, 객체 계산 추정 {object_seconds:.3f}s")
+
+
+def main():
+    """메인 함수"""
+    print("🚀 AIS 가공 데이터 일괄 계산 비교 검증")
+    print("=" * 50)
+
+    test_results = [
+        ("객체 계산 비교", test_matches_per_object()),
+        ("테이블 컬럼명 / 객체 입력", test_table_column_names()),
+        ("NaN = 값 없음", test_nan_as_missing()),
+    ]
+    test_performance()
+
+    print("\n" + "=" * 50)
+    success_count = sum(1 for _, result in test_results if result)
+    for test_name, result in test_results:
+        print(f"{test_name}: {'✅ 성공' if result else '❌ 실패'}")
+    print(f"\n🎯 전체 테스트 결과: {success_count}/{len(test_results)} 성공")
+
+    if success_count != len(test_results):
+        sys.exit(1)
+    print("🎉 모든 테스트가 성공했습니다!")
+
+
+if __name__ == "__main__":
+    main()